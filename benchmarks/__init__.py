@@ -0,0 +1 @@
+"""Benchmarks de carga da API."""
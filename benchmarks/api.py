@@ -0,0 +1,245 @@
+"""Benchmark de carga das rotas da API que consultam o banco de dados.
+
+Efetua login e dispara requisições concorrentes às rotas por um tempo fixo,
+reportando a vazão (requisições/s) e as latências p50/p95/p99 por rota. Para
+comparar antes e depois de uma mudança, execute com a API no ar em cada versão,
+salvando o primeiro resultado com `--saida` e comparando com `--comparar`:
+
+    python benchmarks/api.py --login admin --senha ... --saida antes.json
+    python benchmarks/api.py --login admin --senha ... --comparar antes.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from itertools import cycle
+from os import environ
+from pathlib import Path
+from statistics import quantiles
+from time import monotonic, perf_counter
+from typing import TypedDict
+
+from aiohttp import ClientSession, CookieJar
+from tqdm import tqdm
+
+# Rotas GET exercitadas pelo benchmark (todas consultam o banco)
+ROTAS = (
+    "/executions",
+    "/systems",
+    "/linechart_system",
+    "/linechart_bot",
+)
+
+# Clientes simultâneos padrão
+CONCORRENCIA = 50
+
+# Duração padrão (segundos) da medição
+DURACAO = 30.0
+
+
+class Latencias(TypedDict):
+    """Defina o resumo das latências (segundos) de um conjunto de requisições.
+
+    Args:
+        requisicoes (int): Requisições concluídas com sucesso.
+        p50 (float): Mediana.
+        p95 (float): Percentil 95.
+        p99 (float): Percentil 99.
+
+    """
+
+    requisicoes: int
+    p50: float
+    p95: float
+    p99: float
+
+
+class Resultado(TypedDict):
+    """Defina o resultado de uma execução do benchmark.
+
+    Args:
+        concorrencia (int): Clientes simultâneos.
+        duracao (float): Duração efetiva da medição em segundos.
+        vazao (float): Requisições concluídas por segundo.
+        erros (int): Requisições com status de erro.
+        total (Latencias): Latências de todas as rotas.
+        rotas (dict[str, Latencias]): Latências por rota.
+
+    """
+
+    concorrencia: int
+    duracao: float
+    vazao: float
+    erros: int
+    total: Latencias
+    rotas: dict[str, Latencias]
+
+
+async def medir(
+    url: str,
+    login: str,
+    senha: str,
+    concorrencia: int = CONCORRENCIA,
+    duracao: float = DURACAO,
+    rotas: tuple[str, ...] = ROTAS,
+) -> Resultado:
+    """Meça a vazão e as latências da API sob carga concorrente.
+
+    Args:
+        url (str): URL base da API.
+        login (str): Login do usuário do benchmark.
+        senha (str): Senha do usuário.
+        concorrencia (int): Clientes simultâneos.
+        duracao (float): Duração da medição em segundos.
+        rotas (tuple[str, ...]): Rotas GET exercitadas.
+
+    Returns:
+        Resultado: Vazão e latências medidas.
+
+    """
+    latencias: dict[str, list[float]] = {rota: [] for rota in rotas}
+    erros = 0
+
+    # CookieJar(unsafe=True) mantém os cookies do JWT para hosts por IP
+    async with ClientSession(url, cookie_jar=CookieJar(unsafe=True)) as client:
+        async with client.post(
+            "/login",
+            json={"login": login, "password": senha},
+        ) as response:
+            response.raise_for_status()
+
+        limite = monotonic() + duracao
+
+        async def cliente(indice: int) -> None:
+            nonlocal erros
+            # Cada cliente começa em uma rota para distribuir a carga
+            deslocamento = indice % len(rotas)
+            sequencia = cycle(rotas[deslocamento:] + rotas[:deslocamento])
+            while monotonic() < limite:
+                rota = next(sequencia)
+                inicio = perf_counter()
+                async with client.get(rota) as response:
+                    await response.read()
+
+                if not response.ok:
+                    erros += 1
+                    continue
+
+                latencias[rota].append(perf_counter() - inicio)
+
+        inicio = monotonic()
+        await asyncio.gather(*(cliente(indice) for indice in range(concorrencia)))
+        decorrido = monotonic() - inicio
+
+    todas = [valor for valores in latencias.values() for valor in valores]
+    return Resultado(
+        concorrencia=concorrencia,
+        duracao=decorrido,
+        vazao=len(todas) / decorrido,
+        erros=erros,
+        total=_resumir(todas),
+        rotas={rota: _resumir(valores) for rota, valores in latencias.items()},
+    )
+
+
+def relatorio(resultado: Resultado, anterior: Resultado | None = None) -> str:
+    """Monte o relatório do resultado, comparando com a execução de referência.
+
+    Args:
+        resultado (Resultado): Resultado da execução atual.
+        anterior (Resultado | None): Resultado da execução de referência.
+
+    Returns:
+        str: Relatório em texto.
+
+    """
+    linhas = [
+        f"Clientes simultâneos: {resultado['concorrencia']}",
+        f"Duração: {resultado['duracao']:.1f}s | Erros: {resultado['erros']}",
+        "Vazão: {atual:.1f} req/s{delta}".format(
+            atual=resultado["vazao"],
+            delta=_delta(resultado["vazao"], anterior and anterior["vazao"]),
+        ),
+        "",
+        f"{'Rota':<20}{'Req.':>8}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}",
+    ]
+
+    rotas = {**resultado["rotas"], "total": resultado["total"]}
+    for rota, atual in rotas.items():
+        referencia = None
+        if anterior is not None:
+            referencia = anterior["rotas"].get(rota, anterior["total"])
+
+        p99 = _delta(atual["p99"], referencia and referencia["p99"])
+        linhas.append(
+            f"{rota:<20}{atual['requisicoes']:>8}"
+            f"{atual['p50'] * 1000:>12.1f}{atual['p95'] * 1000:>12.1f}"
+            f"{atual['p99'] * 1000:>12.1f}{p99}",
+        )
+
+    return "\n".join(linhas)
+
+
+def main() -> None:
+    """Execute o benchmark pela linha de comando."""
+    host = environ.get("API_HOST", "127.0.0.1")
+    port = environ.get("API_PORT", "5000")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=f"http://{host}:{port}")
+    parser.add_argument("--login", required=True)
+    parser.add_argument("--senha", required=True)
+    parser.add_argument("--concorrencia", type=int, default=CONCORRENCIA)
+    parser.add_argument("--duracao", type=float, default=DURACAO)
+    parser.add_argument("--rotas", nargs="+", default=ROTAS, help="Rotas GET")
+    parser.add_argument("--saida", type=Path, help="Salva o resultado em JSON")
+    parser.add_argument("--comparar", type=Path, help="Resultado de referência")
+    args = parser.parse_args()
+
+    resultado = asyncio.run(
+        medir(
+            args.url,
+            args.login,
+            args.senha,
+            args.concorrencia,
+            args.duracao,
+            tuple(args.rotas),
+        ),
+    )
+
+    anterior = None
+    if args.comparar:
+        anterior = json.loads(args.comparar.read_text(encoding="utf-8"))
+
+    tqdm.write(relatorio(resultado, anterior))
+    if args.saida:
+        args.saida.write_text(json.dumps(resultado, indent=2), encoding="utf-8")
+
+
+def _resumir(valores: list[float]) -> Latencias:
+    # quantiles exige ao menos dois valores
+    if len(valores) < 2:
+        valor = valores[0] if valores else 0.0
+        return Latencias(requisicoes=len(valores), p50=valor, p95=valor, p99=valor)
+
+    percentis = quantiles(valores, n=100, method="inclusive")
+    return Latencias(
+        requisicoes=len(valores),
+        p50=percentis[49],
+        p95=percentis[94],
+        p99=percentis[98],
+    )
+
+
+def _delta(atual: float, anterior: float | None) -> str:
+    # Variação percentual em relação à execução de referência
+    if not anterior:
+        return ""
+
+    return f" ({(atual - anterior) / anterior:+.0%})"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Utilitários complementares do Celery App do CrawJUD."""
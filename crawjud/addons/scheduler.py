@@ -0,0 +1,252 @@
+"""Scheduler do Celery Beat baseado nos agendamentos do banco de dados.
+
+Este módulo define o DatabaseScheduler, que:
+- carrega `ScheduleModel`/`CrontabModel` uma única vez e mantém um heap em
+  memória com o próximo horário de execução de cada agendamento;
+- detecta alterações pelo contador de versão no Redis, relendo a tabela
+  somente quando algum agendamento é criado, alterado ou removido;
+- acumula os `last_run_at` e grava em lote, em vez de um UPDATE por disparo.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import suppress
+from heapq import heapify, heappop, heappush
+from os import environ
+from time import monotonic
+from typing import TYPE_CHECKING, AnyStr
+
+from celery.beat import ScheduleEntry, Scheduler
+from celery.schedules import crontab
+from celery.utils.log import get_logger
+from sqlalchemy import bindparam, create_engine, select, update
+
+from crawjud.models.schedule import CrontabModel, ScheduleModel, schedule_version
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy.engine import Engine, Row
+
+logger = get_logger(__name__)
+
+# Intervalo (segundos) para gravar em lote os `last_run_at` pendentes
+FLUSH_INTERVAL = 30
+
+
+class DatabaseScheduler[T](Scheduler):
+    """Dispare os agendamentos cadastrados no banco de dados.
+
+    Args:
+        *args (T): Argumentos posicionais do `celery.beat.Scheduler`.
+        **kwargs (T): Argumentos nomeados do `celery.beat.Scheduler`.
+
+    """
+
+    Entry = ScheduleEntry
+
+    def __init__(self, *args: T, **kwargs: T) -> None:
+        """Inicialize o scheduler e a conexão dedicada com o banco de dados.
+
+        Args:
+            *args (T): Argumentos posicionais do `celery.beat.Scheduler`.
+            **kwargs (T): Argumentos nomeados do `celery.beat.Scheduler`.
+
+        """
+        self._entries: dict[str, ScheduleEntry] = {}
+        self._ids_agendamento: dict[str, int] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._pendentes: dict[int, datetime] = {}
+        self._ultimo_flush = monotonic()
+        self._versao: int | None = None
+        self._engine: Engine = create_engine(
+            environ.get("SQLALCHEMY_DATABASE_URI", "sqlite:///local.db"),
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
+        )
+        super().__init__(*args, **kwargs)
+
+    def setup_schedule(self) -> None:
+        """Carregue os agendamentos e monte o heap de próximas execuções."""
+        with suppress(Exception):
+            self._versao = schedule_version()
+
+        self._recarregar()
+
+    def get_schedule(self) -> dict[str, ScheduleEntry]:
+        """Retorne as entradas de agendamento carregadas em memória.
+
+        Returns:
+            dict[str, ScheduleEntry]: Entradas indexadas pela chave do agendamento.
+
+        """
+        return self._entries
+
+    def tick(self, *args: T, **kwargs: T) -> float:
+        """Dispare as entradas vencidas e retorne o tempo até a próxima.
+
+        Args:
+            *args (T): Ignorados; mantidos por compatibilidade com o Beat.
+            **kwargs (T): Ignorados; mantidos por compatibilidade com o Beat.
+
+        Returns:
+            float: Segundos até o próximo disparo, limitado por `max_interval`.
+
+        """
+        self._verificar_versao()
+
+        agora = monotonic()
+        while self._heap and self._heap[0][0] <= agora:
+            _, chave = heappop(self._heap)
+            entry = self._entries.get(chave)
+            if entry is None:
+                continue
+
+            is_due, proximo = entry.is_due()
+            if is_due:
+                self.apply_entry(entry, producer=self.producer)
+                entry = self._entries[chave] = next(entry)
+                self._registrar_execucao(chave, entry)
+                _, proximo = entry.is_due()
+
+            heappush(self._heap, (agora + proximo, chave))
+
+        if monotonic() - self._ultimo_flush >= FLUSH_INTERVAL:
+            self._gravar_execucoes()
+
+        if not self._heap:
+            return self.max_interval
+
+        return min(max(self._heap[0][0] - monotonic(), 0), self.max_interval)
+
+    def sync(self) -> None:
+        """Grave os `last_run_at` pendentes no banco de dados."""
+        self._gravar_execucoes()
+
+    def close(self) -> None:
+        """Grave as execuções pendentes e libere a conexão com o banco."""
+        super().close()
+        self._engine.dispose()
+
+    @property
+    def info(self) -> str:
+        """Resumo exibido pelo Beat na inicialização."""
+        return f"    . db -> {self._engine.url!r}"
+
+    def _verificar_versao(self) -> None:
+        # Consulta apenas o contador de versão no Redis; a tabela é relida
+        # somente quando algum agendamento foi alterado
+        versao = self._versao
+        with suppress(Exception):
+            versao = schedule_version()
+
+        if versao != self._versao:
+            logger.info("Agendamentos alterados (versão %s), recarregando", versao)
+            self._gravar_execucoes()
+            self._recarregar()
+            self._versao = versao
+
+    def _recarregar(self) -> None:
+        tabela = ScheduleModel.__table__
+        tabela_cron = CrontabModel.__table__
+        query = select(
+            tabela.c.id,
+            tabela.c.name,
+            tabela.c.task,
+            tabela.c.args,
+            tabela.c.kwargs,
+            tabela.c.last_run_at,
+            tabela_cron.c.minute,
+            tabela_cron.c.hour,
+            tabela_cron.c.day_of_week,
+            tabela_cron.c.day_of_month,
+            tabela_cron.c.month_of_year,
+        ).join(tabela_cron, tabela.c.schedule_id == tabela_cron.c.id)
+
+        with self._engine.connect() as conn:
+            rows = conn.execute(query).all()
+
+        entries: dict[str, ScheduleEntry] = {}
+        ids_agendamento: dict[str, int] = {}
+        for row in rows:
+            chave = f"{row.name}:{row.id}"
+            with suppress(ValueError):
+                entries[chave] = self._montar_entry(chave, row)
+                ids_agendamento[chave] = row.id
+
+        # Agendamentos estáticos definidos em `beat_schedule`
+        for nome, cfg in (self.app.conf.beat_schedule or {}).items():
+            entries[nome] = self.Entry(**dict(cfg, name=nome, app=self.app))
+
+        self._entries = entries
+        self._ids_agendamento = ids_agendamento
+
+        agora = monotonic()
+        self._heap = []
+        for chave, entry in entries.items():
+            # Entradas vencidas entram no topo do heap para disparo imediato
+            is_due, proximo = entry.is_due()
+            self._heap.append((agora if is_due else agora + proximo, chave))
+
+        heapify(self._heap)
+
+    def _montar_entry(self, chave: str, row: Row) -> ScheduleEntry:
+        return self.Entry(
+            name=chave,
+            task=row.task,
+            last_run_at=row.last_run_at,
+            schedule=crontab(
+                minute=row.minute,
+                hour=row.hour,
+                day_of_week=row.day_of_week,
+                day_of_month=row.day_of_month,
+                month_of_year=row.month_of_year,
+                app=self.app,
+            ),
+            args=_carregar_json(row.args, []),
+            kwargs=_carregar_json(row.kwargs, {}),
+            app=self.app,
+        )
+
+    def _registrar_execucao(self, chave: str, entry: ScheduleEntry) -> None:
+        id_agendamento = self._ids_agendamento.get(chave)
+        if id_agendamento is not None:
+            self._pendentes[id_agendamento] = entry.last_run_at
+
+    def _gravar_execucoes(self) -> None:
+        self._ultimo_flush = monotonic()
+        if not self._pendentes:
+            return
+
+        pendentes, self._pendentes = self._pendentes, {}
+        tabela = ScheduleModel.__table__
+        query = (
+            update(tabela)
+            .where(tabela.c.id == bindparam("_id"))
+            .values(last_run_at=bindparam("_last_run_at"))
+        )
+        params = [
+            {"_id": id_, "_last_run_at": last_run_at}
+            for id_, last_run_at in pendentes.items()
+        ]
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(query, params)
+
+        except Exception:
+            # Mantém os pendentes para a próxima tentativa de gravação
+            logger.exception("Erro ao gravar last_run_at dos agendamentos")
+            self._pendentes = {**pendentes, **self._pendentes}
+
+
+def _carregar_json[T](valor: AnyStr | None, padrao: T) -> T:
+    # Converte os args/kwargs salvos em JSON no banco
+    if not valor:
+        return padrao
+
+    try:
+        return json.loads(valor)
+    except json.JSONDecodeError:
+        return padrao
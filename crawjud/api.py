@@ -3,13 +3,14 @@
 import re
 from importlib import import_module
 from pathlib import Path
+from time import perf_counter
 
 import quart_flask_patch as quart_patch
 import socketio
 from dotenv import dotenv_values
 from flask_session import Session
 from flask_sqlalchemy import SQLAlchemy
-from quart import Quart
+from quart import Quart, Response, g, request
 from quart_cors import cors
 from quart_jwt_extended import JWTManager
 from quart_socketio import SocketIO
@@ -17,6 +18,7 @@ from quart_socketio.config.python_socketio import AsyncSocketIOConfig
 from tqdm import tqdm
 
 from crawjud.celery_app import make_celery
+from crawjud.utils.models.metricas import agendar_latencia
 from crawjud.utils.middleware import ProxyFixMiddleware as ProxyHeadersMiddleware
 
 
@@ -62,6 +64,7 @@ async def create_app() -> Quart:
     async with app.app_context():
         await init_extensions(app)
         await register_routes(app)
+        await register_metrics(app)
 
     app.asgi_app = ProxyHeadersMiddleware(app.asgi_app)
     return cors(
@@ -134,6 +137,35 @@ async def register_routes(app: Quart) -> None:
         app.register_blueprint(bp)
 
 
+async def register_metrics(app: Quart) -> None:
+    """Register the latency of every HTTP request in the metrics histograms.
+
+    Each endpoint becomes a series with system "api" and the HTTP method as
+    the step, so the p99 latency is available at `/metricas`.
+
+    Args:
+        app (Quart): The Quart application instance
+
+    """
+
+    @app.before_request
+    async def start_timer() -> None:
+        g.request_started = perf_counter()
+
+    @app.after_request
+    async def record_latency(response: Response) -> Response:
+        started = g.pop("request_started", None)
+        if started is not None and request.endpoint:
+            agendar_latencia(
+                "api",
+                request.endpoint,
+                request.method,
+                perf_counter() - started,
+            )
+
+        return response
+
+
 async def init_extensions(app: Quart) -> None:
     """Initialize and configure the application extensions.
 
@@ -147,6 +179,10 @@ async def init_extensions(app: Quart) -> None:
 
     app.extensions["celery"] = make_celery()
 
+    from crawjud.models.aio import dispose_async_engine
+
+    app.after_serving(dispose_async_engine)
+
     async with app.app_context():
         await database_start(app)
 
@@ -5,7 +5,6 @@ and PDF processing in compliance with Google/PEP 257 docstring standards.
 """
 
 import os
-import re
 import shutil
 import time
 import traceback
@@ -13,13 +12,13 @@ from contextlib import suppress
 from time import sleep
 from typing import Self
 
-from pypdf import PdfReader
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.master.bot_head import ClassBot
+from crawjud.utils.pdf_texto import PADRAO_CODIGO_BARRAS, buscar_padrao
 
 
 class OtherUtils: ...  # noqa: D101
@@ -80,8 +79,8 @@ class Emissor(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -92,6 +91,7 @@ class Emissor(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -140,7 +140,7 @@ class Emissor(ClassBot):
             self.make_doc()
             nameboleto = self.rename_pdf()
             data = self.get_val_doc_and_codebar(nameboleto)
-            self.append_success(data)
+            self.saida_sucesso(data)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -543,27 +543,10 @@ class Emissor(ClassBot):
         path_pdf = os.path.join(self.output_dir_path, pdf_name)
         # Inicialize uma lista para armazenar os números encontrados
         bar_code = ""
-        numeros_encontrados = []
 
-        # Expressão regular para encontrar números nesse formato
-        pattern = r"\b\d{5}\.\d{5}\s*\d{5}\.\d{6}\s*\d{5}\.\d{6}\s*\d\s*\d{14}\b"
-
-        pdf_file = path_pdf
-        read = PdfReader(pdf_file)
-
-        for page in read.pages:
-            text = page.extract_text()
-
-            with suppress(Exception):
-                # Use a expressão regular para encontrar números
-                numeros = re.findall(pattern, text)
-
-                # Adicione os números encontrados à lista
-                numeros_encontrados.extend(numeros)
-
-        # Imprima os números encontrados
-        for numero in numeros_encontrados:
-            numero = str(numero)
+        # Leitura interrompida na página em que o código de barras aparece
+        numero = buscar_padrao(path_pdf, PADRAO_CODIGO_BARRAS)
+        if numero:
             bar_code = numero.replace("  ", "").replace(" ", "").replace(".", " ")
 
         return [
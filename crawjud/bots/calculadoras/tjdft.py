@@ -80,8 +80,8 @@ class Tjdft(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -92,6 +92,7 @@ class Tjdft(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -724,7 +725,7 @@ class Tjdft(ClassBot):
 
             data = [self.bot_data.get("NUMERO_PROCESSO"), pdf_name, valor_doc]
 
-            self.append_success(data)
+            self.saida_sucesso(data)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
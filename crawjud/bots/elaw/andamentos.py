@@ -70,8 +70,8 @@ class Andamentos(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -82,6 +82,7 @@ class Andamentos(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -145,7 +146,7 @@ class Andamentos(ClassBot):
                 self.message = "Processo não encontrado!"
                 self.type_log = "error"
                 self.prt()
-                self.append_error([
+                self.saida_erro([
                     self.bot_data.get("NUMERO_PROCESSO"),
                     self.message,
                 ])
@@ -212,7 +213,8 @@ class Andamentos(ClassBot):
                 .replace("\n", "")
             )
 
-            self.interact.send_key(ocorrencia, text_andamento)
+            # Textarea sem máscara: texto longo definido por script
+            ocorrencia.send_keys(text_andamento, digitacao_rapida=True)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -244,7 +246,7 @@ class Andamentos(ClassBot):
                 .replace("\n", "")
             )
 
-            self.interact.send_key(observacao, text_andamento)
+            observacao.send_keys(text_andamento, digitacao_rapida=True)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -299,7 +301,7 @@ class Andamentos(ClassBot):
             if check_save:
                 sleep(3)
 
-                self.append_success(
+                self.saida_sucesso(
                     [self.numproc, "Andamento salvo com sucesso!", ""],
                     "Andamento salvo com sucesso!",
                 )
@@ -70,8 +70,8 @@ class ElawCadadastro(CadastroComplementar, PreCadastro):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -82,6 +82,7 @@ class ElawCadadastro(CadastroComplementar, PreCadastro):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -125,7 +126,7 @@ class ElawCadadastro(CadastroComplementar, PreCadastro):
             search = self.search_bot()
 
             if search is True:
-                self.append_success([
+                self.saida_sucesso([
                     bot_data.get("NUMERO_PROCESSO"),
                     "Processo já cadastrado!",
                     pid,
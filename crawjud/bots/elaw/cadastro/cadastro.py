@@ -1063,7 +1063,7 @@ class PreCadastro(ClassBot):
             Path(self.output_dir_path).resolve().joinpath(name_comprovante)
         )
         self.driver.get_screenshot_as_file(savecomprovante)
-        self.append_success([
+        self.saida_sucesso([
             self.bot_data.get("NUMERO_PROCESSO"),
             name_comprovante,
             self.pid,
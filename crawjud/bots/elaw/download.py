@@ -7,8 +7,6 @@ Classes:
     Download: Manages document downloads by extending the CrawJUD base class
 """
 
-import os
-import shutil
 import time
 import traceback
 from contextlib import suppress
@@ -21,6 +19,7 @@ from selenium.webdriver.support import expected_conditions as ec
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.master.bot_head import ClassBot
+from crawjud.utils.downloads import aguardar_download, enviar_ao_storage
 
 
 class Download(ClassBot):
@@ -76,8 +75,8 @@ class Download(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -88,6 +87,7 @@ class Download(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -136,7 +136,7 @@ class Download(ClassBot):
                 self.buscar_doc()
                 self.download_docs()
                 self.message = "Arquivos salvos com sucesso!"
-                self.append_success(
+                self.saida_sucesso(
                     [
                         self.bot_data.get("NUMERO_PROCESSO"),
                         self.message,
@@ -149,7 +149,7 @@ class Download(ClassBot):
                 self.message = "Processo não encontrado!"
                 self.type_log = "error"
                 self.prt()
-                self.append_error([
+                self.saida_erro([
                     self.bot_data.get("NUMERO_PROCESSO"),
                     self.message,
                 ])
@@ -232,45 +232,36 @@ class Download(ClassBot):
                         By.CSS_SELECTOR,
                         self.elements.botao_baixar,
                     )
+                    inicio = time.time()
                     baixar.click()
 
-                    self.rename_doc(get_name_file)
+                    self.rename_doc(get_name_file, inicio)
                     self.message = "Arquivo baixado com sucesso!"
                     self.type_log = "info"
                     self.prt()
 
-    def rename_doc(self, namefile: str) -> None:
-        """Rename the downloaded document.
+    def rename_doc(self, namefile: str, desde: float) -> None:
+        """Rename the downloaded document and send it to the storage.
 
         Args:
             namefile (str): The new name for the file.
+            desde (float): Time of the download click (`time.time()`).
 
         Raises:
             DocumentRenameError: If an error occurs during renaming.
 
         """
-        filedownloaded = False
-        while True:
-            for _, __, files in os.walk(os.path.join(self.output_dir_path)):
-                for file in files:
-                    if file.replace(" ", "") == namefile.replace(" ", ""):
-                        filedownloaded = True
-                        namefile = file
-                        break
-
-                if filedownloaded is True:
-                    break
-
-            old_file = os.path.join(self.output_dir_path, namefile)
-            if os.path.exists(old_file):
-                sleep(0.5)
-                break
-
-            sleep(0.01)
+        old_file = aguardar_download(
+            self.output_dir_path,
+            lambda file: file.replace(" ", "") == namefile.replace(" ", ""),
+            desde=desde,
+        )
+        if old_file is None:
+            raise ExecutionError(message="Arquivo não encontrado!")
 
+        namefile = old_file.name
         filename_replaced = f"{self.pid} - {namefile.replace(' ', '')}"
-        path_renamed = os.path.join(self.output_dir_path, filename_replaced)
-        shutil.move(old_file, path_renamed)
+        enviar_ao_storage(old_file, f"{self.pid}/{filename_replaced}", self.storage)
 
         if not self.list_docs:
             self.list_docs = filename_replaced
@@ -71,8 +71,8 @@ class Prazos(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -83,6 +83,7 @@ class Prazos(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -159,7 +160,7 @@ class Prazos(ClassBot):
 
                 self.message = "Pauta lançada!"
 
-            self.append_success([comprovante], self.message)
+            self.saida_sucesso([comprovante], self.message)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
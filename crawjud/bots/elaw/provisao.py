@@ -80,8 +80,8 @@ class Provisao(ClassBot):
         self.max_rows = len(frame)
         self.driver.maximize_window()
         self.driver.execute_script("document.body.style.zoom = '0.5'")
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -92,6 +92,7 @@ class Provisao(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -537,6 +538,7 @@ class Provisao(ClassBot):
             )
             informar_motivo.send_keys(
                 self.bot_data.get("OBSERVACAO", "Atualização de provisão"),
+                digitacao_rapida=True,
             )
             id_informar_motivo = informar_motivo.get_attribute("id")
             self.driver.execute_script(
@@ -581,7 +583,7 @@ class Provisao(ClassBot):
             comprovante,
             "Provisão atualizada com sucesso!",
         ]
-        self.append_success(data, message="Provisão atualizada com sucesso!")
+        self.saida_sucesso(data, message="Provisão atualizada com sucesso!")
 
     def print_comprovante(self) -> str:
         """Capture and save a screenshot as proof of the provision.
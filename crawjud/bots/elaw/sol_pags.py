@@ -80,8 +80,8 @@ class SolPags(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
         self.driver.maximize_window()
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = self.elaw_formats(value)
             if self.isStoped:
                 break
@@ -92,6 +92,7 @@ class SolPags(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -142,7 +143,8 @@ class SolPags(ClassBot):
                 pgto()
 
                 self.save_changes()
-                self.append_success(self.confirm_save())
+                comprovante = self.confirm_save()
+                self.saida_sucesso(comprovante)
 
             elif search is not True:
                 raise ExecutionError(message="Processo não encontrado!")
@@ -369,7 +371,7 @@ class SolPags(ClassBot):
 
             elif "\t" in desc_pagamento:
                 desc_pagamento = desc_pagamento.replace("\t", "")
-            desc_pgto.send_keys(desc_pagamento)
+            desc_pgto.send_keys(desc_pagamento, digitacao_rapida=True)
             sleep(0.5)
 
             self.driver.execute_script(
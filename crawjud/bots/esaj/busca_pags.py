@@ -84,8 +84,8 @@ class BuscaPags(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -96,6 +96,7 @@ class BuscaPags(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -251,7 +252,7 @@ class BuscaPags(ClassBot):
                                 parcelaguia,
                                 data_pagamento,
                             ]
-                            self.append_success()
+                            self.saida_sucesso()
                         elif not checkifclass == "":
                             continue
 
@@ -290,13 +291,13 @@ class BuscaPags(ClassBot):
                             parcelaguia,
                             data_pagamento,
                         ]
-                        self.append_success(data)
+                        self.saida_sucesso(data)
 
             elif "Lista de custas pagas" not in nomediv:
                 continue
 
             fileN = f"Total - {self.pid} - {self.datetimeNOW}.xlsx"  # noqa: N806
-            self.append_success(
+            self.saida_sucesso(
                 [self.bot_data.get("NUMERO_PROCESSO"), total],
                 fileN=fileN,
             )
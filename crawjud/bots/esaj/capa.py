@@ -7,12 +7,10 @@ ensuring detailed extraction and logging of information.
 import time
 import traceback
 from contextlib import suppress
-from typing import Self
-
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as ec
+from typing import ClassVar, Self
+from urllib.parse import urlencode
 
+from crawjud.bots.esaj.resources import schema_capa
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot as ClassBot
 
@@ -24,6 +22,12 @@ class Capa(ClassBot):
     and logging. It supports multiple process degrees.
     """
 
+    # Somente leitura; a consulta do eSAJ é HTML estático
+    perfil_navegador = "scrape"
+
+    # A capa do 1º grau é lida pela sessão HTTP do navegador (`obter_pagina`)
+    etapas_http: ClassVar[frozenset[str]] = frozenset({"capa"})
+
     @classmethod
     def initialize(cls, *args: str | int, **kwargs: str | int) -> Self:
         """Initialize a Capa instance with given parameters and settings.
@@ -52,6 +56,8 @@ class Capa(ClassBot):
         self.module_bot = __name__
 
         super().setup(*args, **kwargs)
+        # Navegador com o perfil declarado na classe
+        self.driver = self.criar_driver()
         super().auth_bot()
         self.start_time = time.perf_counter()
 
@@ -64,8 +70,8 @@ class Capa(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -76,6 +82,7 @@ class Capa(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -111,15 +118,13 @@ class Capa(ClassBot):
     def queue(self) -> None:
         """Queue capa tasks by searching for process data and appending details to logs.
 
-        Calls the search method and retrieves detailed process information.
+        In the first degree the capa comes straight from the search by number
+        over the HTTP session; process lists, incidents and the second degree
+        go through the browser search.
         """
         try:
-            search = self.search_bot()
-
-            if search is False:
-                raise ExecutionError(message="Processo não encontrado.")
-
-            self.append_success(self.get_process_informations())
+            capa = self._obter_capa()
+            self.saida_sucesso(self.get_process_informations(capa))
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -127,158 +132,88 @@ class Capa(ClassBot):
             self.logger.exception("".join(traceback.format_exception(e)))
             raise ExecutionError(e=e) from e
 
-    def get_process_informations(self) -> list:
-        """Extract and return detailed process information from the web elements.
+    def _obter_capa(self) -> schema_capa.Capa:
+        # 1º grau: consulta pelo número ("Outros") direto na sessão HTTP
+        capa = None
+        if self._get_grau() == 1:
+            url = "?".join((
+                self.elements.consultaproc_busca_grau1,
+                urlencode({
+                    "cbPesquisa": "NUMPROC",
+                    "dadosConsulta.tipoNuProcesso": "SAJ",
+                    "dadosConsulta.valorConsulta": self.bot_data.get(
+                        "NUMERO_PROCESSO",
+                    ),
+                }),
+            ))
+            capa = schema_capa.extrai_capa(self.obter_pagina("capa", url))
+
+        if capa is None:
+            search = self.search_bot()
+
+            if search is False:
+                raise ExecutionError(message="Processo não encontrado.")
+
+            capa = schema_capa.extrai_capa(self.driver.page_source)
+
+        if capa is None:
+            raise ExecutionError(message="Capa do processo não encontrada.")
+
+        return capa
+
+    def get_process_informations(self, capa: schema_capa.Capa) -> list:
+        """Format the process information extracted from the capa page.
+
+        Args:
+            capa (schema_capa.Capa): Data extracted from the capa page.
 
         Returns:
             list: A structured list containing process details such as area, forum, and value.
 
-        Note:
-            Extraction varies by process degree.
-
         """
-        # chk_advs = ["Advogada", "Advogado"]
-        # adv_polo_ativo = "Não consta"
-        # adv_polo_passivo = "Não consta"
-
         self.message = f"Extraindo informações do processo nº{self.bot_data.get('NUMERO_PROCESSO')}"
         self.type_log = "log"
         self.prt()
 
-        grau = self.bot_data.get("GRAU", 1)
-
-        if not grau:
-            grau = 1
-
-        elif isinstance(grau, str):
-            if "º" in grau:
-                grau = grau.replace("º", "")
-
-            grau = int(grau)
-
-        self.driver.execute_script("$('div#maisDetalhes').show()")
-
-        data = {"NUMERO_PROCESSO": ""}
-
-        sumary_1_esaj = self.wait.until(
-            ec.presence_of_all_elements_located((
-                By.CSS_SELECTOR,
-                self.elements.sumary_header_1,
-            )),
-        )
-
-        sumary_2_esaj = self.wait.until(
-            ec.presence_of_all_elements_located((
-                By.CSS_SELECTOR,
-                self.elements.sumary_header_2,
-            )),
-        )
-
-        list_sumary = [sumary_1_esaj, sumary_2_esaj]
-
-        for pos_, sumary in enumerate(list_sumary):
-            for pos, rows in enumerate(sumary):
-                subitems_sumary = rows.find_elements(
-                    By.CSS_SELECTOR,
-                    self.elements.rows_sumary_,
-                )
-
-                for item in subitems_sumary:
-                    if pos == 0 and pos_ == 0:
-                        num_proc = item.find_element(
-                            By.CLASS_NAME,
-                            self.elements.numproc,
-                        ).text
-                        status_proc = "Em Andamento"
-                        with suppress(NoSuchElementException):
-                            status_proc = item.find_element(
-                                By.CLASS_NAME,
-                                self.elements.statusproc,
-                            ).text
-
-                        data.update({
-                            "NUMERO_PROCESSO": num_proc,
-                            "STATUS": status_proc.upper(),
-                        })
-                        continue
-
-                    value = None
-                    title = item.find_element(
-                        By.CLASS_NAME,
-                        self.elements.nameitemsumary,
-                    ).text
-
-                    if title:
-                        title = title.upper()
-
-                    if " " in title:
-                        title = "_".join([ttl for ttl in title.split(" ") if ttl])
-
-                    with suppress(NoSuchElementException):
-                        value = item.find_element(
-                            By.CSS_SELECTOR,
-                            self.elements.valueitemsumary,
-                        ).text
-
-                    if not value:
-                        with suppress(NoSuchElementException):
-                            element_search = self.elements.value2_itemsumary.get(
-                                title,
-                            )
-
-                            if element_search:
-                                value = item.find_element(
-                                    By.CSS_SELECTOR,
-                                    element_search,
-                                ).text
-
-                                if title == "OUTROS_ASSUNTOS":
-                                    value = " ".join([
-                                        val for val in value.split(" ") if val
-                                    ])
-
-                    if value:
-                        data.update({title: value.upper()})
-
-        table_partes = self.driver.find_element(By.ID, self.elements.area_selecao)
-        for group_parte in table_partes.find_elements(By.TAG_NAME, "tr"):
+        data = {
+            "NUMERO_PROCESSO": capa["numero"],
+            "STATUS": capa["situacao"].upper(),
+        }
+        for title, value in capa["campos"]:
+            data.update({title: value.upper()})
+
+        for parte in capa["partes"]:
+            type_parte = self.format_string(parte["tipo"].upper())
+            if len(parte["linhas"]) == 1:
+                data.update({type_parte: parte["linhas"][0]})
+                continue
+
             pos_repr = 0
-            type_parte = self.format_string(
-                group_parte.find_elements(By.TAG_NAME, "td")[0].text.upper(),
-            )
-
-            info_parte = group_parte.find_elements(By.TAG_NAME, "td")[1]
-            info_parte_text = info_parte.text.split("\n")
-            if "\n" in info_parte.text:
-                for attr_parte in info_parte_text:
-                    if ":" in attr_parte:
-                        representante = attr_parte.replace("  ", "").split(":")
-                        tipo_representante = representante[0].upper()
-                        nome_representante = representante[1].upper()
-                        key = {
-                            f"{tipo_representante}_{type_parte}": nome_representante,
-                        }
-
-                        doc_ = "Não consta"
-                        with suppress(NoSuchElementException, IndexError):
-                            doc_ = info_parte.find_elements(By.TAG_NAME, "input")[
-                                pos_repr
-                            ]
-                            doc_ = doc_.get_attribute("value")
-
-                        key_doc = {f"DOC_{tipo_representante}_{type_parte}": doc_}
-
-                        pos_repr += 1
-
-                        data.update(key)
-                        data.update(key_doc)
-
-                    elif ":" not in attr_parte:
-                        key = {type_parte: attr_parte}
-                        data.update(key)
-
-            elif "\n" not in info_parte_text:
-                key = {type_parte: info_parte.text}
-                data.update(key)
+            for attr_parte in parte["linhas"]:
+                if ":" not in attr_parte:
+                    data.update({type_parte: attr_parte})
+                    continue
+
+                representante = attr_parte.split(":")
+                tipo_representante = representante[0].strip().upper()
+                nome_representante = representante[1].strip().upper()
+
+                doc_ = "Não consta"
+                if pos_repr < len(parte["documentos"]):
+                    doc_ = parte["documentos"][pos_repr]
+
+                pos_repr += 1
+                data.update({
+                    f"{tipo_representante}_{type_parte}": nome_representante,
+                    f"DOC_{tipo_representante}_{type_parte}": doc_,
+                })
 
         return [data]
+
+    def _get_grau(self) -> int:
+        # Aceita "1", "1º" ou vazio (1º grau)
+        grau = self.bot_data.get("GRAU", 1) or 1
+        if isinstance(grau, str):
+            grau = grau.replace("º", "").strip()
+
+        return int(grau)
@@ -5,7 +5,6 @@ navigating forms, and extracting barcodes following the ESaj requirements.
 """
 
 import platform
-import re
 import time
 import traceback
 from contextlib import suppress
@@ -13,7 +12,6 @@ from time import sleep
 from typing import Self
 
 import requests
-from pypdf import PdfReader
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -22,10 +20,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot as ClassBot
-
-
-class OtherUtils: ...  # noqa: D101
-
+from crawjud.utils.pdf_texto import PADRAO_CODIGO_BARRAS, buscar_padrao
 
 type_docscss = {
     "custas_iniciais": {
@@ -66,7 +61,19 @@ class Emissao(ClassBot):
 
     """
 
-    count_doc = OtherUtils.count_doc
+    @staticmethod
+    def count_doc(doc: str | None) -> str | None:
+        """Identify the document type by its number of digits.
+
+        Args:
+            doc (str | None): CPF or CNPJ, with or without punctuation.
+
+        Returns:
+            str | None: "cpf", "cnpj" or None for other sizes.
+
+        """
+        digitos = "".join(filter(str.isdigit, str(doc or "")))
+        return {11: "cpf", 14: "cnpj"}.get(len(digitos))
 
     @classmethod
     def initialize(
@@ -117,8 +124,8 @@ class Emissao(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -129,6 +136,7 @@ class Emissao(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -179,7 +187,7 @@ class Emissao(ClassBot):
                 self.preparo_ri()
 
             self.downloadpdf(self.generate_doc())
-            self.append_success(self.get_barcode())
+            self.saida_sucesso(self.get_barcode())
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -459,31 +467,13 @@ class Emissao(ClassBot):
             sleep(2)
             # Inicialize uma lista para armazenar os números encontrados
             bar_code = ""
-            numeros_encontrados = []
-
-            # Expressão regular para encontrar números nesse formato
-            pattern = r"\b\d{5}\.\d{5}\s*\d{5}\.\d{6}\s*\d{5}\.\d{6}\s*\d\s*\d{14}\b"
-
-            pdf_file = self.path_pdf
-            read = PdfReader(pdf_file)
-
-            # Read PDF
-            for page in read.pages:
-                text = page.extract_text()
-
-                # Use a expressão regular para encontrar números
-                numeros = re.findall(pattern, text)
-
-                # Adicione os números encontrados à lista
-                numeros_encontrados.extend(numeros)
 
-            # Imprima os números encontrados
-            for numero in numeros_encontrados:
+            # Leitura interrompida na página em que o código de barras aparece
+            numero = buscar_padrao(self.path_pdf, PADRAO_CODIGO_BARRAS)
+            if numero:
                 bar_code = numero.replace("  ", "")
                 bar_code = bar_code.replace(" ", "")
                 bar_code = bar_code.replace(".", " ")
-                numero = numero.split("  ")
-                numero = numero[2].split(".")
 
             return [
                 self.bot_data.get("NUMERO_PROCESSO"),
@@ -17,6 +17,11 @@ from selenium.webdriver.support import expected_conditions as ec
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot as ClassBot
+from crawjud.utils.webdriver.tabela import (
+    LinhaTabela,
+    extrair_linhas,
+    extrair_tabela,
+)
 
 
 class Movimentacao(ClassBot):
@@ -37,6 +42,9 @@ class Movimentacao(ClassBot):
 
     """
 
+    # Somente leitura; as tabelas de movimentações são exibidas por script
+    perfil_navegador = "scrape"
+
     @classmethod
     def initialize(cls, *args: str | int, **kwargs: str | int) -> Self:
         """Initialize a new Movimentacao instance.
@@ -69,6 +77,8 @@ class Movimentacao(ClassBot):
         self.module_bot = __name__
 
         super().setup(*args, **kwargs)
+        # Navegador com o perfil declarado na classe
+        self.driver = self.criar_driver()
         super().auth_bot()
         self.start_time = time.perf_counter()
 
@@ -86,8 +96,8 @@ class Movimentacao(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -98,6 +108,7 @@ class Movimentacao(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -160,12 +171,12 @@ class Movimentacao(ClassBot):
 
             if len(self.appends) > 0:
                 self.type_log = "log"
-                self.append_success(self.appends)
+                self.saida_sucesso(self.appends)
 
             if len(self.another_append) > 0:
                 for data, msg, fileN in self.another_append:  # noqa: N806
                     self.type_log = "info"
-                    self.append_success([data], msg, fileN)
+                    self.saida_sucesso([data], msg, fileN)
 
             elif len(self.appends) == 0 and len(self.another_append) == 0:
                 self.message = "Nenhuma movimentação encontrada"
@@ -173,7 +184,7 @@ class Movimentacao(ClassBot):
                 self.prt()
                 data = self.bot_data
                 data.update({"MOTIVO_ERRO": self.message})
-                self.append_error(data)
+                self.saida_erro(data)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -211,24 +222,24 @@ class Movimentacao(ClassBot):
         if encontrado is False:
             raise ExecutionError(message="Nenhuma movimentação encontrada")
 
-    def filter_moves(self, move: WebElement) -> bool:
-        """Filter a movement element based on given date and keyword criteria.
+    def filter_moves(self, move: LinhaTabela) -> bool:
+        """Filter a movement row snapshot based on given date and keyword criteria.
 
         Args:
-            move (WebElement): A movement element to be filtered.
+            move (LinhaTabela): Snapshot of the movement row to be filtered.
 
         Returns:
             bool: True if the movement meets all criteria; otherwise, False.
 
         """
         keyword = self.kword
-        itensmove = move.find_elements(By.TAG_NAME, "td")
+        itensmove = move["celulas"]
 
         if len(itensmove) < 5:
             return False
 
-        text_mov = str(itensmove[2].text)
-        data_mov = str(itensmove[0].text.strip())
+        text_mov = str(itensmove[2]["texto"])
+        data_mov = str(itensmove[0]["texto"].strip())
 
         def data_check(data_mov: str) -> bool:
             """Validate the given date string against multiple date formats and checks if it falls within a specified date range.
@@ -368,7 +379,11 @@ class Movimentacao(ClassBot):
 
         """
         self.kword = keyword
-        move_filter = list(filter(self.filter_moves, self.table_moves))
+        move_filter = [
+            (move, linha)
+            for move, linha in zip(self.table_moves, self.linhas_moves, strict=True)
+            if self.filter_moves(linha)
+        ]
 
         message_ = [
             "\n====================================================\n",
@@ -441,20 +456,20 @@ class Movimentacao(ClassBot):
             return (mov_chk, trazer_teor, mov, use_gpt, save_another_file)
 
         """ Iteração dentro das movimentações filtradas """
-        for move in move_filter:
+        for move, linha in move_filter:
             mov_texdoc = ""
-            itensmove = move.find_elements(By.TAG_NAME, "td")
+            itensmove = linha["celulas"]
 
-            text_mov = str(itensmove[3].text)
-            data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
+            text_mov = str(itensmove[3]["texto"])
+            data_mov = str(itensmove[2]["texto"].split(" ")[0]).replace(" ", "")
 
             """ Outros Checks """
             mov_chk, trazerteor, mov_name, use_gpt, save_another_file = check_others(
                 text_mov,
             )
 
-            nome_mov = str(itensmove[3].find_element(By.TAG_NAME, "b").text)
-            movimentador = itensmove[4].text
+            nome_mov = str(itensmove[3]["tags"]["b"] or "")
+            movimentador = itensmove[4]["texto"]
 
             """ Formatação Nome Movimentador """
             if "SISTEMA PROJUDI" in movimentador:
@@ -528,6 +543,8 @@ class Movimentacao(ClassBot):
             By.XPATH,
             self.elements.table_moves,
         )
+        # Snapshot das linhas em uma única chamada, usado pelos filtros
+        self.linhas_moves = extrair_linhas(self.driver, self.table_moves, tags=("b",))
 
     def get_moves(self) -> None:
         """Retrieve movement information.
@@ -571,7 +588,7 @@ class Movimentacao(ClassBot):
                 'document.querySelector("#tabelaUltimasMovimentacoes").style.display = "block"',
             )
 
-        itens = table_moves.find_elements(By.TAG_NAME, "tr")
+        itens = extrair_tabela(self.driver, table_moves, tags=("span",))
 
         palavra_chave = str(self.bot_data.get("PALAVRA_CHAVE"))
         termos = [palavra_chave]
@@ -584,11 +601,14 @@ class Movimentacao(ClassBot):
             self.type_log = "log"
 
             for item in itens:
-                td_tr = item.find_elements(By.TAG_NAME, "td")
-                mov = td_tr[2].text
+                td_tr = item["celulas"]
+                if len(td_tr) < 3:
+                    continue
+
+                mov = td_tr[2]["texto"]
 
                 if termo.lower() in mov.lower():
-                    data_mov = td_tr[0].text
+                    data_mov = td_tr[0]["texto"]
 
                     with suppress(Exception):
                         if type(data_mov) is str:
@@ -598,7 +618,7 @@ class Movimentacao(ClassBot):
                             )
 
                     name_mov = mov.split("\n")[0]
-                    text_mov = td_tr[2].find_element(By.TAG_NAME, "span").text
+                    text_mov = td_tr[2]["tags"]["span"] or ""
                     self.appends.append([
                         self.bot_data.get("NUMERO_PROCESSO"),
                         data_mov,
@@ -4,7 +4,6 @@ This module manages protocol operations in the ESaj system using the CrawJUD fra
 """
 
 import os
-import shutil
 import time
 import traceback
 import unicodedata
@@ -22,6 +21,8 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot as ClassBot
+from crawjud.utils.downloads import aguardar_download, enviar_ao_storage
+from crawjud.utils.webdriver.etapas import Etapas
 
 
 class Protocolo(ClassBot):
@@ -105,8 +106,8 @@ class Protocolo(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -117,6 +118,7 @@ class Protocolo(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -169,7 +171,7 @@ class Protocolo(ClassBot):
             self.vincular_parte()
             self.finish_petition()
             data = self.get_confirm_protocol()
-            self.append_success(data, message=data[1])
+            self.saida_sucesso(data, message=data[1])
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -202,7 +204,10 @@ class Protocolo(ClassBot):
                 )
                 link = button_peticionamento.get_attribute("onclick").split("'")[1]
                 self.driver.execute_script(f"return window.location.href = '{link}';")
-                sleep(5)
+                Etapas(self.driver, site="esaj").aguardar(
+                    "abrir_peticionamento",
+                    ec.staleness_of(button_peticionamento),
+                )
 
             except Exception:
                 button_enterproc: WebElement = WebDriverWait(self.driver, 5).until(
@@ -473,16 +478,16 @@ class Protocolo(ClassBot):
         """
         self.prt.print_log("log", "Finalizando...")
 
-        finish_button = self.driver.find_element(
-            By.XPATH,
-            self.elements.botao_protocolar,
+        etapas = Etapas(self.driver, site="esaj")
+        finish_button: WebElement = etapas.aguardar(
+            "protocolar",
+            ec.element_to_be_clickable((By.XPATH, self.elements.botao_protocolar)),
         )
-        sleep(1)
         finish_button.click()
-        sleep(5)
 
-        confirm_button: WebElement = self.wait.until(
-            ec.presence_of_element_located((
+        confirm_button: WebElement = etapas.aguardar(
+            "confirmar_protocolo",
+            ec.element_to_be_clickable((
                 By.CSS_SELECTOR,
                 self.elements.botao_confirmar,
             )),
@@ -518,6 +523,7 @@ class Protocolo(ClassBot):
                 f"{self.output_dir_path}/{name_recibo.replace('.pdf', '.png')}",
             )
 
+            inicio = time.time()
             getlinkrecibo.click()
 
             path = os.path.join(self.output_dir_path, name_recibo)
@@ -526,12 +532,17 @@ class Protocolo(ClassBot):
                 "recibo.pdf",
             )
 
-            while True:
-                if os.path.exists(pathpdf):
-                    sleep(0.5)
-                    break
+            recibo = aguardar_download(
+                Path(pathpdf).parent,
+                Path(pathpdf).name,
+                destino=path,
+                desde=inicio,
+            )
+            if recibo is None:
+                raise ExecutionError(message="Recibo do protocolo não encontrado")
+
+            enviar_ao_storage(recibo, f"{self.pid}/{name_recibo}", self.storage)
 
-            shutil.move(pathpdf, path)
             return [
                 self.bot_data.get("NUMERO_PROCESSO"),
                 f"Processo nº{self.bot_data.get('NUMERO_PROCESSO')} protocolado com sucesso!",
@@ -26,6 +26,7 @@ get_page_custas_pagas = 'button[class="btn btn-secondary btn-space linkConsultaS
 
 consultaproc_grau1 = "https://consultasaj.tjam.jus.br/cpopg/open.do"
 consultaproc_grau2 = "https://consultasaj.tjam.jus.br/cposgcr/open.do"
+consultaproc_busca_grau1 = "https://consultasaj.tjam.jus.br/cpopg/search.do"
 url_login = "https://consultasaj.tjam.jus.br/sajcas/login"
 url_login_cert = "https://consultasaj.tjam.jus.br/sajcas/login#aba-certificado"
 
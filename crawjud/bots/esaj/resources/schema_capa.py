@@ -0,0 +1,172 @@
+"""Defina o schema de extração da capa do ESAJ a partir do HTML da página.
+
+Este módulo fornece:
+- Expressões XPath pré-compiladas equivalentes aos seletores de `elements.py`;
+- extrai_capa: número, situação, campos do resumo e partes principais.
+
+A função recebe apenas o HTML, sem WebDriver: a página pode vir da sessão
+HTTP do robô (`ClassBot.obter_pagina`) ou do `page_source` do navegador.
+
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+from lxml import etree, html
+
+from crawjud.bots.esaj.resources import elements
+
+
+def _classe(nome: str) -> str:
+    # Equivalente XPath de um seletor `.classe` (By.CLASS_NAME)
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {nome} ')"
+
+
+# Linhas do resumo: cabeçalho da capa e painel "Mais detalhes"
+linhas_resumo = etree.XPath(
+    '//div[@class="unj-entity-header__summary"]'
+    '/div[@class="container"]/div[@class="row"]',
+)
+linhas_detalhes = etree.XPath(f'//div[@id="maisDetalhes"]/div[{_classe("row")}]')
+
+# Equivalente a 'div[class^="col-"]'
+itens_resumo = etree.XPath('.//div[starts-with(@class, "col-")]')
+numero_processo = etree.XPath(f".//*[{_classe(elements.numproc)}]")
+situacao_processo = etree.XPath(f".//*[{_classe(elements.statusproc)}]")
+titulo_item = etree.XPath(f".//*[{_classe(elements.nameitemsumary)}]")
+valor_item = etree.XPath('.//div[@class="lh-1-1 line-clamp__2"]')
+
+# Equivalentes de `elements.value2_itemsumary`, pelo título do item
+valores_alternativos = {
+    "CLASSE": etree.XPath('.//*[@id="classeProcesso"]'),
+    "DISTRIBUIÇÃO": etree.XPath('.//*[@id="dataHoraDistribuicaoProcesso"]'),
+    "CONTROLE": etree.XPath('.//*[@id="numeroControleProcesso"]'),
+    "VALOR_DA_AÇÃO": etree.XPath('.//*[@id="valorAcaoProcesso"]'),
+    "JUIZ": etree.XPath('.//*[@id="juizProcesso"]'),
+    "OUTROS_ASSUNTOS": etree.XPath('.//div[@class="line-clamp__2"]'),
+}
+
+# Tabela de partes principais
+linhas_partes = etree.XPath(f'(//*[@id="{elements.area_selecao}"])[1]//tr')
+celulas = etree.XPath("./td")
+documentos = etree.XPath(".//input")
+
+# Marca as quebras de `<br>`; as quebras do código-fonte são só espaços
+QUEBRA_LINHA = "\ue000"
+
+# Situação exibida quando a capa não tem etiqueta de situação
+SITUACAO_PADRAO = "Em Andamento"
+
+
+class ParteCapa(TypedDict):
+    """Defina uma linha da tabela de partes principais.
+
+    Args:
+        tipo (str): Tipo de participação (ex.: "Reqte").
+        linhas (list[str]): Linhas do nome da parte e dos representantes.
+        documentos (list[str]): Valores dos campos ocultos dos representantes.
+
+    """
+
+    tipo: str
+    linhas: list[str]
+    documentos: list[str]
+
+
+class Capa(TypedDict):
+    """Defina os dados extraídos da capa do processo.
+
+    Args:
+        numero (str): Número do processo.
+        situacao (str): Situação do processo.
+        campos (list[tuple[str, str]]): Títulos (maiúsculos, espaços como `_`)
+            e valores do resumo, na ordem da página.
+        partes (list[ParteCapa]): Partes principais.
+
+    """
+
+    numero: str
+    situacao: str
+    campos: list[tuple[str, str]]
+    partes: list[ParteCapa]
+
+
+def extrai_capa(page_source: str) -> Capa | None:
+    """Extraia os dados da capa do processo.
+
+    Args:
+        page_source (str): HTML da página.
+
+    Returns:
+        Capa | None: Dados da capa ou None quando a página não é a capa de um
+            processo (listagem de processos, seleção de incidentes, login).
+
+    """
+    documento = _documento(page_source)
+    resumo = linhas_resumo(documento)
+    numeros = [
+        numero
+        for item in (itens_resumo(resumo[0]) if resumo else [])
+        for numero in numero_processo(item)
+    ]
+    if not numeros:
+        return None
+
+    situacoes = [_texto(s) for s in situacao_processo(resumo[0])]
+    campos: list[tuple[str, str]] = []
+    for linha in [*resumo[1:], *linhas_detalhes(documento)]:
+        for item in itens_resumo(linha):
+            campo = _campo(item)
+            if campo is not None:
+                campos.append(campo)
+
+    return Capa(
+        numero=_texto(numeros[0]),
+        situacao=next((s for s in situacoes if s), SITUACAO_PADRAO),
+        campos=campos,
+        partes=[parte for tr in linhas_partes(documento) if (parte := _parte(tr))],
+    )
+
+
+def _campo(item: html.HtmlElement) -> tuple[str, str] | None:
+    titulos = titulo_item(item)
+    if not titulos:
+        return None
+
+    titulo = "_".join(_texto(titulos[0]).upper().split())
+    valores = valor_item(item)
+    valor = _texto(valores[0]) if valores else ""
+    if not valor and titulo in valores_alternativos:
+        alternativos = valores_alternativos[titulo](item)
+        valor = _texto(alternativos[0]) if alternativos else ""
+
+    return (titulo, valor) if valor else None
+
+
+def _parte(tr: html.HtmlElement) -> ParteCapa | None:
+    tds = celulas(tr)
+    if len(tds) < 2:
+        return None
+
+    return ParteCapa(
+        tipo=_texto(tds[0]),
+        linhas=_texto(tds[1]).split("\n"),
+        documentos=[str(i.get("value", "")) for i in documentos(tds[1])],
+    )
+
+
+def _documento(page_source: str) -> html.HtmlElement:
+    documento = html.fromstring(page_source)
+    # Quebras de linha como no texto renderizado pelo navegador
+    for br in documento.iter("br"):
+        br.tail = QUEBRA_LINHA + (br.tail or "")
+
+    return documento
+
+
+def _texto(elemento: html.HtmlElement) -> str:
+    # Aproxima o `.text` do Selenium: espaços colapsados e linhas vazias removidas
+    linhas = elemento.text_content().split(QUEBRA_LINHA)
+    linhas = (" ".join(linha.split()) for linha in linhas)
+    return "\n".join(linha for linha in linhas if linha)
@@ -18,7 +18,7 @@ from dotenv import load_dotenv
 from httpx import Client
 from tqdm import tqdm
 
-from crawjud.common.exceptions.bot import ExecutionError
+from crawjud.common.exceptions.bot import ExecucaoCanceladaError, ExecutionError
 from crawjud.custom.task import ContextTask
 from crawjud.decorators import shared_task, wrap_cls
 from crawjud.interfaces.controllers.bots.systems.pje import PjeBot
@@ -121,9 +121,17 @@ class Capa[T](PjeBot):  # noqa: D101
             semaforo: Semaphore,
         ) -> None:
             with semaforo:
+                if self.stop_bot:
+                    return
+
                 try:
                     # Atualiza dados do item para processamento
                     row = self.list_posicao_processo[item["NUMERO_PROCESSO"]]
+
+                    # Processo já concluído em tentativa anterior da execução
+                    if self.linha_concluida(row):
+                        return
+
                     resultado: DictResults = self.buscar_processo(
                         data=item,
                         row=row,
@@ -139,6 +147,8 @@ class Capa[T](PjeBot):  # noqa: D101
                                 processo=item["NUMERO_PROCESSO"],
                             )
 
+                            # A linha só é concluída depois que a cópia
+                            # integral estiver salva no storage
                             thread_file_ = Thread(
                                 target=self.copia_integral,
                                 kwargs={
@@ -165,6 +175,9 @@ class Capa[T](PjeBot):  # noqa: D101
                                 type_log="success",
                             )
 
+                except ExecucaoCanceladaError:
+                    return
+
                 except ExecutionError:
                     self.print_msg(
                         message="Erro ao buscar processo",
@@ -185,7 +198,17 @@ class Capa[T](PjeBot):  # noqa: D101
 
         executor = ThreadPoolExecutor(6)
 
-        with cl as client, executor as pool:
+        def cancelar_fila() -> None:
+            # Descarta os processos ainda não iniciados e aborta as requisições
+            # em andamento fechando o client compartilhado
+            executor.shutdown(wait=False, cancel_futures=True)
+            cl.close()
+
+        with (
+            cl as client,
+            executor as pool,
+            self.cancelamento.ao_cancelar(cancelar_fila),
+        ):
             for item in data:
                 thread_proc = pool.submit(
                     threaded_func,
@@ -197,12 +220,12 @@ class Capa[T](PjeBot):  # noqa: D101
 
             for th in threads_processos:
                 with suppress(Exception):
-                    th.result()
+                    th.result(timeout=self.cancelamento.tempo_restante())
                     tqdm.write("ok")
 
             for th in thread_download_file:
                 with suppress(Exception):
-                    th.join()
+                    th.join(timeout=self.cancelamento.tempo_restante())
 
     def copia_integral(  # noqa: D417
         self,
@@ -243,15 +266,25 @@ class Capa[T](PjeBot):  # noqa: D101
                 type_log="log",
             )
 
-            response = client.get(url=link)
-            pdf_content = list(
-                filter(
-                    lambda x: x[0].lower() == "content-type"
-                    and x[1].lower() == "application/pdf",
-                    list(response.headers.items()),
-                ),
-            )
-            if len(pdf_content) > 0:
+            # Resposta em streaming, fechada imediatamente caso a parada
+            # seja solicitada durante o download
+            with (
+                client.stream("GET", url=link) as response,
+                self.cancelamento.ao_cancelar(response.close),
+            ):
+                pdf_content = list(
+                    filter(
+                        lambda x: x[0].lower() == "content-type"
+                        and x[1].lower() == "application/pdf",
+                        list(response.headers.items()),
+                    ),
+                )
+                if not pdf_content:
+                    # Sem o PDF a linha fica pendente para a retomada
+                    msg = "Erro ao baixar arquivo: o PJe não retornou o PDF"
+                    self.print_msg(message=msg, row=row, type_log="error")
+                    return
+
                 self.save_file_downloaded(
                     file_name=file_name,
                     response_data=response,
@@ -259,9 +292,15 @@ class Capa[T](PjeBot):  # noqa: D101
                     row=row,
                 )
 
+            # Só conclui a linha com a cópia integral confirmada no storage
+            self.concluir_linha(row)
+
+        except ExecucaoCanceladaError:
+            return
+
         except ExecutionError as e:
             tqdm.write("\n".join(traceback.format_exception(e)))
 
-            msg = "Erro ao baixar arquivo"
+            msg = f"Erro ao baixar arquivo: {e.message}"
 
-            self.print_msg(message=msg, row=row, type_log="info")
+            self.print_msg(message=msg, row=row, type_log="error")
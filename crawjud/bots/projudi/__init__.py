@@ -15,7 +15,7 @@ from crawjud.bots.projudi.intimacoes import Intimacoes
 from crawjud.bots.projudi.movimentacao import Movimentacao
 from crawjud.bots.projudi.proc_parte import ProcParte as Proc_parte
 from crawjud.bots.projudi.protocolo import Protocolo
-from crawjud.common.exceptions import StartError
+from crawjud.common.exceptions.bot import StartError
 
 ClassBots = Union[Capa, Intimacoes, Movimentacao, Proc_parte, Protocolo]
 logger_ = logging.getLogger(__name__)
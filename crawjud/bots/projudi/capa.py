@@ -4,21 +4,23 @@ Extract and manage process details from Projudi by scraping and formatting data.
 """
 
 import re
-import shutil
 import time
 import traceback
 from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
-from typing import Self
+from typing import ClassVar, Self
 
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 
+from crawjud.bots.projudi.resources import schema_capa
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.projudi import ProjudiBot as ClassBot
+from crawjud.utils.downloads import aguardar_download, enviar_ao_storage
+from crawjud.utils.webdriver.etapas import Etapas
 
 
 class Capa(ClassBot):
@@ -28,6 +30,13 @@ class Capa(ClassBot):
     extract process data and participant details, and format them accordingly.
     """
 
+    # Somente leitura; o Projudi depende do CSS para exibir os painéis
+    perfil_navegador = "scrape"
+    recursos_navegador = frozenset({"estilo"})
+
+    # Extrai os painéis do `page_source` (False lê campo a campo via WebDriver)
+    extracao_snapshot: ClassVar[bool] = True
+
     @classmethod
     def initialize(
         cls,
@@ -62,6 +71,8 @@ class Capa(ClassBot):
         self.module_bot = __name__
 
         super().setup(*args, **kwargs)
+        # Navegador com o perfil declarado na classe
+        self.driver = self.criar_driver()
         super().auth_bot()
         self.start_time = time.perf_counter()
 
@@ -73,8 +84,8 @@ class Capa(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -85,6 +96,7 @@ class Capa(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -127,7 +139,7 @@ class Capa(ClassBot):
             if trazer_copia and trazer_copia.lower() == "sim":
                 data = self.copia_pdf(data)
 
-            self.append_success(
+            self.saida_sucesso(
                 [data],
                 "Informações do processo extraidas com sucesso!",
             )
@@ -144,41 +156,42 @@ class Capa(ClassBot):
         data: dict[str, str | int | datetime],
     ) -> dict[str, str | int | datetime]:
         """Extract the movements of the legal proceedings and saves a PDF copy."""
+        etapas = Etapas(self.driver, site="projudi")
         id_proc = self.driver.find_element(
             By.CSS_SELECTOR,
             'input[name="id"]',
         ).get_attribute("value")
 
-        btn_exportar = self.wait.until(
-            ec.presence_of_element_located((
+        btn_exportar = etapas.aguardar(
+            "menu_exportar",
+            ec.element_to_be_clickable((
                 By.CSS_SELECTOR,
                 'input[id="btnMenuExportar"]',
             )),
         )
-        time.sleep(0.5)
         btn_exportar.click()
 
-        btn_exportar_processo = self.wait.until(
-            ec.presence_of_element_located(
+        btn_exportar_processo = etapas.aguardar(
+            "exportar_processo",
+            ec.element_to_be_clickable(
                 (By.CSS_SELECTOR, 'input[id="exportarProcessoButton"]'),
             ),
         )
-        time.sleep(0.5)
         btn_exportar_processo.click()
 
         def unmark_gen_mov() -> None:
-            time.sleep(0.5)
-            self.wait.until(
-                ec.presence_of_element_located((
+            etapas.aguardar(
+                "opcao_gerar_movimentacoes",
+                ec.element_to_be_clickable((
                     By.CSS_SELECTOR,
                     'input[name="gerarMovimentacoes"][value="false"]',
                 )),
             ).click()
 
         def unmark_add_validate_tag() -> None:
-            time.sleep(0.5)
-            self.wait.until(
-                ec.presence_of_element_located((
+            etapas.aguardar(
+                "opcao_tarja_validacao",
+                ec.element_to_be_clickable((
                     By.CSS_SELECTOR,
                     'input[name="adicionarTarjaValidacao"][value="false"]',
                 )),
@@ -188,36 +201,37 @@ class Capa(ClassBot):
             self.message = "Baixando cópia integral do processo..."
             self.type_log = "log"
             self.prt()
-            time.sleep(5)
 
             n_processo = self.bot_data.get("NUMERO_PROCESSO")
             path_pdf = Path(self.output_dir_path).joinpath(
                 f"Cópia Integral - {n_processo} - {self.pid}.pdf",
             )
 
-            btn_exportar = self.driver.find_element(
-                By.CSS_SELECTOR,
-                'input[name="btnExportar"]',
+            btn_exportar = etapas.aguardar(
+                "botao_exportar_copia",
+                ec.element_to_be_clickable((
+                    By.CSS_SELECTOR,
+                    'input[name="btnExportar"]',
+                )),
             )
+            inicio = time.time()
             btn_exportar.click()
 
-            count = 0
-            time.sleep(5)
-            path_copia = self.output_dir_path.joinpath(f"{id_proc}.pdf").resolve()
-
-            while count <= 300:
-                if path_copia.exists():
-                    break
-
-                time.sleep(2)
-                count += 1
-
-            if not path_copia.exists():
+            path_copia = aguardar_download(
+                self.output_dir_path,
+                f"{id_proc}.pdf",
+                destino=path_pdf,
+                desde=inicio,
+            )
+            if path_copia is None:
                 raise ExecutionError(message="Arquivo não encontrado!")
 
-            shutil.move(path_copia, path_pdf)
-
-            time.sleep(0.5)
+            # Na pasta da execução no bucket, entregue com os resultados
+            enviar_ao_storage(
+                path_copia,
+                f"{self.pid}/{path_pdf.name}",
+                self.storage,
+            )
             data.update({"CÓPIA_INTEGRAL": path_pdf.name})
 
         unmark_gen_mov()
@@ -309,6 +323,13 @@ class Capa(ClassBot):
             ),
         ]
 
+        if self.extracao_snapshot:
+            page_source = self.driver.page_source
+            for label, valor in schema_capa.extrai_info_geral(page_source, grau):
+                self._registra_info_geral(label, valor, process_info)
+
+            return
+
         for incl in includecontent:
             self._extrai_tabela_info_geral(incl, process_info)
 
@@ -350,18 +371,30 @@ class Capa(ClassBot):
                 if len(labels) != len(values):
                     continue
                 for idx, label in enumerate(labels):
-                    not_formated_label = label.text
-                    label_text = (
-                        self.format_string(label.text).upper().replace(" ", "_")
-                    )
-                    value_text = values[idx].text
-                    value_text = self._format_value(
-                        label_text,
-                        not_formated_label,
-                        value_text,
+                    self._registra_info_geral(
+                        label.text,
+                        values[idx].text,
+                        process_info,
                     )
-                    if value_text is not None:
-                        process_info.update({label_text: value_text})
+
+    def _registra_info_geral(
+        self,
+        not_formated_label: str,
+        value_text: str,
+        process_info: dict[str, str | int | datetime],
+    ) -> None:
+        """Formata e registra um par label/valor das informações gerais.
+
+        Args:
+            not_formated_label (str): Texto original do label.
+            value_text (str): Valor extraído.
+            process_info (dict): Dicionário de informações do processo.
+
+        """
+        label_text = self.format_string(not_formated_label).upper().replace(" ", "_")
+        value_text = self._format_value(label_text, not_formated_label, value_text)
+        if value_text is not None:
+            process_info.update({label_text: value_text})
 
     def _format_value(
         self,
@@ -455,6 +488,20 @@ class Capa(ClassBot):
         btn_partes.click()
 
         includecontent = self._get_includecontent_capa()
+        if self.extracao_snapshot:
+            for tabela in schema_capa.extrai_partes(self.driver.page_source):
+                tipo_parte = self.format_string(tabela["tipo"])
+                tipo_parte = tipo_parte.replace(" ", "_").upper()
+                for tds in tabela["linhas"]:
+                    self._registra_parte(
+                        tds,
+                        tabela["colunas"],
+                        tipo_parte,
+                        process_info,
+                    )
+
+            return
+
         result_table = includecontent.find_elements(
             By.CLASS_NAME,
             self.elements.resulttable,
@@ -518,15 +565,33 @@ class Capa(ClassBot):
             self.elements.table_moves,
         )
         for parte in linhas:
-            tds = parte.find_elements(By.TAG_NAME, "td")
-            for pos_, nome_coluna in enumerate(nome_colunas):
-                key = "_".join((
-                    self.format_string(nome_coluna).replace(" ", "_").upper(),
-                    tipo_parte,
-                ))
-                value = tds[pos_].text if pos_ < len(tds) else ""
-                if value:
-                    value = " ".join(value.split(" "))
-                    if "\n" in value:
-                        value = " | ".join(value.split("\n"))
-                    process_info.update({key: value})
+            tds = [td.text for td in parte.find_elements(By.TAG_NAME, "td")]
+            self._registra_parte(tds, nome_colunas, tipo_parte, process_info)
+
+    def _registra_parte(
+        self,
+        tds: list[str],
+        nome_colunas: list[str],
+        tipo_parte: str,
+        process_info: dict[str, str | int | datetime],
+    ) -> None:
+        """Formata e registra as células de uma linha da tabela de partes.
+
+        Args:
+            tds (list[str]): Texto das células da linha.
+            nome_colunas (list[str]): Lista de nomes das colunas.
+            tipo_parte (str): Tipo da parte.
+            process_info (dict): Dicionário de informações do processo.
+
+        """
+        for pos_, nome_coluna in enumerate(nome_colunas):
+            key = "_".join((
+                self.format_string(nome_coluna).replace(" ", "_").upper(),
+                tipo_parte,
+            ))
+            value = tds[pos_] if pos_ < len(tds) else ""
+            if value:
+                value = " ".join(value.split(" "))
+                if "\n" in value:
+                    value = " | ".join(value.split("\n"))
+                process_info.update({key: value})
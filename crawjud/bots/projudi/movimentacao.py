@@ -5,9 +5,9 @@ Handle movement-related operations in the Projudi system with data scraping and
 
 import os
 import re
-import shutil
 import time
 import traceback
+from concurrent.futures import Future
 from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
@@ -15,7 +15,6 @@ from time import sleep
 from typing import Self
 
 import requests
-from pypdf import PdfReader
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -24,6 +23,9 @@ from selenium.webdriver.support.ui import Select
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.projudi import ProjudiBot as ClassBot
+from crawjud.utils.downloads import aguardar_download
+from crawjud.utils.pdf_texto import agendar_extracao, extrair_texto
+from crawjud.utils.webdriver.tabela import LinhaTabela, extrair_linhas
 
 
 class Movimentacao(ClassBot):
@@ -33,6 +35,10 @@ class Movimentacao(ClassBot):
     keyword filtering, and report generation for movement activities.
     """
 
+    # Somente leitura; o Projudi depende do CSS para exibir os painéis
+    perfil_navegador = "scrape"
+    recursos_navegador = frozenset({"estilo"})
+
     @classmethod
     def initialize(cls, *args: str | int, **kwargs: str | int) -> Self:
         """Initialize a Movimentacao instance with provided arguments.
@@ -59,6 +65,8 @@ class Movimentacao(ClassBot):
         self.module_bot = __name__
 
         super().setup(*args, **kwargs)
+        # Navegador com o perfil declarado na classe
+        self.driver = self.criar_driver()
         super().auth_bot()
         self.start_time = time.perf_counter()
 
@@ -70,8 +78,8 @@ class Movimentacao(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -82,6 +90,7 @@ class Movimentacao(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -125,6 +134,7 @@ class Movimentacao(ClassBot):
             self.resultados = []
 
             self.table_moves = None
+            self.linhas_moves: list[LinhaTabela] = []
 
             list_botdata = list(self.bot_data.items())
             for key, value in list_botdata:
@@ -144,12 +154,12 @@ class Movimentacao(ClassBot):
 
             if len(self.appends) > 0:
                 self.type_log = "log"
-                self.append_success(self.appends)
+                self.saida_sucesso(self.appends)
 
             if len(self.another_append) > 0:
                 for data, msg, fileN in self.another_append:  # noqa: N806
                     self.type_log = "info"
-                    self.append_success([data], msg, fileN)
+                    self.saida_sucesso([data], msg, fileN)
 
             elif len(self.appends) == 0 and len(self.another_append) == 0:
                 self.message = "Nenhuma movimentação encontrada"
@@ -157,7 +167,7 @@ class Movimentacao(ClassBot):
                 self.prt()
                 data = self.bot_data
                 data.update({"MOTIVO_ERRO": self.message})
-                self.append_error(data)
+                self.saida_erro(data)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -207,24 +217,24 @@ class Movimentacao(ClassBot):
         if encontrado is False:
             raise ExecutionError(message="Nenhuma movimentação encontrada")
 
-    def filter_moves(self, move: WebElement) -> bool:
-        """Filter a movement element based on given date and keyword criteria.
+    def filter_moves(self, move: LinhaTabela) -> bool:
+        """Filter a movement row snapshot based on given date and keyword criteria.
 
         Args:
-            move (WebElement): A movement element to be filtered.
+            move (LinhaTabela): Snapshot of the movement row to be filtered.
 
         Returns:
             bool: True if the movement meets all criteria; otherwise, False.
 
         """
         keyword = self.kword
-        itensmove = move.find_elements(By.TAG_NAME, "td")
+        itensmove = move["celulas"]
 
         if len(itensmove) < 5:
             return False
 
-        text_mov = str(itensmove[3].text)
-        data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
+        text_mov = str(itensmove[3]["texto"])
+        data_mov = str(itensmove[2]["texto"].split(" ")[0]).replace(" ", "")
 
         def data_check(data_mov: str) -> bool:
             """Validate the given date string against multiple date formats and checks if it falls within a specified date range.
@@ -364,7 +374,11 @@ class Movimentacao(ClassBot):
 
         """
         self.kword = keyword
-        move_filter = list(filter(self.filter_moves, self.table_moves))
+        move_filter = [
+            (move, linha)
+            for move, linha in zip(self.table_moves, self.linhas_moves, strict=True)
+            if self.filter_moves(linha)
+        ]
 
         message_ = [
             "\n====================================================\n",
@@ -437,20 +451,20 @@ class Movimentacao(ClassBot):
             return (mov_chk, trazer_teor, mov, use_gpt, save_another_file)
 
         """ Iteração dentro das movimentações filtradas """
-        for move in move_filter:
+        for move, linha in move_filter:
             mov_texdoc = ""
-            itensmove = move.find_elements(By.TAG_NAME, "td")
+            itensmove = linha["celulas"]
 
-            text_mov = str(itensmove[3].text)
-            data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
+            text_mov = str(itensmove[3]["texto"])
+            data_mov = str(itensmove[2]["texto"].split(" ")[0]).replace(" ", "")
 
             """ Outros Checks """
             mov_chk, trazerteor, mov_name, use_gpt, save_another_file = check_others(
                 text_mov,
             )
 
-            nome_mov = str(itensmove[3].find_element(By.TAG_NAME, "b").text)
-            movimentador = itensmove[4].text
+            nome_mov = str(itensmove[3]["tags"]["b"] or "")
+            movimentador = itensmove[4]["texto"]
 
             """ Formatação Nome Movimentador """
             if "SISTEMA PROJUDI" in movimentador:
@@ -506,15 +520,19 @@ class Movimentacao(ClassBot):
 
         """
 
-        def getmovewithdoc(move: WebElement) -> bool:
-            def check_namemov(move: WebElement) -> bool:
-                itensmove = move.find_elements(By.TAG_NAME, "td")
-                text_mov = itensmove[3].find_element(By.TAG_NAME, "b").text
-                return keyword.upper() == text_mov.upper()
+        def getmovewithdoc(linha: LinhaTabela) -> bool:
+            itensmove = linha["celulas"]
+            if len(itensmove) < 4:
+                return False
 
-            return check_namemov(move)
+            text_mov = str(itensmove[3]["tags"]["b"] or "")
+            return keyword.upper() == text_mov.upper()
 
-        return list(filter(getmovewithdoc, self.table_moves))
+        return [
+            move
+            for move, linha in zip(self.table_moves, self.linhas_moves, strict=True)
+            if getmovewithdoc(linha)
+        ]
 
     def movecontainsdoc(self, move: WebElement) -> bool:
         """Determine if a movement element includes an associated document.
@@ -550,7 +568,6 @@ class Movimentacao(ClassBot):
         """
         itensmove = move.find_elements(By.TAG_NAME, "td")
 
-        text_mov = str(itensmove[3].text)
         data_mov = str(itensmove[2].text.split(" ")[0]).replace(" ", "")
 
         nome_mov = str(itensmove[3].find_element(By.TAG_NAME, "b").text)
@@ -582,7 +599,9 @@ class Movimentacao(ClassBot):
             while table_docs.get_attribute("style") == "display: none;":
                 sleep(0.25)
 
-        text_doc_1 = ""
+        # PDFs lidos no pool enquanto os próximos documentos são baixados
+        extracoes: list[tuple[dict[str, str], Future[str]]] = []
+        extracao_doc_1: Future[str] | None = None
 
         sleep(2)
         table_docs: WebElement = self.wait.until(
@@ -630,28 +649,21 @@ class Movimentacao(ClassBot):
                     f.write(response.content)
             elif response.status_code != 200:
                 # Fallback to ChromeDriver download if requests fails
+                inicio = time.time()
                 self.driver.get(url)
 
-                sleep(2)
-                while True:
-                    for root, _, files in self.output_dir_path.walk():
-                        for f in files:
-                            grau_similaridade = self.similaridade(name_pdf, f)
-                            if grau_similaridade > 0.8:
-                                old_pdf = Path(root).joinpath(f)
-                                file_found = True
-                                break
-
-                        if file_found:
-                            break
-
-                    if file_found:
-                        break
-                    sleep(0.5)
-
-                shutil.move(old_pdf, path_pdf)
+                # Os PDFs já baixados (e movidos para as subpastas) têm nomes
+                # parecidos: só o arquivo novo é aceito
+                old_pdf = aguardar_download(
+                    self.output_dir_path,
+                    lambda f, nome=name_pdf: self.similaridade(nome, f) > 0.8,
+                    destino=path_pdf,
+                    desde=inicio,
+                )
+                if old_pdf is None:
+                    raise ExecutionError(message="Arquivo não encontrado!")
 
-            text_mov = self.openfile(path_pdf)
+            extracao = agendar_extracao(path_pdf, separador=" ")
 
             # if str(self.bot_data.get("TRAZER_PDF", "NÃO")).upper() == "NÃO" or pos < max_rows:
             #     sleep(1)
@@ -661,7 +673,7 @@ class Movimentacao(ClassBot):
                 "NUMERO_PROCESSO": self.bot_data.get("NUMERO_PROCESSO"),
                 "Data movimentação": data_mov,
                 "Nome Movimentação": nome_mov,
-                "Texto da movimentação": text_mov,
+                "Texto da movimentação": "",
                 "Nome peticionante": movimentador,
                 "Classiicação Peticionante": qualificacao_movimentador,
                 "Nome Arquivo (Caso Tenha)": "".join(nomearquivo),
@@ -678,10 +690,12 @@ class Movimentacao(ClassBot):
                     f"{self.pid} - Info_Mov_Docs.xlsx",
                 ))
 
+            extracoes.append((data, extracao))
             if pos == max_rows:
-                text_doc_1 = text_mov
+                extracao_doc_1 = extracao
 
-        return text_doc_1
+        _preencher_textos(extracoes)
+        return extracao_doc_1.result() if extracao_doc_1 else ""
 
     def openfile(self, path_pdf: str) -> str:
         """Open a PDF file and extract its text content.
@@ -693,17 +707,7 @@ class Movimentacao(ClassBot):
             str: The extracted text from the PDF.
 
         """
-        with open(path_pdf, "rb") as pdf:
-            read = PdfReader(pdf)
-            # Read PDF
-            pagescontent = ""
-            for page in read.pages:
-                with suppress(Exception):
-                    text = page.extract_text()
-                    remove_n_space = text.replace("\n", " ")
-                    pagescontent = pagescontent + remove_n_space
-
-        return pagescontent
+        return extrair_texto(path_pdf, separador=" ")
 
     def set_tablemoves(self) -> None:
         """Locate the movement table and assign its elements to self.table_moves."""
@@ -712,3 +716,11 @@ class Movimentacao(ClassBot):
             By.XPATH,
             self.elements.table_moves,
         )
+        # Snapshot das linhas em uma única chamada, usado pelos filtros
+        self.linhas_moves = extrair_linhas(self.driver, self.table_moves, tags=("b",))
+
+
+def _preencher_textos(extracoes: list[tuple[dict[str, str], Future[str]]]) -> None:
+    # Aguarda as leituras agendadas e preenche o texto de cada movimentação
+    for data, extracao in extracoes:
+        data["Texto da movimentação"] = extracao.result()
@@ -21,15 +21,20 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.projudi import ProjudiBot as ClassBot
+from crawjud.utils.webdriver.etapas import Etapas
 
 dotenv.load_dotenv()
 
+# Tempo máximo (em segundos) para a barra de progresso concluir um envio
+TIMEOUT_ENVIO_ARQUIVO = 600
+
 
 class Protocolo(ClassBot):
     """Handle protocol operations and execute moves, uploads, signing, and screenshot capture in Projudi.
@@ -84,8 +89,8 @@ class Protocolo(ClassBot):
         frame = self.dataFrame()
         self.max_rows = len(frame)
 
-        for pos, value in enumerate(frame):
-            self.row = pos + 1
+        for row, value in self.linhas_pendentes(frame):
+            self.row = row
             self.bot_data = value
             if self.isStoped:
                 break
@@ -96,6 +101,7 @@ class Protocolo(ClassBot):
 
             try:
                 self.queue()
+                self.concluir_linha(self.row)
 
             except Exception as e:
                 # TODO(Nicholas Silva): Criação de Exceptions
@@ -179,7 +185,7 @@ class Protocolo(ClassBot):
                 data = self.screenshot_sucesso()
                 data.append(confirm_protocol)
 
-            self.append_success(data)
+            self.saida_sucesso(data)
 
         except Exception as e:
             # TODO(Nicholas Silva): Criação de Exceptions
@@ -344,14 +350,17 @@ class Protocolo(ClassBot):
                     'input[name="descricaoTipoDocumento"]',
                 )),
             )
+            etapas = Etapas(self.driver, site="projudi")
             input_tipo_move.click()
-            sleep(1)
+            etapas.aguardar(
+                "foco_tipo_protocolo",
+                lambda driver: driver.switch_to.active_element == input_tipo_move,
+            )
             input_tipo_move.send_keys(self.bot_data.get("TIPO_PROTOCOLO"))
 
-            sleep(1.5)
-
-            input_move_option: WebElement = self.wait.until(
-                ec.presence_of_element_located(
+            input_move_option: WebElement = etapas.aguardar(
+                "sugestoes_tipo_protocolo",
+                ec.element_to_be_clickable(
                     (
                         By.CSS_SELECTOR,
                         "div#ajaxAuto_descricaoTipoDocumento > ul > li:nth-child(1)",
@@ -396,10 +405,12 @@ class Protocolo(ClassBot):
             )
             button_new_file.click()
 
-            sleep(2.5)
-
-            self.driver.switch_to.frame(
-                self.driver.find_element(By.CSS_SELECTOR, self.elements.border),
+            etapas = Etapas(self.driver, site="projudi")
+            etapas.aguardar(
+                "janela_arquivo",
+                ec.frame_to_be_available_and_switch_to_it(
+                    (By.CSS_SELECTOR, self.elements.border),
+                ),
             )
             self.message = f"Enviando arquivo '{file}'"
             self.type_log = "log"
@@ -425,13 +436,15 @@ class Protocolo(ClassBot):
             self.type_log = "log"
             self.prt()
 
-            sleep(1)
-            type_file: WebElement = self.wait.until(
-                ec.presence_of_element_located((By.ID, "tipo0")),
+            type_file: WebElement = etapas.aguardar(
+                "tipo_arquivo",
+                ec.element_to_be_clickable((By.ID, "tipo0")),
             )
             type_file.click()
-            sleep(0.25)
-            type_options = type_file.find_elements(By.TAG_NAME, "option")
+            type_options = etapas.aguardar(
+                "opcoes_tipo_arquivo",
+                lambda _: type_file.find_elements(By.TAG_NAME, "option"),
+            )
             for option in type_options:
                 if option.text == self.bot_data.get("TIPO_ARQUIVO"):
                     option.click()
@@ -478,8 +491,6 @@ class Protocolo(ClassBot):
 
         """
         try:
-            sleep(0.5)
-
             anexos_list = [str(self.bot_data.get("ANEXOS"))]
             if "," in self.bot_data.get("ANEXOS"):
                 anexos_list = self.bot_data.get("ANEXOS").__str__().split(",")
@@ -503,7 +514,12 @@ class Protocolo(ClassBot):
                 self.type_log = "log"
             self.prt()
 
-            sleep(3)
+            # Cada anexo enviado ganha um seletor de tipo (tipo1, tipo2...)
+            etapas = Etapas(self.driver, site="projudi")
+            etapas.aguardar(
+                "tabela_anexos",
+                ec.presence_of_element_located((By.ID, f"tipo{len(anexos_list)}")),
+            )
             tablefiles: WebElement = self.wait.until(
                 ec.presence_of_element_located((By.CLASS_NAME, "resultTable")),
             )
@@ -514,14 +530,18 @@ class Protocolo(ClassBot):
 
             for pos, _ in enumerate(checkfiles):
                 numbertipo = pos + 1
-                sleep(0.75)
                 try:
                     type_file = self.driver.find_element(By.ID, f"tipo{numbertipo}")
                     type_file.click()
                 except Exception:
                     break
-                sleep(0.25)
-                type_options = type_file.find_elements(By.TAG_NAME, "option")
+                type_options = etapas.aguardar(
+                    "opcoes_tipo_arquivo",
+                    lambda _, campo=type_file: campo.find_elements(
+                        By.TAG_NAME,
+                        "option",
+                    ),
+                )
                 type_anexos = str(self.bot_data.get("TIPO_ANEXOS")).lower()
                 for option in type_options:
                     if str(option.text).lower() == type_anexos:
@@ -739,30 +759,30 @@ class Protocolo(ClassBot):
 
     def wait_progressbar(self) -> None:
         """Wait until the progress bar completes the file upload or processing."""
-        while True:
-            try:
-                divprogressbar: WebElement = self.wait.until(
-                    ec.presence_of_element_located((
-                        By.CSS_SELECTOR,
-                        self.elements.css_containerprogressbar,
-                    )),
-                )
-                divprogressbar = divprogressbar.find_element(
-                    By.CSS_SELECTOR,
-                    self.elements.css_divprogressbar,
-                )
-                sleep(1)
-                try:
-                    # adicionar um suppress StaleElementReferenceException
-                    get_style = divprogressbar.get_attribute("style")
-                except Exception:
-                    break
+        seletor_barra = (
+            f"{self.elements.css_containerprogressbar} "
+            f"{self.elements.css_divprogressbar}"
+        )
 
-                if get_style != "":
-                    sleep(1)
+        def envio_concluido(driver: WebDriver) -> bool:
+            # A barra some (ou fica obsoleta) quando o envio termina
+            with suppress(StaleElementReferenceException):
+                return all(
+                    barra.get_attribute("style") == ""
+                    for barra in driver.find_elements(By.CSS_SELECTOR, seletor_barra)
+                )
 
-                elif get_style == "":
-                    break
+            return True
 
-            except Exception:
-                break
+        with suppress(TimeoutException):
+            self.wait.until(
+                ec.presence_of_element_located((
+                    By.CSS_SELECTOR,
+                    self.elements.css_containerprogressbar,
+                )),
+            )
+            Etapas(self.driver, site="projudi").aguardar(
+                "envio_arquivo",
+                envio_concluido,
+                timeout=TIMEOUT_ENVIO_ARQUIVO,
+            )
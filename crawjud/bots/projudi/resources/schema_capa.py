@@ -0,0 +1,145 @@
+"""Defina o schema de extração da capa do Projudi a partir do `page_source`.
+
+Este módulo fornece:
+- Expressões XPath pré-compiladas equivalentes aos seletores de `elements.py`;
+- extrai_info_geral: pares (label, valor) do painel de informações gerais;
+- extrai_partes: tabelas de partes (tipo, colunas e linhas) do painel de partes.
+
+As funções recebem apenas o HTML do painel, sem WebDriver, e podem ser
+medidas isoladamente com páginas salvas.
+
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+from lxml import etree, html
+
+from crawjud.bots.projudi.resources import elements
+
+# Contêineres do painel de informações gerais (1º e 2º grau)
+primeira_instform1 = etree.XPath('(//*[@id="informacoesProcessuais"])[1]')
+primeira_instform2 = etree.XPath(
+    '(//*[@id="tabprefix0"]/*[@id="container"]/*[@id="includeContent"]/fieldset)[1]',
+)
+segunda_instform = etree.XPath('(//*[@id="recursoForm"]/fieldset)[1]')
+
+# Linhas com mais de uma célula da primeira tabela do contêiner
+linhas_info_geral = etree.XPath("(.//tbody)[1]/tr[count(td) > 1]")
+
+# Equivalente a "td.label, td.labelRadio > label"
+labels_info_geral = etree.XPath(
+    ".//td[contains(concat(' ', normalize-space(@class), ' '), ' label ')]"
+    " | .//td[contains(concat(' ', normalize-space(@class), ' '), ' labelRadio ')]"
+    "/label",
+)
+valores_info_geral = etree.XPath('.//td[not(@class) or @class=""]')
+
+# Painel de partes
+includecontent_capa = etree.XPath(f'(//*[@id="{elements.includecontent_capa}"])[1]')
+tabelas_partes = etree.XPath(
+    ".//*[contains(concat(' ', normalize-space(@class), ' '), "
+    f"' {elements.resulttable} ')]",
+)
+titulos_partes = etree.XPath(".//h4")
+colunas_partes = etree.XPath("(.//thead)[1]//th")
+corpo_partes = etree.XPath("(.//tbody)[1]")
+linhas_partes = etree.XPath(elements.table_moves)
+celulas = etree.XPath(".//td")
+
+# Marca as quebras de `<br>`; as quebras do código-fonte são só espaços
+QUEBRA_LINHA = "\ue000"
+
+
+class TabelaPartes(TypedDict):
+    """Defina uma tabela de partes extraída do painel.
+
+    Args:
+        tipo (str): Título da tabela (ex.: "Polo Ativo").
+        colunas (list[str]): Cabeçalhos das colunas, em maiúsculas.
+        linhas (list[list[str]]): Texto das células de cada linha.
+
+    """
+
+    tipo: str
+    colunas: list[str]
+    linhas: list[list[str]]
+
+
+def extrai_info_geral(page_source: str, grau: int) -> list[tuple[str, str]]:
+    """Extraia os pares (label, valor) do painel de informações gerais.
+
+    Args:
+        page_source (str): HTML da página com o painel aberto.
+        grau (int): Grau do processo.
+
+    Returns:
+        list[tuple[str, str]]: Labels e valores, na ordem da página, apenas das
+            linhas com a mesma quantidade de labels e valores preenchidos.
+
+    """
+    documento = _documento(page_source)
+    conteudos = [primeira_instform1, primeira_instform2]
+    if grau == 2:
+        conteudos = [segunda_instform]
+
+    pares: list[tuple[str, str]] = []
+    for conteudo in conteudos:
+        for incl in conteudo(documento):
+            for linha in linhas_info_geral(incl):
+                labels = [t for t in map(_texto, labels_info_geral(linha)) if t]
+                valores = [t for t in map(_texto, valores_info_geral(linha)) if t]
+                if len(labels) != len(valores):
+                    continue
+
+                pares.extend(zip(labels, valores, strict=True))
+
+    return pares
+
+
+def extrai_partes(page_source: str) -> list[TabelaPartes]:
+    """Extraia as tabelas de partes do painel de partes.
+
+    Args:
+        page_source (str): HTML da página com o painel de partes aberto.
+
+    Returns:
+        list[TabelaPartes]: Tabelas de partes, na ordem da página.
+
+    """
+    documento = _documento(page_source)
+    tabelas: list[TabelaPartes] = []
+    for incl in includecontent_capa(documento):
+        titulos = [t for t in map(_texto, titulos_partes(incl)) if t]
+        for tabela, titulo in zip(tabelas_partes(incl), titulos, strict=False):
+            linhas = [
+                [_texto(td) for td in celulas(linha)]
+                for corpo in corpo_partes(tabela)
+                for linha in linhas_partes(corpo)
+            ]
+            tabelas.append(
+                TabelaPartes(
+                    tipo=titulo,
+                    colunas=[_texto(th).upper() for th in colunas_partes(tabela)],
+                    linhas=linhas,
+                ),
+            )
+
+    return tabelas
+
+
+def _documento(page_source: str) -> html.HtmlElement:
+    documento = html.fromstring(page_source)
+    # Quebras de linha como no texto renderizado pelo navegador
+    for br in documento.iter("br"):
+        br.tail = QUEBRA_LINHA + (br.tail or "")
+
+    return documento
+
+
+def _texto(elemento: html.HtmlElement) -> str:
+    # Aproxima o `.text` do Selenium: espaços colapsados e linhas vazias removidas
+    linhas = elemento.text_content().split(QUEBRA_LINHA)
+    linhas = (" ".join(linha.split()) for linha in linhas)
+    return "\n".join(linha for linha in linhas if linha)
@@ -299,3 +299,24 @@ class FileUploadError(BaseCrawJUDError):
 
         """
         return self.message
+
+
+class ExecucaoCanceladaError(BaseCrawJUDError):
+    """Exception para execuções interrompidas pela solicitação de parada."""
+
+    def __init__(
+        self,
+        message: str = "Execução interrompida pelo usuário.",
+    ) -> None:
+        """Exception para execuções interrompidas pela solicitação de parada."""
+        self.message = message
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """Retorna a mensagem de erro.
+
+        Returns:
+            str: Mensagem de erro formatada.
+
+        """
+        return self.message
@@ -13,6 +13,7 @@ from dotenv import dotenv_values
 from socketio import SimpleClient
 from tqdm import tqdm
 
+from crawjud.common.exceptions.bot import ExecucaoCanceladaError
 from crawjud.interfaces.controllers.bots.master.bot_head import ClassBot
 
 environ = dotenv_values()
@@ -121,9 +122,16 @@ def wrap_cls[T](cls: type[ClassBot]) -> type[T]:
 
             cls.sio = sio
 
-            if self:
-                return cls.execution(current_task=self, *args, **kwargs)
+            try:
+                if self:
+                    return cls.execution(current_task=self, *args, **kwargs)
 
-            return cls.execution(self, *args, **kwargs)
+                return cls.execution(self, *args, **kwargs)
+
+            except ExecucaoCanceladaError:
+                return None
+
+            finally:
+                cls.finalizar_parada()
 
     return novo_init
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, suppress
 from datetime import datetime
 from io import BytesIO
 from typing import TYPE_CHECKING, ClassVar
@@ -14,12 +15,21 @@ from crawjud.custom.canvas import subtask
 from crawjud.custom.task import ContextTask
 from crawjud.interfaces.controllers.bots.master.abs_master import AbstractCrawJUD
 from crawjud.interfaces.dict.bot import BotData
+from crawjud.utils.cancelamento import TokenCancelamento
+from crawjud.utils.models.checkpoint import CheckpointExecution
+from crawjud.utils.models.metricas import medir_latencia
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from socketio import SimpleClient
 
     from crawjud.interfaces.dict.bot import DictFiles
+    from crawjud.utils.models.checkpoint import ItemCheckpoint
     from crawjud.utils.storage import Storage
+    from crawjud.utils.webdriver import DriverBot
+    from crawjud.utils.webdriver._types import BrowserOptions
+    from crawjud.utils.webdriver.config.chrome import PerfilNavegador
 
 
 class ClassBot[T](AbstractCrawJUD, ContextTask):
@@ -33,6 +43,33 @@ class ClassBot[T](AbstractCrawJUD, ContextTask):
     _downloaded_files: ClassVar[list[DictFiles]] = []
     _bot_data: ClassVar[list[BotData]] = {}
     posicoes_processos: ClassVar[dict[str, int]] = {}
+    # Perfil do navegador: robôs apenas de leitura usam "scrape", declarando
+    # em `recursos_navegador` os tipos de recurso que o site precisa
+    perfil_navegador: ClassVar[PerfilNavegador] = "padrao"
+    recursos_navegador: ClassVar[frozenset[str]] = frozenset()
+    # Etapas de leitura executadas por HTTP com a sessão do navegador
+    # (ver `obter_pagina`); as demais navegam pelo WebDriver
+    etapas_http: ClassVar[frozenset[str]] = frozenset()
+    _checkpoint: CheckpointExecution | None = None
+    _linhas_concluidas: set[int] | None = None
+    _cancelamento: TokenCancelamento | None = None
+
+    @property
+    def cancelamento(self) -> TokenCancelamento:
+        """Token de cancelamento compartilhado pelo trabalho da execução."""
+        if self._cancelamento is None:
+            self._cancelamento = TokenCancelamento()
+
+        return self._cancelamento
+
+    @property
+    def stop_bot(self) -> bool:
+        return self.cancelamento.cancelado
+
+    @stop_bot.setter
+    def stop_bot(self, parar: bool) -> None:
+        if parar:
+            self.cancelamento.cancelar()
 
     @property
     def pid(self) -> str:
@@ -121,8 +158,10 @@ class ClassBot[T](AbstractCrawJUD, ContextTask):
 
     @property
     def storage(self) -> Storage:
-        """Storage do CrawJUD."""
-        return self._storage
+        """Storage do CrawJUD (client compartilhado pelo processo)."""
+        from crawjud.utils.storage import get_storage
+
+        return get_storage("minio")
 
     def download_files(
         self,
@@ -139,8 +178,12 @@ class ClassBot[T](AbstractCrawJUD, ContextTask):
         files_b64: list[DictFiles] = (
             subtask("crawjud.download_files")
             .apply_async(kwargs={"storage_folder_name": self.folder_storage})
-            .wait_ready()
+            .wait_ready(cancel=self.cancelamento.evento)
         )
+        self.cancelamento.verificar()
+        if files_b64 is None:
+            raise ExecutionError(message="Erro ao baixar os arquivos da execução.")
+
         xlsx_key = list(filter(lambda x: x["file_suffix"] == ".xlsx", files_b64))
         if not xlsx_key:
             raise ExecutionError(message="Nenhum arquivo Excel encontrado.")
@@ -164,6 +207,181 @@ class ClassBot[T](AbstractCrawJUD, ContextTask):
             type_log="info",
         )
 
+    @property
+    def checkpoint(self) -> CheckpointExecution:
+        """Checkpoint da execução atual no Redis."""
+        if self._checkpoint is None or self._checkpoint.pid != str(self.pid):
+            self._checkpoint = CheckpointExecution.carregar(str(self.pid))
+            self._linhas_concluidas = set(self._checkpoint.linhas_concluidas)
+
+        return self._checkpoint
+
+    def linha_concluida(self, row: int) -> bool:
+        """Verifique se a linha já foi concluída em uma tentativa anterior.
+
+        Args:
+            row (int): Linha da planilha.
+
+        Returns:
+            bool: True se a linha já consta no checkpoint da execução.
+
+        """
+        with suppress(Exception):
+            _ = self.checkpoint
+            return int(row) in self._linhas_concluidas
+
+        return False
+
+    def linhas_pendentes[V](self, frame: Iterable[V]) -> Iterator[tuple[int, V]]:
+        """Percorra as linhas ainda não concluídas da execução.
+
+        Antes da primeira linha, as saídas das linhas concluídas em tentativas
+        anteriores são repetidas (`append_success`/`append_error`), para que a
+        planilha final contenha todas as linhas.
+
+        Args:
+            frame (Iterable[V]): Linhas da planilha, em ordem.
+
+        Yields:
+            tuple[int, V]: Número da linha (base 1) e os dados da linha.
+
+        """
+        self._repetir_saidas_checkpoint()
+        for pos, value in enumerate(frame):
+            if not self.linha_concluida(pos + 1):
+                yield pos + 1, value
+
+    def concluir_linha(self, row: int) -> None:
+        """Registre no checkpoint que a linha foi processada até o fim.
+
+        Args:
+            row (int): Linha da planilha.
+
+        """
+        with suppress(Exception):
+            self.checkpoint.concluir_linha(row)
+            self._linhas_concluidas.add(int(row))
+
+    def saida_sucesso(self, *args: T, **kwargs: T) -> None:
+        """Registre a saída de sucesso da linha atual e guarde-a no checkpoint.
+
+        Args:
+            *args (T): Argumentos de `append_success`.
+            **kwargs (T): Argumentos nomeados de `append_success`.
+
+        """
+        self.append_success(*args, **kwargs)
+        with suppress(Exception):
+            self.checkpoint.registrar_sucesso(self.row, args, kwargs)
+
+    def saida_erro(self, *args: T, **kwargs: T) -> None:
+        """Registre uma saída de erro da linha atual e guarde-a no checkpoint.
+
+        Use para erros que não interrompem a linha (ex.: processo não
+        encontrado); linhas que falham são processadas de novo na retomada.
+
+        Args:
+            *args (T): Argumentos de `append_error`.
+            **kwargs (T): Argumentos nomeados de `append_error`.
+
+        """
+        self.append_error(*args, **kwargs)
+        with suppress(Exception):
+            self.checkpoint.registrar_erro(self.row, args, kwargs)
+
+    def _repetir_saidas_checkpoint(self) -> None:
+        sucessos: list[ItemCheckpoint] = []
+        erros: list[ItemCheckpoint] = []
+        # Sem Redis a execução segue sem retomada
+        with suppress(Exception):
+            self.checkpoint.descartar_pendentes()
+            sucessos, erros = self.checkpoint.sucessos, self.checkpoint.erros
+
+        for item in sucessos:
+            self.append_success(*item["args"], **item["kwargs"])
+
+        for item in erros:
+            self.append_error(*item["args"], **item["kwargs"])
+
+    def medir(self, etapa: str) -> AbstractContextManager[None]:
+        """Cronometre uma etapa do robô e registre-a nos histogramas de latência.
+
+        O sistema e o robô são obtidos do módulo da classe
+        (ex.: `crawjud.bots.pje.capa` -> "pje", "capa").
+
+        Args:
+            etapa (str): Nome da etapa (ex.: "autenticacao", "captcha").
+
+        Returns:
+            AbstractContextManager[None]: Contexto que mede o bloco.
+
+        """
+        *_, sistema, bot = ["", *type(self).__module__.split(".")]
+        return medir_latencia(
+            sistema=sistema,
+            bot=bot,
+            etapa=etapa,
+            regiao=str(getattr(self, "_regiao", "") or ""),
+            pid=str(getattr(self, "_pid", "") or "") or None,
+        )
+
+    def criar_driver(
+        self,
+        selected_browser: BrowserOptions = "chrome",
+        **kwargs: T,
+    ) -> DriverBot:
+        """Crie o WebDriver do robô com o perfil de navegador declarado na classe.
+
+        Args:
+            selected_browser (BrowserOptions): Navegador utilizado.
+            **kwargs (T): Argumentos adicionais do `DriverBot` (ex.: with_proxy).
+
+        Returns:
+            DriverBot: WebDriver configurado.
+
+        """
+        from crawjud.utils.webdriver import DriverBot
+
+        kwargs.setdefault("perfil", self.perfil_navegador)
+        kwargs.setdefault("recursos_necessarios", self.recursos_navegador)
+        return DriverBot(selected_browser=selected_browser, **kwargs)
+
+    def obter_pagina(self, etapa: str, url: str) -> str:
+        """Obtenha o HTML da página pela sessão HTTP ou pelo navegador.
+
+        Etapas declaradas em `etapas_http` usam `driver.sessao_http`, com os
+        mesmos cookies e headers do navegador; as demais navegam até a URL.
+
+        Args:
+            etapa (str): Nome da etapa de leitura.
+            url (str): URL da página.
+
+        Returns:
+            str: HTML da página.
+
+        """
+        with self.medir(etapa):
+            if etapa in self.etapas_http:
+                response = self.driver.sessao_http.client.get(url)
+                response.raise_for_status()
+                return response.text
+
+            self.driver.get(url)
+            return self.driver.page_source
+
+    def finalizar_parada(self) -> None:
+        """Registre a duração da parada quando a execução foi interrompida."""
+        duracao = self.cancelamento.duracao_parada()
+        if duracao is None:
+            return
+
+        self.cancelamento.registrar_parada()
+        with suppress(Exception):
+            self.print_msg(
+                message=f"Execução interrompida em {duracao:.2f} segundos",
+                type_log="info",
+            )
+
     def elaw_formats(
         self,
         data: dict[str, str],
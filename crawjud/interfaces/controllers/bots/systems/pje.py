@@ -4,18 +4,17 @@ from __future__ import annotations
 
 import importlib
 import secrets
-import traceback
 from contextlib import suppress
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from threading import Semaphore
-from time import sleep
 from typing import TYPE_CHECKING, ClassVar, cast
 
-from tqdm import tqdm
-
-from crawjud.common.exceptions.bot import ExecutionError, FileUploadError
+from crawjud.common.exceptions.bot import (
+    ExecucaoCanceladaError,
+    ExecutionError,
+    FileUploadError,
+)
 from crawjud.common.exceptions.validacao import ValidacaoStringError
 from crawjud.interfaces.controllers.bots.master.cnj_bots import CNJBots as ClassBot
 from crawjud.interfaces.dict.bot import BotData
@@ -29,7 +28,6 @@ from crawjud.interfaces.types.pje import (
 from crawjud.utils.iterators import RegioesIterator
 from crawjud.utils.models.logs import CachedExecution
 from crawjud.utils.recaptcha import captcha_to_image
-from crawjud.utils.storage import Storage
 
 if TYPE_CHECKING:
     from httpx import Client, Response
@@ -52,7 +50,6 @@ class PjeBot[T](ClassBot):
     subclasses_search: ClassVar[dict[str, type[PjeBot]]] = {}
 
     semaforo_save = Semaphore(1)
-    _storage = Storage("minio")
 
     @property
     def list_posicao_processo(self) -> dict[str, int]:
@@ -96,12 +93,13 @@ class PjeBot[T](ClassBot):
             DictResults: dicionário com os resultados da busca.
 
         """
-        return self.pje_classes["pjesearch"].search(
-            self,
-            data=data,
-            row=row,
-            client=client,
-        )
+        with self.medir("busca"):
+            return self.pje_classes["pjesearch"].search(
+                self,
+                data=data,
+                row=row,
+                client=client,
+            )
 
     def autenticar(self) -> bool:
         """Autenticação do PJE.
@@ -110,7 +108,8 @@ class PjeBot[T](ClassBot):
             bool: Booleano para identificar se autenicação foi realizada.
 
         """
-        return self.pje_classes["pjeauth"].auth(self)
+        with self.medir("autenticacao"):
+            return self.pje_classes["pjeauth"].auth(self)
 
     def regioes(self) -> RegioesIterator:
         """Listagem das regiões do PJe.
@@ -131,68 +130,65 @@ class PjeBot[T](ClassBot):
     ) -> None:
         """Envia o `arquivo baixado` no processo para o `storage`.
 
+        Retorna apenas depois que o arquivo estiver salvo no storage; qualquer
+        falha no download ou no upload é levantada para que a linha não seja
+        concluída no checkpoint.
+
         Arguments:
             file_name (str): Nome do arquivo.
             response_data (Response): response da request httpx.
             data_bot (BotData): Mapping dos dados da planilha de input.
             row (int): row do loop.
 
+        Raises:
+            ExecutionError: Falha ao baixar ou enviar o arquivo.
+
         """
         path_temp = workdir.joinpath("temp", self.pid.upper())
 
         path_temp.mkdir(parents=True, exist_ok=True)
 
-        try:
-            chunk = 8 * 1024
-            file_path = path_temp.joinpath(file_name)
-            # Salva arquivo em chunks no storage
-            dest_name = str(Path(self.pid.upper()).joinpath(file_name).as_posix())
-            upload_file = False
-
-            with file_path.open("wb") as f:
-                f.write(b"")
-
-            try:
-                self.storage.put_object(object_name=dest_name, data=BytesIO(b""))
-
-            except (FileUploadError, Exception) as e:
-                upload_file = False
-                tqdm.write("\n".join(traceback.format_exception(e)))
+        chunk = 8 * 1024
+        file_path = path_temp.joinpath(file_name)
+        dest_name = str(Path(self.pid.upper()).joinpath(file_name).as_posix())
 
-            with file_path.open("wb") as f:
+        try:
+            with file_path.open("wb") as f, self.medir("download"):
                 for _bytes in response_data.iter_bytes(chunk):
+                    self.cancelamento.verificar()
                     f.write(_bytes)
 
-            if not upload_file:
-                file_size = file_path.stat().st_size
-                with file_path.open("rb") as file:
-                    self.storage.put_object(
-                        object_name=dest_name,
-                        data=file,
-                        length=file_size,
-                    )
+            self.cancelamento.verificar()
+            file_size = file_path.stat().st_size
+            with file_path.open("rb") as file, self.medir("upload"):
+                self.storage.put_object(
+                    object_name=dest_name,
+                    data=file,
+                    length=file_size,
+                )
 
-            with suppress(Exception):
-                file_path.unlink()
+        except ExecucaoCanceladaError:
+            raise
 
         except (FileUploadError, Exception) as e:
-            str_exc = "\n".join(traceback.format_exception_only(e))
-            message = "Não foi possível baixar o arquivo. " + str_exc
-            self.print_msg(
-                row=row,
-                message=message,
-                type_log="warning",
-            )
+            # Stream fechado pela parada: reporta como cancelamento
+            self.cancelamento.verificar()
+            message = "Não foi possível baixar o arquivo. "
+            raise ExecutionError(message=message, exc=e) from e
 
         finally:
-            message = "Arquivo do processo n.{proc} baixado com sucesso!".format(
-                proc=data_bot["NUMERO_PROCESSO"],
-            )
-            self.print_msg(
-                row=row,
-                message=message,
-                type_log="info",
-            )
+            # Download interrompido ou concluído: descarta a cópia local
+            with suppress(Exception):
+                file_path.unlink()
+
+        message = "Arquivo do processo n.{proc} baixado com sucesso!".format(
+            proc=data_bot["NUMERO_PROCESSO"],
+        )
+        self.print_msg(
+            row=row,
+            message=message,
+            type_log="info",
+        )
 
     def save_success_cache(
         self,
@@ -226,6 +222,7 @@ class PjeBot[T](ClassBot):
         Raises:
             ExecutionError: Caso não seja possível obter informações do processo
             após 15 tentativas.
+            ExecucaoCanceladaError: Caso a parada da execução seja solicitada.
 
         """
         count_try: int = 0
@@ -256,9 +253,11 @@ class PjeBot[T](ClassBot):
             return img, token_desafio
 
         while count_try <= COUNT_TRYS:
+            self.cancelamento.verificar()
             with suppress(Exception):
                 img, token_desafio = args_desafio()
-                text = captcha_to_image(img)
+                with self.medir("captcha"):
+                    text = captcha_to_image(img)
 
                 link = (
                     f"/processos/{id_processo}"
@@ -279,7 +278,7 @@ class PjeBot[T](ClassBot):
 
                 if imagem:
                     count_try += 1
-                    sleep(sleep_time)
+                    self.cancelamento.aguardar(sleep_time)
                     continue
 
                 msg = (
@@ -1,22 +1,42 @@
-"""Serviço de domínio para manipulação de arquivos e sessões."""
+"""Serviço de domínio para manipulação de arquivos e sessões.
+
+Os chunks enviados pelo navegador vão direto ao storage como partes de um
+upload multipart. Os chunks são acumulados no Redis até completar uma parte
+(`UPLOAD_PART_SIZE`), e o estado do upload (upload ID, partes enviadas e
+bytes recebidos) também fica no Redis. Assim, um upload interrompido pode
+ser retomado a partir do offset devolvido por `save_file`. A memória de cada
+upload fica limitada a uma parte, e o acesso ao Redis e ao storage roda no
+executor da fachada assíncrona do storage, fora do event loop.
+"""
 
 import io
-import shutil
+import json
 import traceback
 from pathlib import Path
 from typing import AnyStr, NoReturn
 
-import aiofiles
 from clear import clear
 from quart import request, session
 from tqdm import tqdm
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
-from crawjud.utils.storage import Storage
+from crawjud.utils.models.conexao import conexao_redis
+from crawjud.utils.storage import UPLOAD_PART_SIZE, Part, get_storage
+from crawjud.utils.storage.aio import get_async_storage
 
 workdir_path = Path(__file__).cwd()
 
+CHAVE_UPLOAD = "crawjud:upload:{object_name}"
+CHAVE_UPLOAD_BUFFER = "crawjud:upload:{object_name}:buffer"
+CHAVE_UPLOAD_LOCK = "crawjud:upload:{object_name}:lock"
+
+# Tempo de vida (segundos) do estado de um upload interrompido (1 dia)
+UPLOAD_TTL = 60 * 60 * 24
+
+# Tempo máximo (segundos) de espera pelo chunk anterior do mesmo upload
+UPLOAD_LOCK_TIMEOUT = 120
+
 
 class ChunkIncompletoError(ValueError):
     """Empty."""
@@ -65,10 +85,17 @@ def _raise_val_err() -> NoReturn:
 class FileService[T]:
     """Serviço de domínio para manipulação de arquivos e sessões de usuário."""
 
-    async def save_file(self) -> None:
-        """Salva um arquivo enviado para o diretório temporário especificado."""
-        storage = Storage("minio")
+    async def save_file(self) -> int | None:
+        """Receba um chunk e envie ao storage as partes completas do arquivo.
+
+        Chunks já recebidos são ignorados, e chunks fora de ordem não são
+        gravados. Nos dois casos o retorno indica ao navegador de onde
+        continuar o envio.
 
+        Returns:
+            int | None: Bytes do arquivo já recebidos pelo servidor.
+
+        """
         try:
             data = await request.form
             file_ = await request.files
@@ -77,7 +104,6 @@ class FileService[T]:
             file_name = str(data.get("name"))
             index = int(data.get("index", 0))
 
-            _total = int(data.get("total", 1)) * 1024
             chunk = data.get("chunk", file_.get("chunk", b""))
             chunksize = int(data.get("chunksize", 1024))
             file_size = int(data.get("file_size"))
@@ -85,49 +111,35 @@ class FileService[T]:
                 chunk = chunk.stream.read()
 
             start_ = index * chunksize
-            end_ = min(file_size, start_ + chunksize)
 
             content_type = str(data.get("content_type"))
 
             if not all([file_name, chunk, content_type]):
                 tqdm.write(f"chunk: {chunk}")
                 if chunk == b"":
-                    return
+                    return None
 
                 _raise_val_err()
 
-            # Define diretório temporário para armazenar os chunks
-            path_temp = Path(__file__).cwd().joinpath("temp", sid.upper())
-            path_temp.mkdir(parents=True, exist_ok=True)
-            file_path = path_temp.joinpath(file_name)
-
-            # Salva o chunk no arquivo temporário
-            mode = "ab" if index > 0 else "wb"
-
-            async with aiofiles.open(file_path, mode) as f:
-                await f.write(chunk)
-
-            if end_ >= file_size:
-                async with aiofiles.open(file_path, "rb") as f:
-                    data_ = io.BytesIO(await f.read())
-                    dest_path = str(
-                        Path(sid.upper())
-                        .joinpath(secure_filename(file_name))
-                        .as_posix(),
-                    )
-                    storage.put_object(
-                        object_name=dest_path,
-                        data=data_,
-                        length=end_,
-                        content_type=content_type,
-                    )
-
-                shutil.rmtree(file_path.parent)
+            object_name = (
+                Path(sid.upper()).joinpath(secure_filename(file_name)).as_posix()
+            )
+            return await get_async_storage().run(
+                "upload_chunk",
+                _receber_chunk,
+                object_name,
+                start_,
+                chunk,
+                file_size,
+                content_type,
+            )
 
         except UploadFileError as e:
             clear()
             tqdm.write("\n".join(traceback.format_exception(e)))
 
+        return None
+
     async def save_session(
         self,
         server: T,
@@ -140,3 +152,92 @@ class FileService[T]:
         eio_sid = server.manager.eio_sid_from_sid(sid, namespace)
         eio_session = await server.eio.get_session(eio_sid)
         eio_session[namespace] = session
+
+
+def _receber_chunk(
+    object_name: str,
+    inicio: int,
+    chunk: bytes,
+    file_size: int,
+    content_type: str,
+) -> int:
+    # Executado em thread: um chunk por vez para cada upload, mesmo com
+    # vários servidores atendendo o namespace
+    conn = conexao_redis(decode_responses=False)
+    chave = CHAVE_UPLOAD.format(object_name=object_name)
+    chave_buffer = CHAVE_UPLOAD_BUFFER.format(object_name=object_name)
+
+    with conn.lock(
+        CHAVE_UPLOAD_LOCK.format(object_name=object_name),
+        timeout=UPLOAD_LOCK_TIMEOUT,
+        blocking_timeout=UPLOAD_LOCK_TIMEOUT,
+    ):
+        estado = {
+            campo.decode(): valor.decode()
+            for campo, valor in conn.hgetall(chave).items()
+        }
+        recebido = int(estado.get("recebido", 0))
+        if inicio != recebido:
+            # Chunk repetido ou fora de ordem: o navegador retoma do offset
+            return recebido
+
+        recebido += len(chunk)
+        final = recebido >= file_size
+        buffer = conn.strlen(chave_buffer)
+
+        if not final and buffer + len(chunk) < UPLOAD_PART_SIZE:
+            with conn.pipeline() as pipe:
+                pipe.append(chave_buffer, chunk)
+                pipe.hset(chave, "recebido", recebido)
+                pipe.expire(chave_buffer, UPLOAD_TTL)
+                pipe.expire(chave, UPLOAD_TTL)
+                pipe.execute()
+
+            return recebido
+
+        storage = get_storage("minio")
+        parte = (conn.get(chave_buffer) or b"") + chunk
+        upload_id = estado.get("upload_id")
+        partes: list[list] = json.loads(estado.get("partes", "[]"))
+
+        if final and upload_id is None:
+            # Arquivo menor que uma parte: um único PutObject
+            storage.put_object(
+                object_name=object_name,
+                data=io.BytesIO(parte),
+                length=len(parte),
+                content_type=content_type,
+            )
+            conn.delete(chave, chave_buffer)
+            return recebido
+
+        if upload_id is None:
+            upload_id = storage.create_multipart_upload(object_name, content_type)
+
+        part_number = len(partes) + 1
+        etag = storage.upload_part(object_name, upload_id, part_number, parte)
+        partes.append([part_number, etag])
+
+        if final:
+            storage.complete_multipart_upload(
+                object_name,
+                upload_id,
+                [Part(numero, etag_parte) for numero, etag_parte in partes],
+            )
+            conn.delete(chave, chave_buffer)
+            return recebido
+
+        with conn.pipeline() as pipe:
+            pipe.delete(chave_buffer)
+            pipe.hset(
+                chave,
+                mapping={
+                    "recebido": recebido,
+                    "upload_id": upload_id,
+                    "partes": json.dumps(partes),
+                },
+            )
+            pipe.expire(chave, UPLOAD_TTL)
+            pipe.execute()
+
+        return recebido
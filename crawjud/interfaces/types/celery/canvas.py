@@ -4,6 +4,9 @@ Este módulo define classes tipadas para resultados assíncronos,
 resultados imediatos (EagerResult) e assinaturas de tarefas (Signature),
 facilitando o uso de Celery com tipagem estática e integração com
 o sistema de tarefas assíncronas do projeto.
+
+A espera por resultados usa as notificações do backend (pub/sub no Redis)
+em vez de consultar o estado da tarefa em loop.
 """
 
 from __future__ import annotations
@@ -20,10 +23,14 @@ from typing import (
 )
 
 from celery.canvas import Signature as __Signature
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 from celery.result import AsyncResult as __AsyncResult
 from celery.result import states
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from threading import Event
+
     from crawjud.custom.celery import AsyncCelery
 
 P = ParamSpec("P")
@@ -33,6 +40,21 @@ TBotSpec = ParamSpec("TBotSpec", bound=AnyStr)
 
 class_set = set()
 
+# Intervalo (segundos) entre verificações do sinal de cancelamento da espera
+CANCEL_CHECK_INTERVAL = 0.5
+
+
+class _EsperaCanceladaError(Exception):
+    """Interrompe a espera por resultados quando o cancelamento é sinalizado."""
+
+
+def _verifica_cancelamento(cancel: Event | None) -> Callable[[], None]:
+    def on_interval() -> None:
+        if cancel is not None and cancel.is_set():
+            raise _EsperaCanceladaError
+
+    return on_interval
+
 
 class CeleryResult[T](__AsyncResult):
     """Celery Results.
@@ -142,29 +164,43 @@ class CeleryResult[T](__AsyncResult):
 
         return super().__getattr__(item)
 
-    def wait_ready(self, timeout: float | None = None) -> T:
+    def wait_ready(
+        self,
+        timeout: float | None = None,
+        cancel: Event | None = None,
+    ) -> T:
         """Aguarde até que o resultado da tarefa esteja pronto ou o timeout.
 
+        A espera é feita pelas notificações do backend de resultados, sem
+        consultar o estado da tarefa em loop.
+
         Args:
             timeout (float | None): Tempo máximo de espera em segundos,
                 ou None para aguardar indefinidamente.
+            cancel (Event | None): Evento que, quando sinalizado, interrompe
+                a espera.
 
         Returns:
             T: Resultado da tarefa se concluída com sucesso,
-                ou None em caso de falha ou expiração.
+                ou None em caso de falha, expiração ou cancelamento.
 
         """
-        while not self.ready():
-            if timeout is not None:
-                timeout -= 0.5
-                if timeout <= 0:
-                    return None
-            self._app.control.ping(timeout=0.5)
+        try:
+            result = self.get(
+                timeout=timeout,
+                interval=CANCEL_CHECK_INTERVAL,
+                on_interval=_verifica_cancelamento(cancel),
+                propagate=False,
+                disable_sync_subtasks=False,
+            )
+
+        except (CeleryTimeoutError, _EsperaCanceladaError):
+            return None
 
         if self.failed():
             return None
 
-        return self.result
+        return result
 
 
 class Signature[T](__Signature):
@@ -43,6 +43,9 @@ async def init_database() -> None:
     """Inicializa o banco de dados."""
     async with app.app_context():
         db.create_all()
+        # create_all não altera tabelas existentes: cria os índices novos
+        for index in Executions.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
 
         env = DatabaseInitEnvDict(**environ)
 
@@ -0,0 +1,56 @@
+"""Notify committed changes of models through ORM events.
+
+Mapper events mark the session while flushing; the notification runs only
+after the transaction commits, and the marks are dropped on rollback.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+
+def notify_after_commit(
+    key: str,
+    models: Iterable[type],
+    notify: Callable[[set[Hashable]], None],
+    mark: Callable[[object], Iterable[Hashable]] = lambda _target: (None,),
+) -> None:
+    """Call `notify` after commits that inserted, updated or deleted `models`.
+
+    Args:
+        key (str): Key of the marks in `Session.info`.
+        models (Iterable[type]): Mapped classes to watch.
+        notify (Callable[[set[Hashable]], None]): Called with the values
+            collected by `mark` during the committed transaction.
+        mark (Callable[[object], Iterable[Hashable]]): Values to collect for a
+            changed row; an empty iterable ignores the change.
+
+    """
+
+    def _mark(*args: object) -> None:
+        # Mapper events receive (mapper, connection, target)
+        target = args[-1]
+        session = object_session(target)
+        values = set(mark(target))
+        if session is not None and values:
+            session.info.setdefault(key, set()).update(values)
+
+    for model in models:
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, _mark)
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(session: Session) -> None:
+        values = session.info.pop(key, None)
+        if values:
+            notify(values)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(session: Session) -> None:
+        session.info.pop(key, None)
@@ -0,0 +1,143 @@
+"""Camada assíncrona do SQLAlchemy para as rotas e namespaces da API.
+
+As consultas feitas com `db.session` (Flask-SQLAlchemy) bloqueiam o event
+loop que também atende os WebSockets de logs. Este módulo cria, a partir do
+`SQLALCHEMY_DATABASE_URI`, um `AsyncEngine` com driver assíncrono e pool
+próprio, e sessões `AsyncSession` para uso nas rotas:
+
+    async with async_session() as session:
+        bots = (await session.scalars(select(BotsCrawJUD))).all()
+
+Os models são os mesmos de `crawjud.models`. Relacionamentos não podem ser
+carregados de forma preguiçosa em sessões assíncronas: use `selectinload` ou
+selecione as colunas necessárias.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import configure_mappers, selectinload
+
+from crawjud.api import app
+from crawjud.models.users import Users
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Driver assíncrono equivalente a cada driver síncrono suportado (os
+# drivers assíncronos são dependências do projeto: asyncpg e aiosqlite)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_engine_lock = Lock()
+
+
+def async_database_uri(uri: str) -> str:
+    """Converta a URI do banco para o driver assíncrono equivalente.
+
+    Args:
+        uri (str): URI do `SQLALCHEMY_DATABASE_URI`.
+
+    Returns:
+        str: URI com o driver assíncrono (URIs já assíncronas são mantidas).
+
+    """
+    url = make_url(uri)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Retorne o engine assíncrono da API, criado na primeira chamada.
+
+    O pool usa `SQLALCHEMY_ASYNC_POOL_SIZE`/`SQLALCHEMY_ASYNC_MAX_OVERFLOW` e
+    os mesmos timeout, reciclagem e pre-ping do engine síncrono. As conexões
+    são reutilizadas em ordem LIFO, o que deixa as excedentes ficarem ociosas
+    e serem recicladas.
+
+    Returns:
+        AsyncEngine: Engine compartilhado pelo processo.
+
+    """
+    global _engine, _sessionmaker  # noqa: PLW0603
+    with _engine_lock:
+        if _engine is None:
+            config = app.config
+            uri = async_database_uri(config["SQLALCHEMY_DATABASE_URI"])
+            options = {}
+            if not uri.startswith("sqlite"):
+                options = {
+                    "pool_size": config["SQLALCHEMY_ASYNC_POOL_SIZE"],
+                    "max_overflow": config["SQLALCHEMY_ASYNC_MAX_OVERFLOW"],
+                    "pool_timeout": config["SQLALCHEMY_POOL_TIMEOUT"],
+                    "pool_recycle": config["SQLALCHEMY_POOL_RECYCLE"],
+                    "pool_use_lifo": True,
+                }
+
+            _engine = create_async_engine(
+                uri,
+                pool_pre_ping=config["SQLALCHEMY_POOL_PRE_PING"],
+                **options,
+            )
+            _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False)
+            # Garante os backrefs (ex.: Users.supersu) usados nas consultas
+            configure_mappers()
+
+        return _engine
+
+
+@asynccontextmanager
+async def async_session() -> AsyncIterator[AsyncSession]:
+    """Abra uma sessão assíncrona, fechada (com rollback pendente) ao sair.
+
+    Yields:
+        AsyncSession: Sessão ligada ao engine assíncrono da API.
+
+    """
+    get_async_engine()
+    async with _sessionmaker() as session:
+        yield session
+
+
+async def get_user(session: AsyncSession, user_id: int) -> Users | None:
+    """Carregue o usuário com os vínculos de superusuário e administrador.
+
+    Args:
+        session (AsyncSession): Sessão assíncrona.
+        user_id (int): ID do usuário (identidade do JWT).
+
+    Returns:
+        Users | None: Usuário, com `supersu` e `admin` já carregados.
+
+    """
+    return await session.scalar(
+        select(Users)
+        .options(selectinload(Users.supersu), selectinload(Users.admin))
+        .where(Users.id == user_id),
+    )
+
+
+async def dispose_async_engine() -> None:
+    """Feche as conexões do pool do engine assíncrono."""
+    global _engine, _sessionmaker  # noqa: PLW0603
+    with _engine_lock:
+        engine, _engine, _sessionmaker = _engine, None, None
+
+    if engine is not None:
+        await engine.dispose()
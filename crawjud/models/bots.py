@@ -1,16 +1,32 @@
 """Defines database models for CrawJUD bots and their execution details.
 
 Provides structures for bot configurations, credentials, and execution logging.
+
+Committed changes to executions (new rows, status changes and removals) drop the
+cached dashboard charts of the affected licenses; committed changes to bots and
+credentials drop the cached catalog (see `crawjud.models.catalog`).
 """
 
-from collections.abc import Buffer
+from contextlib import suppress
 from datetime import datetime
 from typing import ClassVar
 from zoneinfo import ZoneInfo
 
+from sqlalchemy import inspect
+from sqlalchemy.orm import deferred
 from sqlalchemy.orm.relationships import RelationshipProperty
 
 from crawjud.api import db
+from crawjud.models._events import notify_after_commit
+from crawjud.utils.models.conexao import conexao_redis
+
+# Hash com os gráficos do dashboard em cache de uma licença; "all" guarda os
+# gráficos de todas as licenças (superusuários)
+DASHBOARD_CACHE_KEY = "crawjud:dashboard:{license_id}"
+
+# Hash com o catálogo de robôs e credenciais em cache de uma licença; "all"
+# guarda o catálogo sem filtro de licença
+CATALOG_CACHE_KEY = "crawjud:catalog:{license_id}"
 
 
 class BotsCrawJUD(db.Model):
@@ -67,7 +83,8 @@ class Credentials(db.Model):
     password: str = db.Column(db.String(length=45))
     key: str = db.Column(db.String(length=45))
     certficate: str = db.Column(db.String(length=45))
-    certficate_blob: Buffer = db.Column(db.LargeBinary(length=(2**32) - 1))
+    # Carregado apenas quando acessado: listagens não leem os certificados
+    certficate_blob = deferred(db.Column(db.LargeBinary(length=(2**32) - 1)))
 
     license_id: int = db.Column(db.Integer, db.ForeignKey("licenses_users.id"))
     license_usr = db.relationship(
@@ -96,7 +113,12 @@ class Executions(db.Model):
     """
 
     __tablename__ = "executions"
-    pid: str = db.Column(db.String(length=12), nullable=False)
+    # Listagem paginada por licença ou usuário, da execução mais recente
+    __table_args__ = (
+        db.Index("ix_executions_license_data", "license_id", "data_execucao"),
+        db.Index("ix_executions_user_data", "user_id", "data_execucao"),
+    )
+    pid: str = db.Column(db.String(length=12), nullable=False, index=True)
     id: int = db.Column(db.Integer, primary_key=True)
     status: str = db.Column(db.String(length=45), nullable=False)
     file_output: str = db.Column(db.String(length=512))
@@ -142,3 +164,62 @@ class ThreadBots(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     pid: str = db.Column(db.String(length=12), nullable=False)
     processID: str = db.Column(db.String(length=64), nullable=False)  # noqa: N815
+
+
+def notify_executions_change(license_ids: set[int | None] | None = None) -> None:
+    """Drop the cached dashboard charts of the given licenses.
+
+    Args:
+        license_ids (set[int | None] | None): Licenses whose executions changed;
+            None drops the charts of every license.
+
+    """
+    with suppress(Exception):
+        redis = conexao_redis()
+        if license_ids is None:
+            keys = list(redis.scan_iter(DASHBOARD_CACHE_KEY.format(license_id="*")))
+        else:
+            keys = [
+                DASHBOARD_CACHE_KEY.format(license_id=license_id)
+                for license_id in (*license_ids, "all")
+            ]
+
+        if keys:
+            redis.delete(*keys)
+
+
+def _executions_changed(target: Executions) -> tuple[int | None, ...]:
+    # Atualizações que não mudam o status não alteram os gráficos
+    state = inspect(target)
+    if state.persistent and not state.attrs.status.history.has_changes():
+        return ()
+
+    return (target.license_id,)
+
+
+def _catalog_changed(target: BotsCrawJUD | Credentials) -> tuple[int | str | None]:
+    # Robôs não pertencem a uma licença: alteram o catálogo de todas
+    if isinstance(target, BotsCrawJUD):
+        return ("all",)
+
+    return (target.license_id,)
+
+
+def _notify_catalog_change(license_ids: set[int | str | None]) -> None:
+    from crawjud.models.catalog import notify_catalog_change
+
+    notify_catalog_change(None if "all" in license_ids else license_ids)
+
+
+notify_after_commit(
+    "executions_changed",
+    (Executions,),
+    notify_executions_change,
+    _executions_changed,
+)
+notify_after_commit(
+    "catalog_changed",
+    (BotsCrawJUD, Credentials),
+    _notify_catalog_change,
+    _catalog_changed,
+)
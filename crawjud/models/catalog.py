@@ -0,0 +1,199 @@
+"""Catálogo de robôs, sistemas e credenciais em cache para a API.
+
+As listas usadas nos formulários (robôs, sistemas e opções de credenciais)
+são lidas a cada evento do Socket.IO e a cada requisição. Este módulo as
+mantém em dois níveis:
+
+- em memória no processo, por `CATALOG_LOCAL_TTL` segundos;
+- no Redis, por licença, por `CATALOG_CACHE_TTL` segundos.
+
+Alterações commitadas em `BotsCrawJUD` e `Credentials` chamam
+`notify_catalog_change`, que remove as entradas das licenças afetadas.
+As credenciais são consultadas apenas pelas colunas exibidas, nunca pelas
+senhas e certificados.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import suppress
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from crawjud.models.aio import async_session
+from crawjud.models.bots import CATALOG_CACHE_KEY, BotsCrawJUD, Credentials
+from crawjud.utils.models.conexao import conexao_redis
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Validade (segundos) do catálogo em cache no Redis
+CATALOG_CACHE_TTL = 300
+
+# Validade (segundos) do catálogo em memória; limita o tempo em que outros
+# processos da API servem uma versão anterior a uma alteração
+CATALOG_LOCAL_TTL = 10
+
+_local: dict[tuple[str, str], tuple[float, Any]] = {}
+_local_lock = Lock()
+
+
+async def bots_catalog() -> list[dict[str, Any]]:
+    """Retorne os robôs cadastrados, com todas as colunas.
+
+    Returns:
+        list[dict[str, Any]]: Dados dos robôs, ordenados pelo ID.
+
+    """
+    return await _cached("bots", None, _consultar_bots)
+
+
+async def systems_catalog() -> list[dict[str, Any]]:
+    """Retorne os sistemas dos robôs, cada um com o ID do primeiro robô.
+
+    Returns:
+        list[dict[str, Any]]: Itens com as chaves `id` e `system`.
+
+    """
+    return await _cached("systems", None, _consultar_sistemas)
+
+
+async def credentials_catalog(license_id: int | None) -> list[dict[str, Any]]:
+    """Retorne as credenciais da licença, sem senhas e certificados.
+
+    Args:
+        license_id (int | None): ID da licença; None retorna as credenciais
+            de todas as licenças.
+
+    Returns:
+        list[dict[str, Any]]: Itens com as chaves `id`, `nome_credencial`,
+            `system` e `login_method`.
+
+    """
+    return await _cached(
+        "credentials",
+        license_id,
+        lambda: _consultar_credenciais(license_id),
+    )
+
+
+def notify_catalog_change(license_ids: set[int | None] | None = None) -> None:
+    """Remova do cache o catálogo das licenças informadas.
+
+    Args:
+        license_ids (set[int | None] | None): Licenças cujas credenciais
+            mudaram; None remove o catálogo de todas as licenças (alteração
+            nos robôs).
+
+    """
+    with _local_lock:
+        if license_ids is None:
+            _local.clear()
+        else:
+            chaves = {_chave(license_id) for license_id in (*license_ids, None)}
+            for item in [item for item in _local if item[0] in chaves]:
+                del _local[item]
+
+    with suppress(Exception):
+        redis = conexao_redis()
+        if license_ids is None:
+            keys = list(redis.scan_iter(CATALOG_CACHE_KEY.format(license_id="*")))
+        else:
+            keys = [_chave(license_id) for license_id in (*license_ids, None)]
+
+        if keys:
+            redis.delete(*keys)
+
+
+def _chave(license_id: int | None) -> str:
+    return CATALOG_CACHE_KEY.format(
+        license_id="all" if license_id is None else license_id,
+    )
+
+
+async def _cached[T](
+    view: str,
+    license_id: int | None,
+    gerar: Callable[[], Awaitable[T]],
+) -> T:
+    item = (_chave(license_id), view)
+    with _local_lock:
+        local = _local.get(item)
+        if local is not None and local[0] > monotonic():
+            return local[1]
+
+    data = None
+    with suppress(Exception):
+        cached = await asyncio.to_thread(conexao_redis().hget, item[0], view)
+        if cached:
+            data = json.loads(cached)
+
+    if data is None:
+        data = await gerar()
+        with suppress(Exception):
+            await asyncio.to_thread(_gravar, item[0], view, data)
+
+    with _local_lock:
+        _local[item] = (monotonic() + CATALOG_LOCAL_TTL, data)
+
+    return data
+
+
+def _gravar(key: str, view: str, data: object) -> None:
+    # Executado em thread: o client Redis é síncrono
+    pipe = conexao_redis().pipeline(transaction=False)
+    pipe.hset(key, view, json.dumps(data))
+    pipe.expire(key, CATALOG_CACHE_TTL)
+    pipe.execute()
+
+
+async def _consultar_bots() -> list[dict[str, Any]]:
+    async with async_session() as session:
+        rows = (
+            await session.execute(
+                select(*BotsCrawJUD.__table__.columns).order_by(BotsCrawJUD.id),
+            )
+        ).all()
+
+    return [
+        {
+            k: v.decode("utf-8") if isinstance(v, bytes) else v
+            for k, v in row._asdict().items()
+        }
+        for row in rows
+    ]
+
+
+async def _consultar_sistemas() -> list[dict[str, Any]]:
+    async with async_session() as session:
+        rows = (
+            await session.execute(
+                select(BotsCrawJUD.id, BotsCrawJUD.system).order_by(BotsCrawJUD.id),
+            )
+        ).all()
+
+    sistemas: dict[str, int] = {}
+    for row in rows:
+        sistemas.setdefault(row.system, row.id)
+
+    return [{"id": id_, "system": system} for system, id_ in sistemas.items()]
+
+
+async def _consultar_credenciais(license_id: int | None) -> list[dict[str, Any]]:
+    query = select(
+        Credentials.id,
+        Credentials.nome_credencial,
+        Credentials.system,
+        Credentials.login_method,
+    ).order_by(Credentials.id)
+    if license_id is not None:
+        query = query.where(Credentials.license_id == license_id)
+
+    async with async_session() as session:
+        rows = (await session.execute(query)).all()
+
+    return [row._asdict() for row in rows]
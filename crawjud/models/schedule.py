@@ -1,17 +1,25 @@
 """Defines schedule-related models for the CrawJUD-Bots application.
 
 Includes scheduled jobs and their corresponding crontab configurations.
+
+Every committed change to these tables bumps a version counter in Redis, which
+lets the beat scheduler detect changes without re-reading the schedule table.
 """
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 from crawjud.api import db
+from crawjud.models._events import notify_after_commit
+from crawjud.utils.models.conexao import conexao_redis
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+SCHEDULE_VERSION_KEY = "crawjud:schedules:version"
+
 
 class ScheduleModel(db.Model):
     """Represents a scheduled job with execution details.
@@ -127,3 +135,26 @@ class CrontabModel(db.Model):
         self.day_of_week = day_of_week
         self.day_of_month = day_of_month
         self.month_of_year = month_of_year
+
+
+def schedule_version() -> int:
+    """Return the current version of the schedule tables.
+
+    Returns:
+        int: Version counter stored in Redis (0 if never changed).
+
+    """
+    return int(conexao_redis().get(SCHEDULE_VERSION_KEY) or 0)
+
+
+def notify_schedule_change() -> None:
+    """Bump the schedule version so the beat scheduler reloads its entries."""
+    with suppress(Exception):
+        conexao_redis().incr(SCHEDULE_VERSION_KEY)
+
+
+notify_after_commit(
+    "schedule_changed",
+    (ScheduleModel, CrontabModel),
+    lambda _changed: notify_schedule_change(),
+)
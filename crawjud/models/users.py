@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo
 
 import bcrypt
 from quart_jwt_extended import get_current_user
+from sqlalchemy.orm import deferred
 
 from crawjud.api import db, jwt
 
@@ -36,7 +37,10 @@ def check_if_token_revoked(jwt_data: dict, *args: str, **kwargs: object) -> bool
 
     """
     jti = jwt_data["jti"] or kwargs.get("jti") or args[0].get("jti")
-    token = db.session.query(TokenBlocklist.id).filter_by(jti=jti).scalar()
+    try:
+        token = db.session.query(TokenBlocklist.id).filter_by(jti=jti).scalar()
+    finally:
+        _liberar_conexao()
 
     return token is not None
 
@@ -51,7 +55,17 @@ def user_lookup_callback[T](*args: T) -> Users | None:
     """
     id_: int = args[0]
 
-    return db.session.query(Users).filter_by(id=id_).one_or_none()
+    try:
+        return db.session.query(Users).filter_by(id=id_).one_or_none()
+    finally:
+        _liberar_conexao()
+
+
+def _liberar_conexao() -> None:
+    # As rotas aguardam o banco assíncrono depois da verificação do JWT: com a
+    # transação aberta, cada requisição em andamento prenderia uma conexão do
+    # pool síncrono, e a próxima consulta bloquearia o event loop esperando
+    db.session.close()
 
 
 class TokenBlocklist(db.Model):
@@ -101,7 +115,8 @@ class Users(db.Model):
         default=str(uuid4()),
     )
     filename: str = db.Column(db.String(length=128))
-    blob_doc = db.Column(db.LargeBinary(length=(2**32) - 1))
+    # Carregado apenas quando acessado: consultas de usuários não leem o blob
+    blob_doc = deferred(db.Column(db.LargeBinary(length=(2**32) - 1)))
 
     licenseus_id: int = db.Column(db.Integer, db.ForeignKey("licenses_users.id"))
     licenseusr = db.relationship("LicensesUsers", backref="user")
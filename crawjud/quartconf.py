@@ -38,6 +38,10 @@ SQLALCHEMY_POOL_SIZE = int(
 # Número de conexões extras além da pool_size
 SQLALCHEMY_MAX_OVERFLOW = int(env.get("SQLALCHEMY_MAX_OVERFLOW", 10))
 
+# Pool do engine assíncrono usado pelas rotas e namespaces da API
+SQLALCHEMY_ASYNC_POOL_SIZE = int(env.get("SQLALCHEMY_ASYNC_POOL_SIZE", 20))
+SQLALCHEMY_ASYNC_MAX_OVERFLOW = int(env.get("SQLALCHEMY_ASYNC_MAX_OVERFLOW", 20))
+
 # Tempo de espera para obter uma conexão
 SQLALCHEMY_POOL_TIMEOUT = int(env.get("SQLALCHEMY_POOL_TIMEOUT", 30))
 
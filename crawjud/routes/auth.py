@@ -25,7 +25,6 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from traceback import format_exception
-from typing import TYPE_CHECKING
 
 from quart import (
     Blueprint,
@@ -45,13 +44,14 @@ from quart_jwt_extended import (
     unset_jwt_cookies,
 )
 
+from sqlalchemy import or_, select
+from sqlalchemy.orm import selectinload
+
 from crawjud.interfaces.session import CurrentUser, LicenseUserDict
+from crawjud.models.aio import async_session
 from crawjud.models.users import TokenBlocklist as TokenBlocklist
 from crawjud.models.users import Users
 
-if TYPE_CHECKING:
-    from flask_sqlalchemy import SQLAlchemy
-
 
 auth = Blueprint("auth", __name__)
 
@@ -87,7 +87,6 @@ async def login() -> Response:
 
     """
     try:
-        db: SQLAlchemy = current_app.extensions["sqlalchemy"]
         request_json: dict[str, str] = (
             await request.json or await request.form or await request.data
         )
@@ -108,13 +107,17 @@ async def login() -> Response:
         remember = request_json.get("remember_me")
         form = LoginForm(username, password, remember)
 
-        from sqlalchemy import or_
+        async with async_session() as db_session:
+            usr = await db_session.scalar(
+                select(Users)
+                .options(
+                    selectinload(Users.licenseusr),
+                    selectinload(Users.supersu),
+                    selectinload(Users.admin),
+                )
+                .where(or_(Users.login == form.login, Users.email == form.login)),
+            )
 
-        usr = (
-            db.session.query(Users)
-            .filter(or_(Users.login == form.login, Users.email == form.login))
-            .first()
-        )
         if usr and usr.check_password(form.password):
             is_admin = bool(usr.admin or usr.supersu)
 
@@ -2,15 +2,12 @@
 
 from __future__ import annotations
 
-import io
 import json
-import shutil
 import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self, TypedDict
 from uuid import uuid4
 
-import aiofiles
 import chardet
 from quart import (
     abort,
@@ -24,7 +21,7 @@ from crawjud.common.exceptions._form import LoadFormError
 from crawjud.interfaces.formbot import FormDict
 from crawjud.interfaces.session import SessionDict
 from crawjud.models.users import LicensesUsers
-from crawjud.utils.storage import Storage
+from crawjud.utils.storage.aio import get_async_storage
 
 if TYPE_CHECKING:
     from celery import Celery
@@ -153,29 +150,23 @@ class LoadForm:  # noqa: D101
 
     async def _files_task_kwargs(self, data: FormDict) -> tuple[str, str]:
         name_file_config = self.sid.upper()
-        json_file = self.upload_folder.joinpath(name_file_config).with_suffix(".json")
+        json_name = f"{name_file_config}.json"
 
-        self.upload_folder.mkdir(exist_ok=True, parents=True)
+        data.update({json_name: json_name})
 
-        data.update({json_file.name: json_file.name})
-
-        async with aiofiles.open(json_file, "wb") as f:
-            await f.write(bytes(json.dumps(data), encoding="utf-8"))
-
-        storage = Storage("minio")
         sid = getattr(session, "sid", None)
         sid_ = sid or uuid4().hex
 
-        dest_path = str(Path(sid_.upper()).joinpath(json_file.name).as_posix())
+        dest_path = str(Path(sid_.upper()).joinpath(json_name).as_posix())
 
-        async with aiofiles.open(json_file, "rb") as f:
-            byte_ = await f.read()
-            size_ = len(byte_)
-            storage.put_object(dest_path, io.BytesIO(byte_), length=size_)
-
-        shutil.rmtree(self.upload_folder)
+        # Enviado direto ao storage, sem arquivo temporário nem I/O no loop
+        await get_async_storage().put_object(
+            dest_path,
+            json.dumps(data).encode("utf-8"),
+            content_type="application/json",
+        )
 
-        return name_file_config, json_file.name
+        return name_file_config, json_name
 
     def _update_form_data(self, _data: FormData) -> dict:
         form_data = {}
@@ -8,13 +8,14 @@ Este módulo implementa:
 Retorna respostas JSON para operações de consulta e manipulação de credenciais.
 """
 
-from asyncio import iscoroutinefunction
+from __future__ import annotations
+
+import asyncio
 from pathlib import Path
 from traceback import format_exception
 from typing import TYPE_CHECKING, TypedDict
 
 import aiofiles
-from flask_sqlalchemy import SQLAlchemy
 from quart import (
     Blueprint,
     Response,
@@ -27,18 +28,25 @@ from quart import (
     session,
 )
 from quart import current_app as app
-from quart.datastructures import FileStorage
 from quart_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy import delete, select
 from werkzeug.utils import secure_filename
 
-from crawjud.api import db
 from crawjud.interfaces.credentials import CredendialsDict
 from crawjud.interfaces.session import SessionDict
 from crawjud.models import BotsCrawJUD, Credentials, LicensesUsers, Users
+from crawjud.models.aio import async_session
+from crawjud.models.catalog import (
+    credentials_catalog,
+    notify_catalog_change,
+    systems_catalog,
+)
 
 cred = Blueprint("creds", __name__)
 
 if TYPE_CHECKING:
+    from quart.datastructures import FileStorage
+    from sqlalchemy.ext.asyncio import AsyncSession
     from werkzeug.datastructures import MultiDict
 
 
@@ -68,28 +76,24 @@ class CredentialsForm(TypedDict):
     key: str
 
 
-def license_user(usr: int, db: SQLAlchemy) -> str:
-    """Recupera o token de licença associado ao usuário informado.
+async def license_user(usr: int, db_session: AsyncSession) -> LicensesUsers:
+    """Recupera a licença associada ao usuário informado.
 
     Args:
         usr (int): Identificador do usuário.
-        db (SQLAlchemy): Instância do banco de dados.
+        db_session (AsyncSession): Sessão assíncrona do banco de dados.
 
     Returns:
-        str: Token de licença do usuário consultado.
+        LicensesUsers: Licença do usuário consultado.
 
 
     """
-    query = (
-        db.session.query(LicensesUsers)
-        .select_from(Users)
-        .join(Users, LicensesUsers.user)
-        .filter(Users.id == usr)
-        .first()
+    return await db_session.scalar(
+        select(LicensesUsers)
+        .join(Users, Users.licenseus_id == LicensesUsers.id)
+        .where(Users.id == usr),
     )
 
-    return query.license_token
-
 
 @cred.get("/systems")
 @jwt_required
@@ -110,11 +114,10 @@ async def systems() -> Response:
         {"value": None, "text": "Escolha um sistema", "disabled": True},
     ]
 
-    for item in db.session.query(BotsCrawJUD).all():
-        if item.system not in [i["text"] for i in list_systems]:
-            list_systems.append({"value": item.id, "text": item.system})
-        else:
-            continue
+    list_systems.extend(
+        {"value": item["id"], "text": item["system"]}
+        for item in await systems_catalog()
+    )
     return await make_response(
         jsonify(systems=list_systems),
         200,
@@ -136,28 +139,22 @@ async def credentials() -> Response:
             k: v for k, v in session.items() if not k.startswith("_")
         })
         license_user = sess["license_object"]
-        license_token = license_user["license_token"]
-        query = (
-            db.session.query(Credentials)
-            .select_from(LicensesUsers)
-            .join(Credentials.license_usr)
-            .filter(LicensesUsers.license_token == license_token)
-            .all()
-        )
+        # Credenciais da licença em cache, sem senhas e certificados
+        query = await credentials_catalog(license_user["id"])
 
         credentials: list[CredendialsDict] = []
 
         for item in query:
             loginmethod = (
                 "Usuário/Senha"
-                if item.login_method == "pw"
+                if item["login_method"] == "pw"
                 else "Certificado difital"
             )
             credentials.append(
                 CredendialsDict(
-                    id=item.id,
-                    nome_credencial=item.nome_credencial,
-                    system=item.system,
+                    id=item["id"],
+                    nome_credencial=item["nome_credencial"],
+                    system=item["system"],
                     login_method=loginmethod,
                 ),
             )
@@ -197,8 +194,18 @@ async def cadastro() -> Response:
 
         if action_ and action_.upper() == "DELETE":
             cred_id = request_data.get("id")
-            db.session.query(Credentials).filter(Credentials.id == cred_id).delete()
-            db.session.commit()
+            async with async_session() as db_session:
+                license_id = await db_session.scalar(
+                    select(Credentials.license_id).where(Credentials.id == cred_id),
+                )
+                await db_session.execute(
+                    delete(Credentials).where(Credentials.id == cred_id),
+                )
+                await db_session.commit()
+
+            # Remoções em lote não passam pelos eventos dos models
+            await asyncio.to_thread(notify_catalog_change, {license_id})
+
             return await make_response(
                 jsonify(message="Credencial deletada com sucesso!"),
                 200,
@@ -206,12 +213,11 @@ async def cadastro() -> Response:
 
         form = CredentialsForm(**request_data)
 
-        def pw(form: CredentialsForm) -> None:
-            form["system"] = (
-                db.session.query(BotsCrawJUD)
-                .filter(BotsCrawJUD.system == form["system"])
-                .first()
-                .system
+        async def pw(form: CredentialsForm, db_session: AsyncSession) -> None:
+            form["system"] = await db_session.scalar(
+                select(BotsCrawJUD.system)
+                .where(BotsCrawJUD.system == form["system"])
+                .limit(1),
             )
             passwd = Credentials(
                 nome_credencial=form["nome_cred"],
@@ -220,20 +226,15 @@ async def cadastro() -> Response:
                 login=form["login"],
                 password=form["password"],
             )
-            licenseusr = LicensesUsers.query.filter(
-                LicensesUsers.license_token == license_user(get_jwt_identity(), db),
-            ).first()
-
-            passwd.license_usr = licenseusr
-            db.session.add(passwd)
-            db.session.commit()
-
-        async def cert(form: CredentialsForm) -> None:
-            form["system"] = (
-                db.session.query(BotsCrawJUD)
-                .filter(BotsCrawJUD.id == form["system"])
-                .first()
-                .system
+            licenseusr = await license_user(get_jwt_identity(), db_session)
+
+            passwd.license_id = licenseusr.id
+            db_session.add(passwd)
+            await db_session.commit()
+
+        async def cert(form: CredentialsForm, db_session: AsyncSession) -> None:
+            form["system"] = await db_session.scalar(
+                select(BotsCrawJUD.system).where(BotsCrawJUD.id == form["system"]),
             )
             temporarypath = current_app.config["TEMP_DIR"]
             filecert = form["cert"]
@@ -247,35 +248,30 @@ async def cadastro() -> Response:
             await filecert.save(cer_path)
 
             async with aiofiles.open(cer_path, "rb") as f:
-                certficate_blob = f.read()
-
-                passwd = Credentials(
-                    nome_credencial=form["nome_cred"],
-                    system=form["system"],
-                    login_method=form["auth_method"],
-                    login=form["doc_cert"],
-                    key=form["key"],
-                    certficate=secure_filename(filecert.filename),
-                    certficate_blob=await certficate_blob,
-                )
-                licenseusr = LicensesUsers.query.filter(
-                    LicensesUsers.license_token
-                    == license_user(get_jwt_identity(), db),
-                ).first()
+                certficate_blob = await f.read()
+
+            passwd = Credentials(
+                nome_credencial=form["nome_cred"],
+                system=form["system"],
+                login_method=form["auth_method"],
+                login=form["doc_cert"],
+                key=form["key"],
+                certficate=secure_filename(filecert.filename),
+                certficate_blob=certficate_blob,
+            )
+            licenseusr = await license_user(get_jwt_identity(), db_session)
 
-                passwd.license_usr = licenseusr
+            passwd.license_id = licenseusr.id
 
-                db.session.add(passwd)
-                db.session.commit()
+            db_session.add(passwd)
+            await db_session.commit()
 
         callables = {"cert": cert, "pw": pw}
 
         call_method = callables[form["auth_method"]]
 
-        if iscoroutinefunction(call_method):
-            await call_method(form)
-        else:
-            call_method(form)
+        async with async_session() as db_session:
+            await call_method(form, db_session)
 
         return await make_response(jsonify(message="Credencial salva com sucesso!"))
 
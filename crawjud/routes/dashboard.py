@@ -2,22 +2,36 @@
 
 This module provides endpoints for rendering the dashboard and for serving
 chart data for executions per month and most executed bots.
+
+The charts are aggregated by the database (one grouped query per chart) and
+cached in Redis per license until an execution of that license changes.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+from contextlib import suppress
 from traceback import format_exception
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from quart import Blueprint, Response, abort, current_app, jsonify, make_response
-from quart_jwt_extended import jwt_required
+from quart_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy import extract, func, select
 
-from crawjud.api import db
-from crawjud.models import Executions
+from crawjud.models import BotsCrawJUD, Executions
+from crawjud.models.aio import async_session, get_user
+from crawjud.models.bots import DASHBOARD_CACHE_KEY
 from crawjud.utils.colors import escurecer_cor, gerar_cor_base, rgb_to_hex
+from crawjud.utils.models.conexao import conexao_redis
+from crawjud.utils.models.metricas import BUCKETS_SEGUNDOS, histogramas
+from crawjud.utils.storage import pool_stats
 
 if TYPE_CHECKING:
-    from crawjud.models.bots import BotsCrawJUD
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import InstrumentedAttribute
 
 
 dash = Blueprint("dash", __name__)
@@ -37,6 +51,32 @@ LABELS = {
     "12": "Dezembro",
 }
 
+# Sistemas exibidos no gráfico por sistema, na ordem dos datasets
+SYSTEMS = ("PROJUDI", "PJE", "ESAJ", "ELAW", "CAIXA", "TJDF")
+
+SYSTEM_COLORS = {
+    "PROJUDI": {
+        "background_color": "#67277e",
+        "border_color": "#371442",
+    },
+    "PJE": {
+        "background_color": "#ca1a9d",
+        "border_color": "#ab1685",
+    },
+    "ESAJ": {
+        "background_color": "#59236c",
+        "border_color": "#4b1d5b",
+    },
+    "ELAW": {
+        "background_color": "#b67909",
+        "border_color": "#925607",
+    },
+}
+
+# Tempo de vida (segundos) dos gráficos em cache, caso uma execução seja
+# alterada fora do ORM
+DASHBOARD_CACHE_TTL = 300
+
 MONTHS_EXECUTED = {
     "Janeiro": 0,
     "Fevereiro": 0,
@@ -63,79 +103,12 @@ async def linechart_system() -> Response:
 
     """
     try:
-        executions = db.session.query(Executions).all()
-
-        contagem_execucoes = []
-
-        system_colors = {
-            "PROJUDI": {
-                "background_color": "#67277e",
-                "border_color": "#371442",
-            },
-            "PJE": {
-                "background_color": "#ca1a9d",
-                "border_color": "#ab1685",
-            },
-            "ESAJ": {
-                "background_color": "#59236c",
-                "border_color": "#4b1d5b",
-            },
-            "ELAW": {
-                "background_color": "#b67909",
-                "border_color": "#925607",
-            },
-        }
-
-        for system in ["PROJUDI", "PJE", "ESAJ", "ELAW", "CAIXA", "TJDF", "CAIXA"]:
-            executions_mes = MONTHS_EXECUTED.copy()
-            for item in executions:
-                exec_bot: BotsCrawJUD = item.bot
-
-                if exec_bot.system.upper() == system:
-                    mes = LABELS[str(item.data_execucao.month)]
-                    executions_mes[mes] += 1
-
-            contagem_execucoes.append({system: executions_mes})
-
-        data: dict[str, dict[str, str] | list[dict[str, str]]] = {
-            "labels": list(LABELS.values()),
-            "datasets": [],
-        }
-
-        for contagem in contagem_execucoes:
-            it = contagem.items()
-
-            for key, value in it:
-                numbers = list(value.values())
-
-                background_color = system_colors.get(key.upper(), {}).get(
-                    "background_color",
-                    "#000000",
-                )
-                border_color = system_colors.get(key.upper(), {}).get(
-                    "border_color",
-                    "#000000",
-                )
-                # Se não houver cor definida, gerar nova cor
-                if not system_colors.get(key.upper()):
-                    # Gerar cor base
-                    r, g, b = gerar_cor_base()
-                    background_color = rgb_to_hex(r, g, b)
-
-                    # Gerar cor da borda mais escura
-                    r_borda, g_borda, b_borda = escurecer_cor(r, g, b)
-                    border_color = rgb_to_hex(r_borda, g_borda, b_borda)
-
-                setup_dataset = {
-                    "label": key,
-                    "data": numbers,
-                    "borderColor": border_color,
-                    "backgroundColor": background_color,
-                    "yAxisID": "y",
-                }
-
-                data["datasets"].append(setup_dataset)
-
+        license_id = await _license_id()
+        data = await _cached_chart(
+            "linechart_system",
+            license_id,
+            lambda: _dataset_systems(license_id),
+        )
         return await make_response(jsonify(dataset=data))
     except (KeyError, AttributeError, ValueError) as e:
         current_app.logger.error("\n".join(format_exception(e)))
@@ -152,69 +125,82 @@ async def linechart_bot() -> Response:
 
     """
     try:
-        executions = db.session.query(Executions).all()
-        system_colors = {
-            "PROJUDI": {
-                "background_color": "#67277e",
-                "border_color": "#371442",
-            },
-            "PJE": {
-                "background_color": "#ca1a9d",
-                "border_color": "#ab1685",
-            },
-            "ESAJ": {
-                "background_color": "#59236c",
-                "border_color": "#4b1d5b",
-            },
-            "ELAW": {
-                "background_color": "#b67909",
-                "border_color": "#925607",
-            },
-        }
-        list_system: list[str] = []
-        # Identifique todos os bots únicos
-        for item in executions:
-            bot_exec: BotsCrawJUD = item.bot
-            if bot_exec.display_name.upper() not in list_system:
-                list_system.append(item.bot.display_name.upper())
-        # Contabilize execuções por bot
-        contagem_execucoes = contar_execucoes_por_bot(executions, list_system)
-        # Gere datasets para o gráfico
-        datasets = gerar_dataset_bot(contagem_execucoes, system_colors)
-        data: dict[str, dict[str, str] | list[dict[str, str]]] = {
-            "labels": list(LABELS.values()),
-            "datasets": datasets,
-        }
+        license_id = await _license_id()
+        data = await _cached_chart(
+            "linechart_bot",
+            license_id,
+            lambda: _dataset_bots(license_id),
+        )
         return await make_response(jsonify(dataset=data))
     except (KeyError, AttributeError, ValueError) as e:
         current_app.logger.error("\n".join(format_exception(e)))
         abort(500, "Erro ao gerar o gráfico de linha.")
 
 
-def contar_execucoes_por_bot(
-    executions: list[Executions],
-    bots: list[str],
-) -> list[dict[str, dict[str, int]]]:
-    """Contabilize execuções por bot para cada mês.
+@dash.get("/metricas")
+@jwt_required
+async def metricas() -> Response:
+    """Retorne os histogramas de latência e o uso do pool de conexões do storage.
+
+    As séries não são separadas por licença (cobrem todos os robôs e rotas),
+    por isso apenas superusuários têm acesso.
+
+    Returns:
+        Response: Objeto de resposta com os buckets (em segundos), as séries e
+            as estatísticas do pool de conexões do storage neste processo.
+
+    """
+    if await _license_id() is not None:
+        abort(403)
+
+    try:
+        return await make_response(
+            jsonify(
+                buckets=list(BUCKETS_SEGUNDOS),
+                series=await asyncio.to_thread(histogramas),
+                storage=pool_stats(),
+            ),
+        )
+
+    except Exception as e:
+        current_app.logger.error("\n".join(format_exception(e)))
+        abort(500, "Erro ao carregar as métricas dos robôs.")
+
+
+async def contar_execucoes_por_mes(
+    coluna: InstrumentedAttribute[str] | ColumnElement[str],
+    license_id: int | None,
+) -> dict[str, dict[str, int]]:
+    """Contabilize as execuções por mês, agrupadas pela coluna do bot, no banco.
 
     Args:
-        executions (list[Executions]): Lista de execuções.
-        bots (list[str]): Lista de nomes dos bots.
+        coluna (InstrumentedAttribute[str] | ColumnElement[str]): Coluna de
+            `BotsCrawJUD` usada no agrupamento (sistema ou nome do bot).
+        license_id (int | None): Licença das execuções; None considera todas.
 
     Returns:
-        list[dict[str, dict[str, int]]]: Lista de dicionários com execuções por bot.
+        dict[str, dict[str, int]]: Execuções por mês para cada valor da coluna.
 
     """
-    contagem_execucoes = []
-    for bot in bots:
-        executions_mes = MONTHS_EXECUTED.copy()
-        for item in executions:
-            exec_bot: BotsCrawJUD = item.bot
-            if exec_bot.display_name.upper() == bot:
-                mes = LABELS[str(item.data_execucao.month)]
-                executions_mes[mes] += 1
-        contagem_execucoes.append({bot: executions_mes})
-    return contagem_execucoes
+    mes = extract("month", Executions.data_execucao)
+    query = (
+        select(coluna, mes, func.count(Executions.id))
+        .join(BotsCrawJUD, Executions.bot_id == BotsCrawJUD.id)
+        .where(Executions.data_execucao.is_not(None))
+        .group_by(coluna, mes)
+    )
+    if license_id is not None:
+        query = query.where(Executions.license_id == license_id)
+
+    async with async_session() as session:
+        linhas = (await session.execute(query)).all()
+
+    contagem: dict[str, dict[str, int]] = {}
+    for nome, numero_mes, total in linhas:
+        executions_mes = contagem.setdefault(nome, MONTHS_EXECUTED.copy())
+        executions_mes[LABELS[str(int(numero_mes))]] += total
+
+    return contagem
 
 
 def gerar_dataset_bot(
@@ -259,3 +245,75 @@ def gerar_dataset_bot(
             }
             datasets.append(setup_dataset)
     return datasets
+
+
+async def _dataset_systems(license_id: int | None) -> dict[str, Any]:
+    contagem = await contar_execucoes_por_mes(
+        func.upper(BotsCrawJUD.system),
+        license_id,
+    )
+    contagem_execucoes = [
+        {system: contagem.get(system, MONTHS_EXECUTED.copy())} for system in SYSTEMS
+    ]
+    return {
+        "labels": list(LABELS.values()),
+        "datasets": gerar_dataset_bot(contagem_execucoes, SYSTEM_COLORS),
+    }
+
+
+async def _dataset_bots(license_id: int | None) -> dict[str, Any]:
+    contagem = await contar_execucoes_por_mes(
+        func.upper(BotsCrawJUD.display_name),
+        license_id,
+    )
+    contagem_execucoes = [{bot: contagem[bot]} for bot in sorted(contagem)]
+    return {
+        "labels": list(LABELS.values()),
+        "datasets": gerar_dataset_bot(contagem_execucoes, SYSTEM_COLORS),
+    }
+
+
+async def _license_id() -> int | None:
+    # Superusuários veem as execuções de todas as licenças
+    async with async_session() as session:
+        user = await get_user(session, get_jwt_identity())
+
+    if user is None:
+        abort(401)
+
+    if user.supersu:
+        return None
+
+    if user.licenseus_id is None:
+        abort(403)
+
+    return user.licenseus_id
+
+
+async def _cached_chart(
+    chart: str,
+    license_id: int | None,
+    gerar: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    # Gráficos em cache por licença; invalidados ao alterar execuções
+    key = DASHBOARD_CACHE_KEY.format(
+        license_id="all" if license_id is None else license_id,
+    )
+    with suppress(Exception):
+        cached = await asyncio.to_thread(conexao_redis().hget, key, chart)
+        if cached:
+            return json.loads(cached)
+
+    data = await gerar()
+    with suppress(Exception):
+        await asyncio.to_thread(_gravar_chart, key, chart, data)
+
+    return data
+
+
+def _gravar_chart(key: str, chart: str, data: dict[str, Any]) -> None:
+    # Executado em thread: o client Redis é síncrono
+    pipe = conexao_redis().pipeline(transaction=False)
+    pipe.hset(key, chart, json.dumps(data))
+    pipe.expire(key, DASHBOARD_CACHE_TTL)
+    pipe.execute()
@@ -1,12 +1,16 @@
 """Module for execution routes.
 
 This module provides endpoints for listing executions and downloading execution files.
+Execution outputs are downloaded straight from the storage through short-lived
+presigned URLs, or as a zip of the whole execution streamed on the fly.
 """
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
+from pathlib import PurePosixPath
 from traceback import format_exception
-from typing import TYPE_CHECKING
 
 from quart import (
     Blueprint,
@@ -15,72 +19,188 @@ from quart import (
     jsonify,
     make_response,
     render_template,
+    request,
 )
 from quart import current_app as app
 from quart_jwt_extended import (
     get_jwt_identity,
     jwt_required,
 )
+from sqlalchemy import delete, func, select
 
-from crawjud.api import db
-from crawjud.models import Executions, Users
+from crawjud.models import BotsCrawJUD, Executions, Users
 from crawjud.models import SuperUser as SuperUser
 from crawjud.models import admins as admins
-
-if TYPE_CHECKING:
-    from flask_sqlalchemy import SQLAlchemy
+from crawjud.models.aio import async_session, get_user
+from crawjud.models.bots import notify_executions_change
+from crawjud.utils.paginacao import filtro_chave, proximo_cursor
+from crawjud.utils.storage.aio import PRESIGNED_URL_TTL, get_async_storage
 
 exe = Blueprint("exe", __name__)
 
+# Tamanho padrão e máximo das páginas da listagem de execuções
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 
 @exe.get("/executions")
 @jwt_required
-def executions() -> Response:
-    """Display a list of executions filtered by search criteria.
+async def executions() -> Response:
+    """Display a page of executions filtered by search criteria.
+
+    Query parameters:
+        limit: page size (default 50, at most 200).
+        cursor: ``next_cursor`` of the previous page.
+        status, user_id: exact filters.
+        start, end: ISO dates bounding ``data_execucao`` (end is exclusive).
+
+    Executions are listed from the most recent, paginated by key
+    (``data_execucao``, ``id``), and filtered in the database. Executions
+    without ``data_execucao`` have no key and are not listed. The total is
+    only counted on the first page.
 
     Returns:
-        Response: A Quart response rendering the executions page.
+        Response: JSON with the executions, the next cursor and the total.
 
     """
     try:
         current_user = get_jwt_identity()
+        args = request.args
+
+        limit = min(int(args.get("limit", PAGE_SIZE)), MAX_PAGE_SIZE)
+        query = (
+            select(
+                Executions.id,
+                Executions.pid,
+                Executions.arquivo_xlsx,
+                Executions.data_execucao,
+                Executions.status,
+                Executions.data_finalizacao,
+                Executions.file_output,
+                Users.nome_usuario,
+                BotsCrawJUD.display_name,
+            )
+            .outerjoin(Users, Executions.user_id == Users.id)
+            .outerjoin(BotsCrawJUD, Executions.bot_id == BotsCrawJUD.id)
+        )
 
-        executions = db.session.query(Executions).all()
-        user = db.session.query(Users).filter(Users.id == current_user).first()
+        async with async_session() as db_session:
+            user = await get_user(db_session, current_user)
+            if not user.supersu:
+                query = query.where(Executions.license_id == user.licenseus_id)
+                if not user.admin:
+                    query = query.where(Executions.user_id == current_user)
 
-        if not user.supersu:
-            executions = list(
-                filter(
-                    lambda x: str(x.license_usr.license_token)
-                    == str(user.licenseusr.license_token),
-                    executions,
-                ),
+            if args.get("user_id"):
+                query = query.where(Executions.user_id == int(args["user_id"]))
+
+            if args.get("status"):
+                query = query.where(Executions.status == args["status"])
+
+            if args.get("start"):
+                start = datetime.fromisoformat(args["start"])
+                query = query.where(Executions.data_execucao >= start)
+
+            if args.get("end"):
+                end = datetime.fromisoformat(args["end"])
+                query = query.where(Executions.data_execucao < end)
+
+            total = None
+            cursor = args.get("cursor")
+            query = query.where(
+                *filtro_chave(Executions.data_execucao, Executions.id, cursor),
             )
+            if not cursor:
+                total = await db_session.scalar(
+                    select(func.count()).select_from(query.subquery()),
+                )
 
-            if not user.admin:
-                executions = list(
-                    filter(lambda x: x.user.id == current_user, executions),
+            rows = (
+                await db_session.execute(
+                    query.order_by(
+                        Executions.data_execucao.desc(),
+                        Executions.id.desc(),
+                    ).limit(limit + 1),
                 )
+            ).all()
+
+        rows, next_cursor = proximo_cursor(rows, limit, "data_execucao")
 
         data = [
             {
-                "pid": item.pid,
-                "user": item.user.nome_usuario,
-                "botname": item.bot.display_name,
-                "xlsx": item.arquivo_xlsx,
-                "start_date": item.data_execucao,
-                "status": item.status,
-                "stop_date": item.data_finalizacao,
-                "file_output": item.file_output,
+                "pid": row.pid,
+                "user": row.nome_usuario,
+                "botname": row.display_name,
+                "xlsx": row.arquivo_xlsx,
+                "start_date": row.data_execucao,
+                "status": row.status,
+                "stop_date": row.data_finalizacao,
+                "file_output": row.file_output,
             }
-            for item in executions
+            for row in rows
         ]
 
-        return jsonify(data=data)
+        return jsonify(data=data, next_cursor=next_cursor, total=total)
 
     except ValueError as e:
         app.logger.error("\n".join(format_exception(e)))
-        abort(500)
+        abort(400)
+
+
+@exe.get("/executions/<pid>/presigned_url")
+@jwt_required
+async def presigned_url(pid: str) -> Response:
+    """Issue a short-lived presigned URL for one output file of the execution.
+
+    The file name comes from the ``file`` query parameter, relative to the
+    execution folder (``<pid>/``) in the bucket.
+
+    Args:
+        pid (str): Execution identifier.
+
+    Returns:
+        Response: JSON with the URL and its lifetime in seconds.
+
+    """
+    execution = await _authorized_execution(pid)
+    file_name = request.args.get("file", "")
+    parts = PurePosixPath(file_name).parts
+    if not parts or ".." in parts or file_name.startswith("/"):
+        abort(400)
+
+    url = await get_async_storage().presigned_get_object(
+        f"{execution.pid}/{file_name}",
+        filename=parts[-1],
+    )
+    return jsonify(url=url, expires=int(PRESIGNED_URL_TTL.total_seconds()))
+
+
+@exe.get("/executions/<pid>/download")
+@jwt_required
+async def download_execution(pid: str) -> Response:
+    """Stream a zip with every output file of the execution.
+
+    The zip is built while it is sent, straight from the storage, without
+    temporary files and with constant memory.
+
+    Args:
+        pid (str): Execution identifier.
+
+    Returns:
+        Response: Streaming response with the zip file.
+
+    """
+    execution = await _authorized_execution(pid)
+    response = Response(
+        get_async_storage().stream_zip(execution.pid),
+        mimetype="application/zip",
+    )
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="{execution.pid}.zip"'
+    )
+    # Large batches take longer than the default response timeout
+    response.timeout = None
+    return response
 
 
 @exe.post("/clear_executions")
@@ -93,11 +213,14 @@ async def clear_executions() -> Response:
 
     """
     try:
-        db: SQLAlchemy = app.extensions["sqlalchemy"]
-        db.session.query(Executions).filter(
-            Executions.status == "Finalizado",
-        ).delete()
-        db.session.commit()
+        async with async_session() as db_session:
+            await db_session.execute(
+                delete(Executions).where(Executions.status == "Finalizado"),
+            )
+            await db_session.commit()
+
+        # Remoções em lote não disparam os eventos do ORM
+        await asyncio.to_thread(notify_executions_change)
 
     except ValueError as e:
         app.logger.error("\n".join(format_exception(e)))
@@ -111,3 +234,24 @@ async def clear_executions() -> Response:
             message=message,
         ),
     )
+
+
+async def _authorized_execution(pid: str) -> Executions:
+    # Same visibility rules as the executions list
+    current_user = get_jwt_identity()
+    async with async_session() as db_session:
+        execution = await db_session.scalar(
+            select(Executions).where(Executions.pid == pid),
+        )
+        user = await get_user(db_session, current_user)
+
+    if execution is None:
+        abort(404)
+
+    if not user.supersu and (
+        execution.license_id != user.licenseus_id
+        or (not user.admin and execution.user_id != current_user)
+    ):
+        abort(403)
+
+    return execution
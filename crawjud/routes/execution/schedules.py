@@ -3,20 +3,19 @@
 from __future__ import annotations
 
 from traceback import format_exception
-from typing import TYPE_CHECKING
 
 from quart import Response, abort, make_response, render_template, session
 from quart import current_app as app
 from quart_jwt_extended import jwt_required
-from sqlalchemy.orm import aliased
+from sqlalchemy import delete, select
+from sqlalchemy.orm import selectinload
 
-from crawjud.models import ScheduleModel, SuperUser, Users, admins
+from crawjud.models import ScheduleModel, Users
+from crawjud.models.aio import async_session
+from crawjud.models.schedule import notify_schedule_change
 
 from . import exe
 
-if TYPE_CHECKING:
-    from flask_sqlalchemy import SQLAlchemy
-
 
 @exe.get("/schedules")
 @jwt_required
@@ -28,44 +27,32 @@ async def schedules() -> Response:
 
     """
     try:
-        db: SQLAlchemy = app.extensions["sqlalchemy"]
-
-        chksupersu = (
-            db.session.query(SuperUser)
-            .select_from(Users)
-            .join(Users.supersu)
-            .filter(Users.login == session["login"])
-            .first()
-        )
-
-        executions = db.session.query(ScheduleModel)
-
-        if not chksupersu:
-            alias = aliased(
-                Users,
-                (
-                    db.session.query(Users)
-                    .filter(Users.login == session["login"])
-                    .subquery()
-                ),
+        async with async_session() as db_session:
+            user = await db_session.scalar(
+                select(Users)
+                .options(selectinload(Users.supersu), selectinload(Users.admin))
+                .where(Users.login == session["login"]),
             )
 
-            executions = executions.join(
-                alias,
-                ScheduleModel.license_id == alias.licenseus_id,
+            # Relacionamentos exibidos na página carregados na mesma sessão
+            query = select(ScheduleModel).options(
+                selectinload(ScheduleModel.schedule),
+                selectinload(ScheduleModel.user),
+                selectinload(ScheduleModel.license_usr),
+                selectinload(ScheduleModel.exec),
             )
 
-            chk_admin = (
-                db.session.query(admins)
-                .join(alias, admins.c.users_id == alias.id)
-                .filter(admins.c.license_user_id == alias.licenseus_id)
-                .first()
-            )
+            if not user.supersu:
+                query = query.where(ScheduleModel.license_id == user.licenseus_id)
+
+                chk_admin = any(
+                    license_.id == user.licenseus_id for license_ in user.admin
+                )
+                if not chk_admin:
+                    query = query.where(ScheduleModel.user_id == user.id)
 
-            if not chk_admin:
-                executions = executions.join(alias, ScheduleModel.user_id == alias.id)
+            database = (await db_session.scalars(query)).all()
 
-        database = executions.all()
         title = "Execuções"
         page = "schedules.html"
         return await make_response(
@@ -95,9 +82,14 @@ async def delete_schedule(id_: int) -> Response:
 
     """
     try:
-        db: SQLAlchemy = app.extensions["sqlalchemy"]
-        db.session.query(ScheduleModel).filter(ScheduleModel.id == id_).delete()
-        db.session.commit()
+        async with async_session() as db_session:
+            await db_session.execute(
+                delete(ScheduleModel).where(ScheduleModel.id == id_),
+            )
+            await db_session.commit()
+
+        # Exclusão em massa não dispara eventos do mapper
+        notify_schedule_change()
     except ValueError:
         abort(500)
 
@@ -1,14 +1,14 @@
 """Socket.IO namespace for notification events and management."""
 
+from quart import session
 from quart_socketio import Namespace
 
-from crawjud.api import db
 from crawjud.decorators.api import verify_jwt_websocket
 from crawjud.interfaces import ASyncServerType
 from crawjud.interfaces.credentials import (
     CredendialDictSelect,
 )
-from crawjud.models.bots import BotsCrawJUD, Credentials
+from crawjud.models.catalog import bots_catalog, credentials_catalog
 
 
 class BotsNamespace(Namespace):
@@ -51,25 +51,8 @@ class BotsNamespace(Namespace):
             Nenhuma exceção explícita.
 
         """
-        # Example: send a list of bots to all connected clients
-
-        bots = []
-
-        def decode_str(v: str | bytes) -> str:
-            if isinstance(v, bytes):
-                v = v.decode("utf-8")
-
-            return v
-
-        for bot in db.session.query(BotsCrawJUD).all():
-            bot_data = {
-                k: decode_str(v)
-                for k, v in bot.__dict__.items()
-                if not k.startswith("_")
-            }
-            bots.append(bot_data)
-
-        return bots
+        # Catálogo em cache, invalidado ao alterar os robôs
+        return [dict(bot) for bot in await bots_catalog()]
 
     @verify_jwt_websocket
     async def on_bot_credentials_select(
@@ -88,8 +71,6 @@ class BotsNamespace(Namespace):
             Nenhuma exceção explícita.
 
         """
-        query = db.session.query(Credentials).all()
-
         # Inicializa o dicionário de credenciais com opções padrão para cada sistema
         sistemas = ["elaw", "esaj", "projudi", "pje"]
         credentials = {
@@ -103,12 +84,24 @@ class BotsNamespace(Namespace):
             for sistema in sistemas
         }
 
+        # Sem licença na sessão, retorna apenas as opções padrão: consultar
+        # o catálogo sem licença traria as credenciais de todas as licenças
+        license_id = (session.get("license_object") or {}).get("id")
+        if license_id is None:
+            return credentials
+
+        # Credenciais da licença do usuário, em cache (sem senhas e certificados)
+        query = await credentials_catalog(license_id)
+
         # Adiciona as credenciais consultadas ao dicionário correspondente
         for item in query:
-            sistema = item.system.lower()
+            sistema = item["system"].lower()
             if sistema in credentials:
                 credentials[sistema].append(
-                    CredendialDictSelect(value=item.id, text=item.nome_credencial),
+                    CredendialDictSelect(
+                        value=item["id"],
+                        text=item["nome_credencial"],
+                    ),
                 )
 
         return credentials
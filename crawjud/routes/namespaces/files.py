@@ -2,6 +2,7 @@
 
 import shutil
 from pathlib import Path
+from time import perf_counter
 from typing import AnyStr
 
 from quart import session
@@ -10,6 +11,7 @@ from tqdm import tqdm
 
 from crawjud.interfaces import ASyncServerType
 from crawjud.interfaces.controllers.file_service import FileService
+from crawjud.utils.models.metricas import agendar_latencia
 
 
 class FileNamespaces(Namespace):
@@ -24,18 +26,27 @@ class FileNamespaces(Namespace):
         self.namespace = namespace
         self.file_service = FileService()
 
-    async def on_add_file(self) -> None:
+    async def on_add_file(self) -> int | None:
         """Handle file upload event from a client (e.g., FormBot).
 
-        Receives file data, constructs an UploadableFile, and saves it asynchronously
-        to a temporary directory.
+        Receives a file chunk and sends the completed parts to the storage. The
+        acknowledgement carries the bytes already received, so an interrupted
+        upload resumes from that offset.
 
         Args:
             sid: The session ID of the client.
             data: Dictionary containing file data and a temporary ID ('id_temp').
 
+        Returns:
+            int | None: Bytes of the file already received by the server.
+
         """
-        await self.file_service.save_file()
+        started = perf_counter()
+        try:
+            return await self.file_service.save_file()
+
+        finally:
+            agendar_latencia("api", "files", "add_file", perf_counter() - started)
 
     async def on_connect(self) -> None:
         """Handle client connection event.
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import traceback
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, ClassVar
 
 from quart import request, session
 from quart_socketio import Namespace
@@ -11,10 +13,14 @@ from tqdm import tqdm
 
 from crawjud.utils.interfaces import ItemMessageList
 from crawjud.utils.models.logs import MessageLog, MessageLogDict
+from crawjud.utils.models.metricas import resumo_execucao
 
 if TYPE_CHECKING:
     from crawjud.interfaces import ASyncServerType
 
+# Intervalo mínimo (em segundos) entre atualizações do resumo de etapas
+INTERVALO_RESUMO = 10.0
+
 
 class LogsNamespace[T](Namespace):
     """Gerencia eventos de logs em tempo real via WebSocket.
@@ -30,6 +36,7 @@ class LogsNamespace[T](Namespace):
 
     namespace: str
     server: ASyncServerType
+    _resumo_atualizado: ClassVar[dict[str, float]] = {}
 
     async def on_connect(self) -> None:
         """Manipula o evento de conexão de um cliente ao namespace."""
@@ -133,6 +140,20 @@ class LogsNamespace[T](Namespace):
 
         return message
 
+    def _atualizar_resumo(self, pid: str, status: str | None) -> bool:
+        # O resumo consulta o Redis; só é recalculado a cada INTERVALO_RESUMO
+        # segundos e, sempre, na mensagem que encerra a execução
+        agora = monotonic()
+        if status and status != "Em Execução":
+            self._resumo_atualizado.pop(pid, None)
+            return True
+
+        if agora - self._resumo_atualizado.get(pid, float("-inf")) < INTERVALO_RESUMO:
+            return False
+
+        self._resumo_atualizado[pid] = agora
+        return True
+
     async def log_redis(
         self,
         pid: str,
@@ -199,6 +220,13 @@ class LogsNamespace[T](Namespace):
                 ),
             )
 
+        # Resumo das latências por etapa registradas pelo robô
+        if self._atualizar_resumo(pid, updated_msg.get("status")):
+            updated_msg["resumo_etapas"] = await asyncio.to_thread(
+                resumo_execucao,
+                pid,
+            )
+
         # Atualiza o log no banco de dados
         log.update(**updated_msg)
 
@@ -11,7 +11,7 @@ from werkzeug.utils import secure_filename
 from crawjud.custom.task import ContextTask
 from crawjud.decorators import shared_task
 from crawjud.utils.models.logs import CachedExecution
-from crawjud.utils.storage import Storage
+from crawjud.utils.storage import get_storage
 
 workdir_path = Path(__file__).cwd()
 
@@ -57,8 +57,9 @@ class SaveSuccessTask(ContextTask):
         for item in data_query_:
             list_data.extend(item.data)
 
-        storage = Storage("minio")
-        path_planilha = workdir_path.joinpath("temp", pid, filename)
+        storage = get_storage("minio")
+        path_resultados = workdir_path.joinpath("temp", "resultados", pid)
+        path_planilha = path_resultados.joinpath(secure_filename(filename))
 
         path_planilha.parent.mkdir(exist_ok=True, parents=True)
         df = pd.DataFrame(list_data)
@@ -66,5 +67,5 @@ class SaveSuccessTask(ContextTask):
         with pd.ExcelWriter(path_planilha, engine="openpyxl") as writter:
             df.to_excel(excel_writer=writter, index=False, sheet_name="Resultados")
 
-        file_name = secure_filename(path_planilha.name)
-        storage.upload_file(f"{pid}/{file_name}", path_planilha)
+        # Envia a pasta de resultados da execução para `<pid>/` no bucket
+        storage.upload_directory(path_resultados, prefix=pid)
@@ -13,6 +13,7 @@ from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot
+from crawjud.utils.webdriver.etapas import Etapas
 
 
 class EsajAuth(ESajBot):
@@ -23,10 +24,11 @@ class EsajAuth(ESajBot):
             filter(lambda x: x not in string.punctuation, self.username),
         )
         passuser = self.password
+        etapas = Etapas(self.driver, site="esaj")
         if self.login_method == "cert":
             self.driver.get(self.elements.url_login_cert)
-            sleep(3)
-            loginopt = self.wait.until(
+            loginopt = etapas.aguardar(
+                "login_certificado",
                 ec.presence_of_element_located((
                     By.CSS_SELECTOR,
                     'select[id="certificados"]',
@@ -81,11 +83,13 @@ class EsajAuth(ESajBot):
             return checkloged is not None
 
         self.driver.get(self.elements.url_login)
-        sleep(3)
 
-        userlogin = self.driver.find_element(
-            By.CSS_SELECTOR,
-            self.elements.campo_username,
+        userlogin = etapas.aguardar(
+            "login",
+            ec.element_to_be_clickable((
+                By.CSS_SELECTOR,
+                self.elements.campo_username,
+            )),
         )
         userlogin.click()
         userlogin.send_keys(loginuser)
@@ -101,7 +105,6 @@ class EsajAuth(ESajBot):
             self.elements.btn_entrar,
         )
         entrar.click()
-        sleep(2)
 
         checkloged = None
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from time import sleep
 from typing import TYPE_CHECKING
 
 from selenium.common.exceptions import TimeoutException
@@ -13,6 +12,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from crawjud.common.exceptions.bot import LoginSystemError
 from crawjud.interfaces.controllers.bots.systems.projudi import ProjudiBot
+from crawjud.utils.webdriver.etapas import Etapas
 
 if TYPE_CHECKING:
     from selenium.webdriver.common.alert import Alert
@@ -27,7 +27,11 @@ class ProjudiAuth(ProjudiBot):
         try:
             self.driver.get(self.elements.url_login)
 
-            sleep(1.5)
+            Etapas(self.driver, site="projudi").aguardar(
+                "pagina_login",
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete",
+            )
 
             self.driver.refresh()
 
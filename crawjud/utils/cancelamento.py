@@ -0,0 +1,150 @@
+"""Controle cooperativo de cancelamento das execuções dos robôs.
+
+Este módulo fornece o TokenCancelamento, compartilhado entre o robô, as
+threads de busca e os downloads. Quando a parada é solicitada, o token:
+- sinaliza as esperas (captcha, sleeps, resultados de subtasks);
+- executa os callbacks registrados (cancelar futures, fechar respostas em
+  streaming, encerrar navegadores);
+- registra quanto tempo a execução levou para efetivamente parar.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, suppress
+from threading import Event, Lock
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from tqdm import tqdm
+
+from crawjud.common.exceptions.bot import ExecucaoCanceladaError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+# Tempo máximo (segundos) aguardado pelas threads após a solicitação de parada
+TEMPO_LIMITE_PARADA = 30
+
+
+class TokenCancelamento:
+    """Propague a solicitação de parada para o trabalho em andamento do robô."""
+
+    def __init__(self) -> None:
+        """Inicialize o token sem cancelamento solicitado."""
+        self._evento = Event()
+        self._lock = Lock()
+        self._callbacks: dict[int, Callable[[], object]] = {}
+        self._proximo_id = 0
+        self._solicitado_em: float | None = None
+
+    @property
+    def evento(self) -> Event:
+        """Evento sinalizado quando a parada é solicitada."""
+        return self._evento
+
+    @property
+    def cancelado(self) -> bool:
+        """Indica se a parada da execução foi solicitada."""
+        return self._evento.is_set()
+
+    def cancelar(self) -> None:
+        """Solicite a parada e execute os callbacks de liberação registrados."""
+        with self._lock:
+            if self._evento.is_set():
+                return
+
+            self._solicitado_em = monotonic()
+            self._evento.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            with suppress(Exception):
+                callback()
+
+    def verificar(self) -> None:
+        """Interrompa o fluxo atual caso a parada tenha sido solicitada.
+
+        Raises:
+            ExecucaoCanceladaError: Se o cancelamento foi solicitado.
+
+        """
+        if self._evento.is_set():
+            raise ExecucaoCanceladaError
+
+    def aguardar(self, segundos: float) -> None:
+        """Aguarde o tempo informado, retornando antes caso a parada seja solicitada.
+
+        Args:
+            segundos (float): Tempo de espera em segundos.
+
+        Raises:
+            ExecucaoCanceladaError: Se o cancelamento foi solicitado.
+
+        """
+        self._evento.wait(segundos)
+        self.verificar()
+
+    def tempo_restante(self) -> float | None:
+        """Retorne o tempo restante para a parada dentro do limite permitido.
+
+        Returns:
+            float | None: Segundos restantes até `TEMPO_LIMITE_PARADA`, ou None
+                se a parada não foi solicitada.
+
+        """
+        if self._solicitado_em is None:
+            return None
+
+        return max(TEMPO_LIMITE_PARADA - (monotonic() - self._solicitado_em), 0)
+
+    def duracao_parada(self) -> float | None:
+        """Retorne os segundos decorridos desde a solicitação de parada.
+
+        Returns:
+            float | None: Duração da parada, ou None se não foi solicitada.
+
+        """
+        if self._solicitado_em is None:
+            return None
+
+        return monotonic() - self._solicitado_em
+
+    @contextmanager
+    def ao_cancelar(self, callback: Callable[[], object]) -> Generator[None]:
+        """Registre um callback de liberação enquanto o bloco estiver ativo.
+
+        Se a parada já tiver sido solicitada, o callback é executado
+        imediatamente.
+
+        Args:
+            callback (Callable[[], object]): Função que libera o recurso
+                (ex.: `response.close`, `driver.quit`).
+
+        Yields:
+            None: Controle para o bloco que utiliza o recurso.
+
+        """
+        with self._lock:
+            id_callback = self._proximo_id
+            self._proximo_id += 1
+            if not self._evento.is_set():
+                self._callbacks[id_callback] = callback
+                callback = None
+
+        if callback is not None:
+            with suppress(Exception):
+                callback()
+
+        try:
+            yield
+
+        finally:
+            with self._lock:
+                self._callbacks.pop(id_callback, None)
+
+    def registrar_parada(self) -> None:
+        """Registre no log quanto tempo a execução levou para parar."""
+        duracao = self.duracao_parada()
+        if duracao is not None:
+            tqdm.write(f"Execução interrompida em {duracao:.2f} segundos")
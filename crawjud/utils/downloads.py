@@ -0,0 +1,241 @@
+"""Aguarde a conclusão de downloads do navegador por eventos do sistema de arquivos.
+
+Este módulo fornece:
+- aguardar_download: retorna o caminho do arquivo assim que o download termina
+  (arquivos parciais `.crdownload`/`.part` e arquivos anteriores à espera são
+  ignorados), opcionalmente movendo-o para o destino final;
+- enviar_ao_storage: envia o arquivo baixado ao storage e remove a cópia local.
+
+No Linux os eventos vêm do inotify (`IN_CLOSE_WRITE`/`IN_MOVED_TO`), sem
+consultas periódicas ao diretório; nos demais sistemas, ou se o inotify não
+estiver disponível, o diretório é verificado em intervalos curtos.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import struct
+from contextlib import suppress
+from pathlib import Path
+from time import monotonic, sleep, time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from crawjud.utils.storage import Storage
+
+# Timeout padrão (segundos) para a conclusão de um download
+TIMEOUT_DOWNLOAD = 600
+
+# Intervalo (segundos) da verificação do diretório sem inotify
+INTERVALO_POLLING = 0.2
+
+# Intervalo (segundos) entre as varreduras das subpastas com inotify ativo
+INTERVALO_VARREDURA = 1.0
+
+# Folga (segundos) na comparação do mtime com o início da espera: o relógio
+# do sistema de arquivos pode ficar alguns milissegundos atrás de `time()`
+FOLGA_MTIME = 0.05
+
+# Extensões de arquivos ainda em download (Chrome, Firefox e temporários)
+EXTENSOES_PARCIAIS = (".crdownload", ".part", ".tmp")
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_EVENTO_INOTIFY = struct.Struct("iIII")
+_TAMANHO_LEITURA = 64 * 1024
+
+type Correspondencia = str | Callable[[str], bool]
+
+
+def aguardar_download(
+    diretorio: str | Path,
+    arquivo: Correspondencia,
+    timeout: float = TIMEOUT_DOWNLOAD,
+    destino: str | Path | None = None,
+    desde: float | None = None,
+) -> Path | None:
+    """Aguarde o download do arquivo ser concluído no diretório.
+
+    Só são considerados arquivos modificados a partir de `desde`: documentos
+    antigos do diretório (e das subpastas) com nomes parecidos são ignorados.
+    Passe o instante do clique de download para aceitar também um download
+    concluído antes da chamada.
+
+    Args:
+        diretorio (str | Path): Diretório de downloads do navegador.
+        arquivo (Correspondencia): Nome do arquivo ou função que recebe o nome
+            e retorna True para o arquivo esperado.
+        timeout (float): Tempo máximo de espera em segundos.
+        destino (str | Path | None): Caminho para onde mover o arquivo.
+        desde (float | None): Instante (`time.time()`) a partir do qual os
+            arquivos são aceitos (padrão: o momento da chamada).
+
+    Returns:
+        Path | None: Caminho final do arquivo, ou None se o timeout expirar.
+
+    """
+    diretorio = Path(diretorio)
+    corresponde = arquivo if callable(arquivo) else arquivo.__eq__
+    inicio = (time() if desde is None else desde) - FOLGA_MTIME
+    limite = monotonic() + timeout
+
+    with _Observador(diretorio) as observador:
+        encontrado = _procurar(diretorio, corresponde, inicio)
+        while encontrado is None:
+            restante = limite - monotonic()
+            if restante <= 0:
+                return None
+
+            nomes = observador.aguardar(min(restante, INTERVALO_VARREDURA))
+            if not nomes:
+                # Sem inotify, ou sem eventos no intervalo: verifica o
+                # diretório inteiro, já que o inotify não vê as subpastas
+                encontrado = _procurar(diretorio, corresponde, inicio)
+                continue
+
+            encontrado = next(
+                (
+                    diretorio.joinpath(nome)
+                    for nome in nomes
+                    if _concluido(nome)
+                    and corresponde(nome)
+                    and _recente(diretorio.joinpath(nome), inicio)
+                ),
+                None,
+            )
+
+    if destino is not None:
+        return Path(shutil.move(encontrado, destino))
+
+    return encontrado
+
+
+def enviar_ao_storage(
+    caminho: str | Path,
+    nome_objeto: str,
+    storage: Storage | None = None,
+) -> str:
+    """Envie o arquivo baixado ao storage e remova a cópia local.
+
+    Args:
+        caminho (str | Path): Caminho do arquivo baixado.
+        nome_objeto (str): Nome do objeto no bucket.
+        storage (Storage | None): Storage de destino (padrão: minio).
+
+    Returns:
+        str: Nome do objeto enviado.
+
+    """
+    if storage is None:
+        from crawjud.utils.storage import get_storage
+
+        storage = get_storage("minio")
+
+    caminho = Path(caminho)
+    storage.upload_file(nome_objeto, caminho)
+    caminho.unlink(missing_ok=True)
+    return nome_objeto
+
+
+def _concluido(nome: str) -> bool:
+    return not nome.lower().endswith(EXTENSOES_PARCIAIS)
+
+
+def _recente(caminho: Path, inicio: float) -> bool:
+    # Movido ou removido desde o evento/listagem: não é o download esperado
+    try:
+        return caminho.stat().st_mtime >= inicio
+
+    except OSError:
+        return False
+
+
+def _procurar(
+    diretorio: Path,
+    corresponde: Callable[[str], bool],
+    inicio: float,
+) -> Path | None:
+    # Percorre também as subpastas, como o navegador pode salvar nelas
+    for raiz, _, arquivos in os.walk(diretorio):
+        nomes = set(arquivos)
+        for nome in nomes:
+            # Ignora o arquivo final enquanto o parcial ainda existir
+            parcial = any(f"{nome}{ext}" in nomes for ext in EXTENSOES_PARCIAIS)
+            if (
+                _concluido(nome)
+                and not parcial
+                and corresponde(nome)
+                and _recente(Path(raiz, nome), inicio)
+            ):
+                return Path(raiz, nome)
+
+    return None
+
+
+class _Observador:
+    # Observa o diretório via inotify; sem suporte, `aguardar` apenas
+    # espera o intervalo de polling e retorna None
+
+    def __init__(self, diretorio: Path) -> None:
+        self._diretorio = diretorio
+        self._fd: int | None = None
+
+    def __enter__(self) -> _Observador:
+        with suppress(Exception):
+            self._fd = _inotify(self._diretorio)
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self._fd is not None:
+            with suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+
+    def aguardar(self, timeout: float) -> list[str] | None:
+        if self._fd is None:
+            sleep(min(timeout, INTERVALO_POLLING))
+            return None
+
+        prontos, _, _ = select.select([self._fd], [], [], timeout)
+        if not prontos:
+            return []
+
+        try:
+            dados = os.read(self._fd, _TAMANHO_LEITURA)
+
+        except BlockingIOError:
+            return []
+
+        nomes: list[str] = []
+        posicao = 0
+        while posicao < len(dados):
+            _, _, _, tamanho = _EVENTO_INOTIFY.unpack_from(dados, posicao)
+            posicao += _EVENTO_INOTIFY.size
+            nome = dados[posicao : posicao + tamanho].rstrip(b"\0")
+            posicao += tamanho
+            if nome:
+                nomes.append(os.fsdecode(nome))
+
+        return nomes
+
+
+def _inotify(diretorio: Path) -> int:
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1")
+
+    mascara = _IN_CLOSE_WRITE | _IN_MOVED_TO
+    if libc.inotify_add_watch(fd, os.fsencode(diretorio), mascara) < 0:
+        erro = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(erro, "inotify_add_watch")
+
+    return fd
@@ -59,10 +59,11 @@ class RegioesIterator:
             tuple[str, str]: Tupla contendo a região e os dados da região.
 
         Raises:
-            StopIteration: Quando todas as regiões forem iteradas.
+            StopIteration: Quando todas as regiões forem iteradas ou a parada
+                da execução for solicitada.
 
         """
-        if self._index >= len(self._regioes):
+        if self._index >= len(self._regioes) or self._bot.stop_bot:
             raise StopIteration
 
         regiao, data_regiao = self._regioes[self._index]
@@ -13,7 +13,7 @@ from werkzeug.utils import secure_filename
 
 from crawjud.decorators import shared_task
 from crawjud.interfaces.dict.bot import DictFiles
-from crawjud.utils.storage import Storage
+from crawjud.utils.storage import get_storage
 
 work_dir = Path(__file__).cwd()
 
@@ -33,26 +33,26 @@ def download_files(
 
 
     """
-    storage = Storage("minio")
+    storage = get_storage("minio")
     path_files = work_dir.joinpath("temp")
     list_files: list[DictFiles] = []
 
     folder_temp_ = storage_folder_name.upper()
     json_name_ = f"{storage_folder_name.upper()}.json"
 
-    object_name_ = Path(folder_temp_).joinpath(json_name_).as_posix()
-    config_file = storage.bucket.get_object(object_name_)
+    # Baixa a pasta da execução de uma vez, com os arquivos em paralelo
+    storage.download_prefix(f"{folder_temp_}/", path_files)
+    path_folder = path_files.joinpath(folder_temp_)
 
-    path_files.joinpath(object_name_).parent.mkdir(exist_ok=True, parents=True)
-
-    data_json_: dict[str, str] = json.loads(config_file.data)
+    data_json_: dict[str, str] = json.loads(
+        path_folder.joinpath(json_name_).read_bytes(),
+    )
 
     if data_json_.get("xlsx"):
         xlsx_name_ = secure_filename(data_json_.get("xlsx"))
 
-        path_minio_ = Path(folder_temp_).joinpath(xlsx_name_).as_posix()
-        file_xlsx = storage.bucket.get_object(path_minio_)
-        file_base91str = base91.encode(file_xlsx.data)
+        file_xlsx = path_folder.joinpath(xlsx_name_).read_bytes()
+        file_base91str = base91.encode(file_xlsx)
 
         suffix_ = Path(xlsx_name_).suffix
 
@@ -68,11 +68,10 @@ def download_files(
         files_list: list[str] = data_json_.get("otherfiles")
         for file in files_list:
             file = secure_filename(file)
-            path_minio_ = Path(folder_temp_).joinpath(file).as_posix()
-            file_ = storage.bucket.get_object(path_minio_)
+            file_ = path_folder.joinpath(file).read_bytes()
             suffix_ = Path(file).suffix
 
-            file_base91str = base91.encode(file_.data)
+            file_base91str = base91.encode(file_)
             list_files.append(
                 DictFiles(
                     file_name=file,
@@ -81,6 +80,6 @@ def download_files(
                 ),
             )
 
-    shutil.rmtree(path_files.joinpath(storage_folder_name))
+    shutil.rmtree(path_folder, ignore_errors=True)
 
     return list_files
@@ -0,0 +1,157 @@
+"""Defina o modelo de checkpoint das execuções dos robôs no Redis.
+
+Este módulo fornece:
+- CheckpointExecution: registro durável das linhas concluídas e das saídas
+  parciais (sucessos e erros) de uma execução;
+- ItemCheckpoint: estrutura de cada saída parcial associada à linha da planilha.
+
+O checkpoint é indexado pelo `pid` da execução, permitindo que uma task
+reiniciada ou reenfileirada pule as linhas concluídas e repita as saídas
+delas na planilha final. Linhas com erro não são concluídas e voltam a ser
+processadas.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import suppress
+from typing import Any, Self, TypedDict
+
+from redis_om import Field, JsonModel, NotFoundError
+
+from crawjud.utils.models.logs import description_pid
+
+# Tempo de vida do checkpoint no Redis (7 dias)
+CHECKPOINT_TTL = 60 * 60 * 24 * 7
+
+
+class ItemCheckpoint(TypedDict):
+    """Defina a saída parcial de uma linha registrada no checkpoint.
+
+    Args:
+        row (int): Linha da planilha que gerou a saída.
+        args (list[Any]): Argumentos posicionais da saída (dados, mensagem...).
+        kwargs (dict[str, Any]): Argumentos nomeados da saída.
+
+    """
+
+    row: int
+    args: list[Any]
+    kwargs: dict[str, Any]
+
+
+class CheckpointExecution(JsonModel):
+    """Armazene o progresso linha a linha de uma execução no Redis.
+
+    Args:
+        pid (str): Identificador do processo de execução.
+        linhas_concluidas (list[int]): Linhas processadas até o fim.
+        sucessos (list[ItemCheckpoint]): Saídas de sucesso registradas.
+        erros (list[ItemCheckpoint]): Saídas de erro registradas.
+
+    """
+
+    pid: str = Field(
+        default="desconhecido",
+        description=description_pid,
+        primary_key=True,
+    )
+    linhas_concluidas: list[int] = Field(default=[])
+    sucessos: list[ItemCheckpoint] = Field(default=[])
+    erros: list[ItemCheckpoint] = Field(default=[])
+
+    @classmethod
+    def carregar(cls, pid: str) -> Self:
+        """Recupere o checkpoint da execução ou crie um novo registro vazio.
+
+        Args:
+            pid (str): Identificador do processo de execução.
+
+        Returns:
+            Self: Checkpoint existente ou recém-criado.
+
+        """
+        with suppress(NotFoundError):
+            return cls.get(pid)
+
+        checkpoint = cls(pid=pid)
+        checkpoint.save()
+        checkpoint.expire(CHECKPOINT_TTL)
+        return checkpoint
+
+    def concluir_linha(self, row: int) -> None:
+        """Marque a linha informada como concluída no checkpoint.
+
+        Args:
+            row (int): Linha da planilha concluída.
+
+        """
+        self._append("$.linhas_concluidas", int(row))
+        self.linhas_concluidas.append(int(row))
+
+    def registrar_sucesso(
+        self,
+        row: int,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Acrescente uma saída de sucesso da linha ao checkpoint.
+
+        Args:
+            row (int): Linha da planilha que gerou a saída.
+            args (tuple[Any, ...]): Argumentos posicionais da saída.
+            kwargs (dict[str, Any]): Argumentos nomeados da saída.
+
+        """
+        item = _item(row, args, kwargs)
+        self._append("$.sucessos", item)
+        self.sucessos.append(item)
+
+    def registrar_erro(
+        self,
+        row: int,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Acrescente uma saída de erro da linha ao checkpoint.
+
+        A linha não é marcada como concluída: apenas erros registrados por
+        linhas que chegam ao fim são repetidos na retomada.
+
+        Args:
+            row (int): Linha da planilha que gerou a saída.
+            args (tuple[Any, ...]): Argumentos posicionais da saída.
+            kwargs (dict[str, Any]): Argumentos nomeados da saída.
+
+        """
+        item = _item(row, args, kwargs)
+        self._append("$.erros", item)
+        self.erros.append(item)
+
+    def descartar_pendentes(self) -> None:
+        """Remova as saídas de linhas interrompidas antes da conclusão.
+
+        Essas linhas são processadas de novo e voltam a registrar as saídas.
+        """
+        concluidas = set(self.linhas_concluidas)
+        for campo in ("sucessos", "erros"):
+            itens: list[ItemCheckpoint] = getattr(self, campo)
+            pendentes = {item["row"] for item in itens} - concluidas
+            for row in pendentes:
+                self.db().json().delete(self.key(), f"$.{campo}[?(@.row=={row})]")
+
+            itens[:] = [item for item in itens if item["row"] in concluidas]
+
+    def _append(self, path: str, item: int | ItemCheckpoint) -> None:
+        # Acrescenta o item diretamente no documento JSON, evitando
+        # regravar o checkpoint inteiro a cada linha processada
+        self.db().json().arrappend(self.key(), path, item)
+
+
+def _item(row: int, args: tuple[Any, ...], kwargs: dict[str, Any]) -> ItemCheckpoint:
+    # Converte valores não serializáveis (datas, decimais) em string
+    return ItemCheckpoint(
+        row=int(row),
+        args=json.loads(json.dumps(list(args), default=str)),
+        kwargs=json.loads(json.dumps(kwargs, default=str)),
+    )
@@ -0,0 +1,33 @@
+"""Conexão Redis compartilhada pelo processo.
+
+`redis_om.get_redis_connection` cria um client, com um pool de conexões
+próprio, a cada chamada. As leituras e gravações avulsas (métricas, caches,
+versões e uploads) usam `conexao_redis`, que devolve sempre o mesmo client.
+O pool do redis-py é seguro entre threads e é recriado após um fork (workers
+prefork do Celery), então o client pode ser guardado no módulo.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from redis_om import get_redis_connection
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+@cache
+def conexao_redis(*, decode_responses: bool = True) -> Redis:
+    """Retorne o client Redis do processo, criado na primeira chamada.
+
+    Args:
+        decode_responses (bool): Decodifica as respostas como texto; use False
+            para dados binários.
+
+    Returns:
+        Redis: Client com pool de conexões compartilhado.
+
+    """
+    return get_redis_connection(decode_responses=decode_responses)
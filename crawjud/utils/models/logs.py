@@ -23,6 +23,7 @@ from redis_om import Field, HashModel, JsonModel, NotFoundError
 
 from crawjud.interfaces.types.pje import Processo
 from crawjud.utils.interfaces import ItemMessageList
+from crawjud.utils.models.metricas import ResumoEtapa
 
 description_message = (
     "e.g. '[(C3K7H5, log, 15, 19:37:15)> Salvando arquivos na pasta...]'"
@@ -118,6 +119,9 @@ class MessageLogDict(TypedDict):
         remaining (int):
             Number of rows remaining to be processed (e.g., 85).
 
+        resumo_etapas (dict[str, ResumoEtapa]):
+            Count and mean duration of each bot step (e.g., 'captcha').
+
     """
 
     """Model for message logs."""
@@ -132,6 +136,7 @@ class MessageLogDict(TypedDict):
     errors: int
     success: int
     remaining: int
+    resumo_etapas: dict[str, ResumoEtapa]
 
 
 class MessageLog(JsonModel):
@@ -172,6 +177,9 @@ class MessageLog(JsonModel):
         remaining (int):
             Number of rows remaining to be processed (e.g., 85).
 
+        resumo_etapas (dict[str, ResumoEtapa]):
+            Count and mean duration of each bot step (e.g., 'captcha').
+
 
     """
 
@@ -204,6 +212,10 @@ class MessageLog(JsonModel):
         description="e.g. 98 (quantidade de operações bem-sucedidas)",
     )
     remaining: int = Field(description="e.g. 85 (linhas restantes para processar)")
+    resumo_etapas: dict[str, ResumoEtapa] = Field(
+        default={},
+        description="e.g. {'captcha': {'quantidade': 3, 'media': 4.2}} (por etapa)",
+    )
 
     @classmethod
     def query_logs(cls, pid: str) -> Self | None:
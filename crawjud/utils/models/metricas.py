@@ -0,0 +1,285 @@
+"""Registre e consulte histogramas de latência das etapas dos robôs no Redis.
+
+Este módulo fornece:
+- medir_latencia/registrar_latencia: cronometram uma etapa (autenticação,
+  busca, captcha, download, upload...) e acumulam o tempo em histogramas por
+  sistema, robô, etapa e região;
+- agendar_latencia: registro sem bloquear o event loop (rotas da API);
+- histogramas: séries agregadas, com o percentil 99, para o endpoint de
+  métricas;
+- resumo_execucao: quantidade e tempo médio por etapa de uma execução,
+  exibido no MessageLog.
+
+Cada observação é gravada com um único pipeline no Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager, suppress
+from functools import partial
+from time import perf_counter
+from typing import TYPE_CHECKING, TypedDict
+
+from crawjud.utils.models.conexao import conexao_redis
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+# Limites superiores (segundos) dos buckets dos histogramas; os limites
+# abaixo de 0,1 s cobrem a latência das rotas da API
+BUCKETS_SEGUNDOS = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+)
+
+CHAVE_SERIES = "crawjud:metricas:series"
+CHAVE_HISTOGRAMA = "crawjud:metricas:hist:{serie}"
+CHAVE_EXECUCAO = "crawjud:metricas:pid:{pid}"
+
+# Tempo de vida do resumo por execução (7 dias)
+METRICAS_EXECUCAO_TTL = 60 * 60 * 24 * 7
+
+
+class ResumoEtapa(TypedDict):
+    """Defina o resumo de uma etapa dentro de uma execução.
+
+    Args:
+        quantidade (int): Vezes que a etapa foi executada.
+        total (float): Tempo total da etapa em segundos.
+        media (float): Tempo médio da etapa em segundos.
+
+    """
+
+    quantidade: int
+    total: float
+    media: float
+
+
+class SerieHistograma(TypedDict):
+    """Defina uma série de histograma agregada.
+
+    Args:
+        sistema (str): Sistema do robô (ex.: "pje").
+        bot (str): Robô (ex.: "capa").
+        etapa (str): Etapa medida (ex.: "captcha").
+        regiao (str): Região/tribunal, vazio quando não se aplica.
+        quantidade (int): Total de observações.
+        total (float): Soma das durações em segundos.
+        buckets (dict[str, int]): Observações acumuladas por limite superior.
+        p99 (float | None): Limite do bucket que contém o percentil 99, ou
+            None se ele estiver acima do maior bucket.
+
+    """
+
+    sistema: str
+    bot: str
+    etapa: str
+    regiao: str
+    quantidade: int
+    total: float
+    buckets: dict[str, int]
+    p99: float | None
+
+
+def registrar_latencia(
+    sistema: str,
+    bot: str,
+    etapa: str,
+    duracao: float,
+    regiao: str = "",
+    pid: str | None = None,
+) -> None:
+    """Acumule a duração de uma etapa no histograma e no resumo da execução.
+
+    Args:
+        sistema (str): Sistema do robô.
+        bot (str): Nome do robô.
+        etapa (str): Etapa medida.
+        duracao (float): Duração em segundos.
+        regiao (str): Região/tribunal da etapa.
+        pid (str | None): Identificador da execução, para o resumo no log.
+
+    """
+    serie = f"{sistema}:{bot}:{etapa}:{regiao}"
+    chave = CHAVE_HISTOGRAMA.format(serie=serie)
+
+    with suppress(Exception):
+        pipe = conexao_redis().pipeline(transaction=False)
+        pipe.sadd(CHAVE_SERIES, serie)
+        pipe.hincrby(chave, "quantidade", 1)
+        pipe.hincrbyfloat(chave, "total", duracao)
+        for limite in BUCKETS_SEGUNDOS:
+            if duracao <= limite:
+                pipe.hincrby(chave, f"le_{limite}", 1)
+
+        if pid:
+            chave_execucao = CHAVE_EXECUCAO.format(pid=pid)
+            pipe.hincrby(chave_execucao, f"{etapa}:quantidade", 1)
+            pipe.hincrbyfloat(chave_execucao, f"{etapa}:total", duracao)
+            pipe.expire(chave_execucao, METRICAS_EXECUCAO_TTL)
+
+        pipe.execute()
+
+
+def agendar_latencia(
+    sistema: str,
+    bot: str,
+    etapa: str,
+    duracao: float,
+    regiao: str = "",
+) -> None:
+    """Registre a duração no executor padrão, sem aguardar o Redis.
+
+    Deve ser chamada de dentro de um event loop (rotas e namespaces da API).
+
+    Args:
+        sistema (str): Sistema medido (ex.: "api").
+        bot (str): Endpoint ou componente medido.
+        etapa (str): Etapa medida (ex.: método HTTP).
+        duracao (float): Duração em segundos.
+        regiao (str): Região/tribunal da etapa.
+
+    """
+    asyncio.get_running_loop().run_in_executor(
+        None,
+        partial(registrar_latencia, sistema, bot, etapa, duracao, regiao),
+    )
+
+
+@contextmanager
+def medir_latencia(
+    sistema: str,
+    bot: str,
+    etapa: str,
+    regiao: str = "",
+    pid: str | None = None,
+) -> Generator[None]:
+    """Cronometre o bloco e registre a duração da etapa.
+
+    Args:
+        sistema (str): Sistema do robô.
+        bot (str): Nome do robô.
+        etapa (str): Etapa medida.
+        regiao (str): Região/tribunal da etapa.
+        pid (str | None): Identificador da execução.
+
+    Yields:
+        None: Controle para o bloco cronometrado.
+
+    """
+    inicio = perf_counter()
+    try:
+        yield
+
+    finally:
+        registrar_latencia(
+            sistema=sistema,
+            bot=bot,
+            etapa=etapa,
+            duracao=perf_counter() - inicio,
+            regiao=regiao,
+            pid=pid,
+        )
+
+
+def histogramas() -> list[SerieHistograma]:
+    """Retorne todas as séries de histograma registradas.
+
+    Returns:
+        list[SerieHistograma]: Séries com contagem, soma e buckets acumulados.
+
+    """
+    redis = conexao_redis()
+    series = sorted(_decodifica(serie) for serie in redis.smembers(CHAVE_SERIES))
+
+    pipe = redis.pipeline(transaction=False)
+    for serie in series:
+        pipe.hgetall(CHAVE_HISTOGRAMA.format(serie=serie))
+
+    resultado: list[SerieHistograma] = []
+    for serie, dados in zip(series, pipe.execute(), strict=True):
+        campos = {_decodifica(k): _decodifica(v) for k, v in dados.items()}
+        sistema, bot, etapa, regiao = serie.split(":", 3)
+        quantidade = int(campos.get("quantidade", 0))
+        buckets = {
+            str(limite): int(campos.get(f"le_{limite}", 0))
+            for limite in BUCKETS_SEGUNDOS
+        }
+        resultado.append(
+            SerieHistograma(
+                sistema=sistema,
+                bot=bot,
+                etapa=etapa,
+                regiao=regiao,
+                quantidade=quantidade,
+                total=round(float(campos.get("total", 0)), 3),
+                buckets=buckets,
+                p99=_percentil(quantidade, buckets, 0.99),
+            ),
+        )
+
+    return resultado
+
+
+def resumo_execucao(pid: str) -> dict[str, ResumoEtapa]:
+    """Retorne a quantidade e o tempo médio de cada etapa da execução.
+
+    Args:
+        pid (str): Identificador da execução.
+
+    Returns:
+        dict[str, ResumoEtapa]: Resumo indexado pelo nome da etapa.
+
+    """
+    resumo: dict[str, ResumoEtapa] = {}
+    with suppress(Exception):
+        dados = conexao_redis().hgetall(CHAVE_EXECUCAO.format(pid=pid))
+        campos = {_decodifica(k): _decodifica(v) for k, v in dados.items()}
+        for campo, valor in campos.items():
+            etapa, _, tipo = campo.rpartition(":")
+            if tipo != "quantidade":
+                continue
+
+            quantidade = int(valor)
+            total = float(campos.get(f"{etapa}:total", 0))
+            resumo[etapa] = ResumoEtapa(
+                quantidade=quantidade,
+                total=round(total, 3),
+                media=round(total / quantidade, 3) if quantidade else 0.0,
+            )
+
+    return resumo
+
+
+def _percentil(
+    quantidade: int,
+    buckets: dict[str, int],
+    percentil: float,
+) -> float | None:
+    # Buckets acumulados: o primeiro limite que alcança a posição do
+    # percentil é o limite superior estimado
+    if not quantidade:
+        return None
+
+    posicao = quantidade * percentil
+    for limite in BUCKETS_SEGUNDOS:
+        if buckets[str(limite)] >= posicao:
+            return float(limite)
+
+    return None
+
+
+def _decodifica(valor: bytes | str) -> str:
+    return valor.decode() if isinstance(valor, bytes) else valor
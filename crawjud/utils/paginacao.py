@@ -0,0 +1,111 @@
+"""Cursores opacos da paginação por chave (keyset) das listagens da API.
+
+O cursor guarda a chave de ordenação (data, id) do último item da página;
+a próxima página filtra os itens estritamente anteriores a essa chave. Itens
+sem data não têm chave e ficam fora da listagem.
+"""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import tuple_
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import ColumnElement, Row
+
+
+def encode_cursor(last_date: datetime, last_id: int) -> str:
+    """Codifique a chave do último item da página em um cursor opaco.
+
+    Args:
+        last_date (datetime): Data do último item da página.
+        last_id (int): ID do último item da página.
+
+    Returns:
+        str: Cursor em base64 seguro para URLs.
+
+    """
+    raw = f"{last_date.isoformat()}|{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decodifique um cursor gerado por `encode_cursor`.
+
+    Cursores inválidos levantam `ValueError` (resposta 400 nas rotas).
+
+    Args:
+        cursor (str): Cursor recebido do cliente.
+
+    Returns:
+        tuple[datetime, int]: Data e ID do último item da página anterior.
+
+    """
+    last_date, last_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+    return datetime.fromisoformat(last_date), int(last_id)
+
+
+def filtro_chave(
+    coluna_data: ColumnElement[datetime],
+    coluna_id: ColumnElement[int],
+    cursor: str | None = None,
+) -> list[ColumnElement[bool]]:
+    """Monte os filtros da página: itens com data e anteriores ao cursor.
+
+    Ordene a consulta por ``coluna_data`` e ``coluna_id`` decrescentes.
+
+    Args:
+        coluna_data (ColumnElement[datetime]): Coluna de data da chave.
+        coluna_id (ColumnElement[int]): Coluna de ID da chave.
+        cursor (str | None): ``next_cursor`` da página anterior.
+
+    Returns:
+        list[ColumnElement[bool]]: Condições para o ``where`` da consulta.
+
+    """
+    # Sem data o item não teria chave para o cursor (nem posição estável
+    # na ordenação, que varia entre bancos para NULL)
+    filtros = [coluna_data.is_not(None)]
+    if cursor:
+        last_date, last_id = decode_cursor(cursor)
+        filtros.append(tuple_(coluna_data, coluna_id) < tuple_(last_date, last_id))
+
+    return filtros
+
+
+def proximo_cursor(
+    rows: Sequence[Row],
+    limite: int,
+    coluna_data: str,
+    coluna_id: str = "id",
+) -> tuple[Sequence[Row], str | None]:
+    """Corte a página e gere o cursor da próxima, se houver.
+
+    A consulta deve buscar ``limite + 1`` itens: o excedente indica que há
+    uma próxima página.
+
+    Args:
+        rows (Sequence[Row]): Linhas retornadas pela consulta.
+        limite (int): Tamanho da página.
+        coluna_data (str): Nome da coluna de data da chave.
+        coluna_id (str): Nome da coluna de ID da chave.
+
+    Returns:
+        tuple[Sequence[Row], str | None]: Linhas da página e o cursor da
+            próxima (None na última página).
+
+    """
+    if len(rows) <= limite:
+        return rows, None
+
+    rows = rows[:limite]
+    ultima = rows[-1]
+    return rows, encode_cursor(
+        getattr(ultima, coluna_data),
+        getattr(ultima, coluna_id),
+    )
@@ -0,0 +1,201 @@
+"""Extração de texto de PDFs em um pool de processos, com cache por conteúdo.
+
+Este módulo fornece:
+- extrair_texto: texto de todas as páginas, unido de uma só vez;
+- buscar_padrao: primeira ocorrência de uma expressão regular, parando na
+  página em que ela for encontrada (ex.: código de barras de guias);
+- contem_palavra: verifica uma palavra-chave com a mesma parada antecipada;
+- agendar_extracao: versão que retorna um `Future`, para o robô seguir
+  baixando documentos enquanto o PDF é lido.
+
+A leitura com `PdfReader` roda em processos separados, sem disputar o GIL
+com as threads do robô. Em processos daemônicos (workers prefork do Celery),
+que não podem criar processos filhos, o pool usa threads. Os resultados são
+guardados em cache pelo SHA-256 do conteúdo do arquivo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import suppress
+from io import BytesIO
+from multiprocessing import current_process
+from os import cpu_count
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from pypdf import PdfReader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Processos do pool de extração
+PROCESSOS_PDF = min(cpu_count() or 1, 4)
+
+# Quantidade máxima de resultados mantidos no cache
+TAMANHO_CACHE_PDF = 256
+
+# Linha digitável de boletos/guias judiciais
+PADRAO_CODIGO_BARRAS = (
+    r"\b\d{5}\.\d{5}\s*\d{5}\.\d{6}\s*\d{5}\.\d{6}\s*\d\s*\d{14}\b"
+)
+
+_pool: ProcessPoolExecutor | ThreadPoolExecutor | None = None
+_lock_pool = Lock()
+_cache: OrderedDict[tuple[str, ...], str | None] = OrderedDict()
+_lock_cache = Lock()
+
+
+def extrair_texto(caminho: str | Path, separador: str = "") -> str:
+    """Extraia o texto de todas as páginas do PDF.
+
+    Args:
+        caminho (str | Path): Caminho do PDF.
+        separador (str): Texto que substitui as quebras de linha das páginas.
+
+    Returns:
+        str: Texto das páginas, na ordem do documento.
+
+    """
+    return agendar_extracao(caminho, separador).result()
+
+
+def buscar_padrao(caminho: str | Path, padrao: str, flags: int = 0) -> str | None:
+    """Busque a primeira ocorrência do padrão, parando na página encontrada.
+
+    Args:
+        caminho (str | Path): Caminho do PDF.
+        padrao (str): Expressão regular.
+        flags (int): Flags do módulo `re`.
+
+    Returns:
+        str | None: Trecho encontrado ou None.
+
+    """
+    conteudo = Path(caminho).read_bytes()
+    chave = (_hash(conteudo), "busca", padrao, str(flags))
+    return _agendar(chave, _buscar_nas_paginas, conteudo, padrao, flags).result()
+
+
+def contem_palavra(caminho: str | Path, palavra: str) -> bool:
+    """Verifique se o PDF contém a palavra-chave (sem diferenciar maiúsculas).
+
+    Args:
+        caminho (str | Path): Caminho do PDF.
+        palavra (str): Palavra-chave.
+
+    Returns:
+        bool: True se a palavra foi encontrada.
+
+    """
+    return buscar_padrao(caminho, re.escape(palavra), re.IGNORECASE) is not None
+
+
+def agendar_extracao(caminho: str | Path, separador: str = "") -> Future[str]:
+    """Agende a extração do texto do PDF no pool.
+
+    Args:
+        caminho (str | Path): Caminho do PDF.
+        separador (str): Texto que substitui as quebras de linha das páginas.
+
+    Returns:
+        Future[str]: Texto das páginas.
+
+    """
+    conteudo = Path(caminho).read_bytes()
+    chave = (_hash(conteudo), "texto", separador)
+    return _agendar(chave, _extrair_paginas, conteudo, separador)
+
+
+def _agendar[T](
+    chave: tuple[str, ...],
+    funcao: Callable[..., T],
+    *args: object,
+) -> Future[T]:
+    with _lock_cache:
+        if chave in _cache:
+            _cache.move_to_end(chave)
+            futuro: Future[T] = Future()
+            futuro.set_result(_cache[chave])
+            return futuro
+
+    futuro = _submeter(funcao, *args)
+    futuro.add_done_callback(lambda f: _guardar(chave, f))
+    return futuro
+
+
+def _submeter[T](funcao: Callable[..., T], *args: object) -> Future[T]:
+    global _pool
+    with _lock_pool:
+        if _pool is None:
+            _pool = _criar_pool()
+
+        try:
+            return _pool.submit(funcao, *args)
+
+        except (AssertionError, OSError, RuntimeError, NotImplementedError):
+            # Ambiente sem suporte a subprocessos (ou pool quebrado):
+            # mantém a extração fora do loop do robô em threads
+            with suppress(Exception):
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ThreadPoolExecutor(PROCESSOS_PDF)
+            return _pool.submit(funcao, *args)
+
+
+def _criar_pool() -> ProcessPoolExecutor | ThreadPoolExecutor:
+    # Processos daemônicos (workers prefork do Celery) não podem ter filhos:
+    # o ProcessPoolExecutor falharia com AssertionError no primeiro submit
+    if current_process().daemon:
+        return ThreadPoolExecutor(PROCESSOS_PDF)
+
+    return ProcessPoolExecutor(PROCESSOS_PDF)
+
+
+def _guardar(chave: tuple[str, ...], futuro: Future) -> None:
+    if futuro.cancelled() or futuro.exception() is not None:
+        return
+
+    with _lock_cache:
+        _cache[chave] = futuro.result()
+        _cache.move_to_end(chave)
+        while len(_cache) > TAMANHO_CACHE_PDF:
+            _cache.popitem(last=False)
+
+
+def _hash(conteudo: bytes) -> str:
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def _textos_paginas(conteudo: bytes) -> list[str]:
+    # Executado no processo do pool; páginas ilegíveis são ignoradas
+    textos: list[str] = []
+    for page in PdfReader(BytesIO(conteudo)).pages:
+        with suppress(Exception):
+            textos.append(page.extract_text() or "")
+
+    return textos
+
+
+def _extrair_paginas(conteudo: bytes, separador: str) -> str:
+    return "".join(
+        texto.replace("\n", separador) for texto in _textos_paginas(conteudo)
+    )
+
+
+def _buscar_nas_paginas(conteudo: bytes, padrao: str, flags: int) -> str | None:
+    regex = re.compile(padrao, flags)
+    for page in PdfReader(BytesIO(conteudo)).pages:
+        with suppress(Exception):
+            encontrado = regex.search(page.extract_text() or "")
+            if encontrado:
+                return encontrado.group(0)
+
+    return None
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from time import sleep
 
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
@@ -12,6 +11,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.esaj import ESajBot
+from crawjud.utils.webdriver.etapas import Etapas
 
 
 class EsajSearch(ESajBot):
@@ -39,10 +39,10 @@ class EsajSearch(ESajBot):
         elif not grau or grau != 1 or grau != 2:
             raise ExecutionError(message="Informar instancia!")
 
-        sleep(1)
         # Coloca o campo em formato "Outros" para inserir o número do processo
-        ratioNumberOld = self.wait.until(  # noqa: N806
-            ec.presence_of_element_located((By.ID, "radioNumeroAntigo")),
+        ratioNumberOld = Etapas(self.driver, site="esaj").aguardar(  # noqa: N806
+            "consulta_processo",
+            ec.element_to_be_clickable((By.ID, "radioNumeroAntigo")),
         )
         ratioNumberOld.click()
 
@@ -50,6 +50,8 @@ class PJeSearch[T](PjeBot):
             processo ou mensagem indicando que nenhum processo foi encontrado.
 
         """
+        self.cancelamento.verificar()
+
         # Envia mensagem de log para task assíncrona
         message = "Buscando processo {proc}".format(proc=data["NUMERO_PROCESSO"])
         self.print_msg(
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from contextlib import suppress
 from datetime import datetime
-from time import sleep
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
@@ -15,6 +14,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from crawjud.common.exceptions.bot import ExecutionError
 from crawjud.interfaces.controllers.bots.systems.projudi import ProjudiBot
+from crawjud.utils.webdriver.etapas import Etapas
 
 if TYPE_CHECKING:
     from httpx import Client
@@ -95,8 +95,10 @@ class ProjudiSearch(ProjudiBot):
 
             proc = self.bot_data.get("NUMERO_PROCESSO")
             inputproc.send_keys(proc)
-            sleep(1)
-            consultar = self.driver.find_element(By.CSS_SELECTOR, "#pesquisar")
+            consultar = Etapas(self.driver, site="projudi").aguardar(
+                "botao_pesquisar",
+                ec.element_to_be_clickable((By.CSS_SELECTOR, "#pesquisar")),
+            )
             consultar.click()
 
             with suppress(TimeoutException, NoSuchElementException, Exception):
@@ -133,6 +135,7 @@ class ProjudiSearch(ProjudiBot):
         Insere dados, documento e gerencia pesquisa.
 
         """
+        etapas = Etapas(self.driver, site="projudi")
         allprocess = self.wait.until(
             ec.presence_of_element_located((
                 By.CSS_SELECTOR,
@@ -168,17 +171,21 @@ class ProjudiSearch(ProjudiBot):
             search_vara = self.driver.find_element(By.ID, "descricaoVara")
             search_vara.click()
             search_vara.send_keys(self.vara)
-            sleep(3)
-            vara_option = self.driver.find_element(
-                By.ID,
-                "ajaxAuto_descricaoVara",
-            ).find_elements(By.TAG_NAME, "li")[0]
+            vara_option = etapas.aguardar(
+                "sugestao_vara",
+                ec.element_to_be_clickable((
+                    By.CSS_SELECTOR,
+                    '[id="ajaxAuto_descricaoVara"] li',
+                )),
+            )
             vara_option.click()
 
-        sleep(3)
-        input_parte = self.driver.find_element(
-            By.CSS_SELECTOR,
-            'input[name="nomeParte"]',
+        input_parte = etapas.aguardar(
+            "campo_nome_parte",
+            ec.element_to_be_clickable((
+                By.CSS_SELECTOR,
+                'input[name="nomeParte"]',
+            )),
         )
         input_parte.send_keys(self.parte_name)
 
@@ -210,11 +217,13 @@ class ProjudiSearch(ProjudiBot):
 
         procenter = self.driver.find_element(By.ID, "pesquisar")
         procenter.click()
-        sleep(3)
 
+        enterproc: WebElement | None = None
         with suppress(TimeoutException):
-            enterproc: WebElement = self.wait.until(
+            enterproc = etapas.aguardar(
+                "resultado_busca_parte",
                 ec.presence_of_element_located((By.CLASS_NAME, "link")),
+                timeout=8,
             )
 
         return enterproc is not None
@@ -251,17 +260,19 @@ def allow_access(driver: WebDriver) -> None:
             "#habilitacaoProvisoriaButton",
         )
 
+        etapas = Etapas(driver, site="projudi")
         allowacess.click()
-        sleep(1)
 
-        confirmterms = driver.find_element(
-            By.CSS_SELECTOR,
-            "#termoAceito",
+        confirmterms: WebElement = etapas.aguardar(
+            "termo_acesso_provisorio",
+            ec.element_to_be_clickable((By.CSS_SELECTOR, "#termoAceito")),
         )
         confirmterms.click()
-        sleep(1)
 
-        save = driver.find_element(By.CSS_SELECTOR, "#saveButton")
+        save: WebElement = etapas.aguardar(
+            "salvar_acesso_provisorio",
+            ec.element_to_be_clickable((By.CSS_SELECTOR, "#saveButton")),
+        )
         save.click()
 
 
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from itertools import count
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Literal
+from threading import Lock, Semaphore
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, TypedDict
 
 from dotenv import dotenv_values
 from minio import Minio as Client
 from minio.credentials import EnvMinioProvider
+from minio.datatypes import Part as Part
+from minio.helpers import MIN_PART_SIZE, md5sum_hash
 from minio.xml import unmarshal
-from tqdm import tqdm
+from urllib3 import PoolManager, Retry, Timeout
 
 from crawjud.utils.storage._bucket import Blob as Blob
 from crawjud.utils.storage._bucket import Bucket, ListBuckets
@@ -18,13 +25,57 @@ from crawjud.utils.storage.credentials.providers import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from minio.datatypes import Object
     from minio.helpers import ObjectWriteResult
 environ = dotenv_values()
 storages = Literal["google", "minio"]
 
+# Tamanho padrão (bytes) das partes do upload multipart
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Quantidade padrão de partes enviadas em paralelo
+UPLOAD_PARALLEL_PARTS = 4
+
+# Conexões mantidas (keep-alive) por host no pool do client de storage;
+# por padrão acompanha a concorrência do worker e os uploads paralelos
+STORAGE_POOL_SIZE = int(environ.get("STORAGE_POOL_SIZE") or 0) or max(
+    int(os.environ.get("CELERY_CONCURRENCY", "4")) * UPLOAD_PARALLEL_PARTS,
+    10,
+)
+
+# Timeout (segundos) de conexão e leitura do client de storage
+STORAGE_TIMEOUT = 300
+
+# Arquivos transferidos simultaneamente em downloads/uploads em lote
+TRANSFER_WORKERS = 8
+
+# Tamanho (bytes) dos blocos gravados em disco durante o download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_clients: dict[str, Storage] = {}
+_clients_lock = Lock()
+
+
+class PoolStats(TypedDict):
+    """Defina as estatísticas de uso do pool de conexões de um host.
+
+    Args:
+        host (str): Host do pool.
+        maxsize (int): Conexões mantidas no pool.
+        connections (int): Conexões abertas desde a criação do pool.
+        requests (int): Requisições feitas pelo pool.
+        idle (int): Conexões ociosas disponíveis para reuso.
+
+    """
+
+    host: str
+    maxsize: int
+    connections: int
+    requests: int
+    idle: int
+
 
 class ArquivoNaoEncontradoError(FileNotFoundError):
     """Empty."""
@@ -46,8 +97,58 @@ class ArquivoNaoEncontradoError(FileNotFoundError):
         return self.message
 
 
+def get_storage(storage: storages = "minio") -> Storage:
+    """Retorne o client de storage compartilhado pelo processo.
+
+    O client é criado na primeira chamada, com um único pool de conexões
+    reutilizado por todas as operações do processo. Processos filhos
+    (prefork) criam o seu próprio client.
+
+    Args:
+        storage (storages): Provedor do storage.
+
+    Returns:
+        Storage: Client compartilhado.
+
+    """
+    with _clients_lock:
+        client = _clients.get(storage)
+        if client is None:
+            client = _clients[storage] = Storage(storage)
+
+        return client
+
+
+def pool_stats() -> dict[str, list[PoolStats]]:
+    """Retorne as estatísticas dos pools de conexões dos clients do processo.
+
+    Returns:
+        dict[str, list[PoolStats]]: Estatísticas por provedor de storage.
+
+    """
+    with _clients_lock:
+        clients = dict(_clients)
+
+    return {storage: client.pool_stats() for storage, client in clients.items()}
+
+
+def _reset_clients() -> None:
+    # Executado no processo filho após o fork: conexões do pai não são
+    # compartilhadas e o lock pode ter sido copiado adquirido
+    global _clients_lock  # noqa: PLW0603
+    _clients_lock = Lock()
+    _clients.clear()
+
+
+os.register_at_fork(after_in_child=_reset_clients)
+
+
 class Storage[T](Client):  # noqa: D101
-    def __init__(self, storage: storages) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        storage: storages,
+        http_client: PoolManager | None = None,
+    ) -> None:
         server_url = environ["MINIO_URL_SERVER"]
         if storage == "google":
             credentials = GoogleStorageCredentialsProvider()
@@ -55,7 +156,50 @@ class Storage[T](Client):  # noqa: D101
         elif storage == "minio":
             credentials = EnvMinioProvider()
 
-        super().__init__(endpoint=server_url, credentials=credentials, secure=False)
+        if http_client is None:
+            http_client = PoolManager(
+                num_pools=4,
+                maxsize=STORAGE_POOL_SIZE,
+                timeout=Timeout(connect=STORAGE_TIMEOUT, read=STORAGE_TIMEOUT),
+                retries=Retry(
+                    total=5,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                ),
+            )
+
+        super().__init__(
+            endpoint=server_url,
+            credentials=credentials,
+            secure=False,
+            http_client=http_client,
+        )
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Retorne o uso do pool de conexões de cada host acessado.
+
+        Returns:
+            list[PoolStats]: Estatísticas por host.
+
+        """
+        pools = self._http.pools
+        stats: list[PoolStats] = []
+        for key in pools.keys():  # noqa: SIM118
+            pool = pools.get(key)
+            if pool is None:
+                continue
+
+            stats.append(
+                PoolStats(
+                    host=f"{pool.host}:{pool.port}",
+                    maxsize=pool.pool.maxsize if pool.pool else 0,
+                    connections=pool.num_connections,
+                    requests=pool.num_requests,
+                    idle=pool.pool.qsize() if pool.pool else 0,
+                ),
+            )
+
+        return stats
 
     @property
     def bucket(self) -> Bucket:
@@ -106,14 +250,29 @@ class Storage[T](Client):  # noqa: D101
         result = unmarshal(ListBuckets, response.data.decode())
         return result.buckets
 
-    def upload_file(self, file_name: str, file_path: Path) -> None:
+    def upload_file(
+        self,
+        file_name: str,
+        file_path: Path,
+        part_size: int = UPLOAD_PART_SIZE,
+        num_parallel_uploads: int = UPLOAD_PARALLEL_PARTS,
+        content_type: str = "application/octet-stream",
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
         """Upload a file to the bucket.
 
+        O arquivo é lido em streaming e enviado em um upload multipart, com
+        as partes enviadas em paralelo e validadas pelo servidor (Content-MD5).
+        Em caso de falha o upload multipart é abortado.
+
         Args:
             file_name (str): Nome do arquivo no bucket.
             file_path (Path): Caminho do arquivo local a ser enviado.
-
-
+            part_size (int): Tamanho de cada parte em bytes (mínimo de 5 MiB).
+            num_parallel_uploads (int): Partes enviadas simultaneamente.
+            content_type (str): Content-Type do objeto.
+            progress (Callable[[int, int], None] | None): Chamado após cada
+                parte com (bytes enviados, tamanho total).
 
         Raises:
             ArquivoNaoEncontradoError: Caso o arquivo não seja encontrado.
@@ -125,27 +284,162 @@ class Storage[T](Client):  # noqa: D101
                 message=f"Arquivo não encontrado: {file_path}",
             )
 
+        bucket_name = self.bucket.name
         file_size = file_path.stat().st_size
-        chunk_size = 1024  # Tamanho do chunk em bytes
-
-        # Abre o arquivo em modo binário
-        with (
-            file_path.open("rb") as f,
-            tqdm(
-                total=file_size,
-                unit="B",
-                unit_scale=True,
-                desc=file_name,
-            ) as pbar,
-        ):
-            # Inicializa barra de progresso
-            while True:
-                tqdm.write(str(f))
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                pbar.update(len(chunk))
-                self.bucket.append_object(file_name, chunk, 0)
+        part_size = max(part_size, MIN_PART_SIZE)
+        enviados = 0
+        lock_progresso = Lock()
+
+        def registrar_progresso(tamanho: int) -> None:
+            nonlocal enviados
+            with lock_progresso:
+                enviados += tamanho
+                if progress is not None:
+                    progress(enviados, file_size)
+
+        # Arquivos de uma única parte vão em um PutObject
+        if file_size <= part_size:
+            data = file_path.read_bytes()
+            self._put_object(
+                bucket_name,
+                file_name,
+                data,
+                headers={
+                    "Content-Type": content_type,
+                    "Content-MD5": md5sum_hash(data),
+                },
+            )
+            registrar_progresso(file_size)
+            return
+
+        upload_id = self._create_multipart_upload(
+            bucket_name,
+            file_name,
+            {"Content-Type": content_type},
+        )
+
+        # Limita as partes lidas em memória aguardando envio
+        partes_em_memoria = Semaphore(num_parallel_uploads * 2)
+
+        def enviar_parte(part_number: int, data: bytes) -> Part:
+            try:
+                etag = self._upload_part(
+                    bucket_name,
+                    file_name,
+                    data,
+                    {"Content-MD5": md5sum_hash(data)},
+                    upload_id,
+                    part_number,
+                )
+                registrar_progresso(len(data))
+                return Part(part_number, etag)
+
+            finally:
+                partes_em_memoria.release()
+
+        try:
+            with (
+                file_path.open("rb") as f,
+                ThreadPoolExecutor(num_parallel_uploads) as pool,
+            ):
+                futures: list[Future[Part]] = []
+                for part_number in count(1):
+                    partes_em_memoria.acquire()
+                    data = f.read(part_size)
+                    if not data:
+                        partes_em_memoria.release()
+                        break
+
+                    futures.append(pool.submit(enviar_parte, part_number, data))
+
+                parts = [future.result() for future in futures]
+
+            self._complete_multipart_upload(bucket_name, file_name, upload_id, parts)
+
+        except Exception:
+            with suppress(Exception):
+                self._abort_multipart_upload(bucket_name, file_name, upload_id)
+            raise
+
+    def create_multipart_upload(
+        self,
+        object_name: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Inicie um upload multipart cujas partes chegam separadamente.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            content_type (str): Content-Type do objeto.
+
+        Returns:
+            str: Upload ID usado nas partes e na conclusão.
+
+        """
+        return self._create_multipart_upload(
+            self.bucket.name,
+            object_name,
+            {"Content-Type": content_type},
+        )
+
+    def upload_part(
+        self,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> str:
+        """Envie uma parte de um upload multipart, validada por Content-MD5.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            upload_id (str): Upload ID retornado por `create_multipart_upload`.
+            part_number (int): Número da parte (a partir de 1).
+            data (bytes): Conteúdo da parte (mínimo de 5 MiB, exceto a última).
+
+        Returns:
+            str: ETag da parte.
+
+        """
+        return self._upload_part(
+            self.bucket.name,
+            object_name,
+            data,
+            {"Content-MD5": md5sum_hash(data)},
+            upload_id,
+            part_number,
+        )
+
+    def complete_multipart_upload(
+        self,
+        object_name: str,
+        upload_id: str,
+        parts: list[Part],
+    ) -> None:
+        """Conclua o upload multipart, montando o objeto a partir das partes.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            upload_id (str): Upload ID do upload multipart.
+            parts (list[Part]): Partes enviadas, em ordem.
+
+        """
+        self._complete_multipart_upload(
+            self.bucket.name,
+            object_name,
+            upload_id,
+            parts,
+        )
+
+    def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        """Aborte o upload multipart, descartando as partes enviadas.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            upload_id (str): Upload ID do upload multipart.
+
+        """
+        self._abort_multipart_upload(self.bucket.name, object_name, upload_id)
 
     def fget_object(
         self,
@@ -258,11 +552,224 @@ class Storage[T](Client):  # noqa: D101
             extra_headers,
         )
 
-    def download_files(self, dest: str | Path, prefix: str) -> None:
-        files = self.bucket.list_objects(prefix=prefix, recursive=True)
+    def download_object(
+        self,
+        object_name: str,
+        file_path: str | Path,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> Path:
+        """Baixe um objeto do bucket, retomando downloads interrompidos.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            file_path (str | Path): Caminho local de destino.
+            progress (Callable[[int, int], None] | None): Chamado após cada
+                bloco com (bytes baixados, tamanho total).
+
+        Returns:
+            Path: Caminho do arquivo baixado.
+
+        """
+        stat = self.stat_object(self.bucket.name, object_name)
+        avancar = None
+        if progress is not None:
+            baixados = 0
 
-        if isinstance(dest, str):
-            dest = Path(dest)
+            def avancar(tamanho: int) -> None:
+                nonlocal baixados
+                baixados += tamanho
+                progress(baixados, stat.size)
 
-        for file in files:
-            self.fget_object(self.bucket.name, file.name, dest.joinpath(file.name))
+        return self._download_object(
+            object_name,
+            Path(file_path),
+            stat.size,
+            stat.etag,
+            avancar,
+        )
+
+    def download_prefix(
+        self,
+        prefix: str,
+        dest: str | Path,
+        max_workers: int = TRANSFER_WORKERS,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[Path]:
+        """Baixe em paralelo todos os objetos do prefixo.
+
+        Os objetos são gravados em `dest` com o mesmo caminho do bucket.
+        Arquivos já baixados (mesmo tamanho) são mantidos e downloads
+        interrompidos continuam de onde pararam.
+
+        Args:
+            prefix (str): Prefixo dos objetos no bucket.
+            dest (str | Path): Diretório local de destino.
+            max_workers (int): Objetos baixados simultaneamente.
+            progress (Callable[[int, int], None] | None): Chamado com
+                (bytes baixados, total de bytes) somando todos os objetos.
+
+        Returns:
+            list[Path]: Caminhos dos arquivos, na ordem da listagem.
+
+        """
+        dest = Path(dest)
+        blobs = [
+            blob
+            for blob in self.bucket.list_objects(prefix=prefix, recursive=True)
+            if not blob.is_dir
+        ]
+        progresso = _ProgressoAgregado(sum(blob.size for blob in blobs), progress)
+
+        def baixar(blob: Blob) -> Path:
+            return self._download_object(
+                blob.object_name,
+                dest.joinpath(blob.object_name),
+                blob.size,
+                blob.etag,
+                progresso.avancar,
+            )
+
+        return _executar_em_lote(baixar, blobs, max_workers)
+
+    def upload_directory(
+        self,
+        directory: str | Path,
+        prefix: str = "",
+        max_workers: int = TRANSFER_WORKERS,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[str]:
+        """Envie em paralelo todos os arquivos do diretório para o prefixo.
+
+        Arquivos que já existem no bucket com o mesmo tamanho não são
+        enviados novamente, então um envio interrompido pode ser repetido.
+
+        Args:
+            directory (str | Path): Diretório local de origem.
+            prefix (str): Prefixo de destino no bucket.
+            max_workers (int): Arquivos enviados simultaneamente.
+            progress (Callable[[int, int], None] | None): Chamado com
+                (bytes enviados, total de bytes) somando todos os arquivos.
+
+        Returns:
+            list[str]: Nomes dos objetos, na ordem dos arquivos.
+
+        """
+        directory = Path(directory)
+        prefix = prefix.strip("/")
+        arquivos = sorted(path for path in directory.rglob("*") if path.is_file())
+
+        def nome_objeto(path: Path) -> str:
+            relativo = path.relative_to(directory).as_posix()
+            return f"{prefix}/{relativo}" if prefix else relativo
+
+        # Uma listagem do prefixo substitui um stat por arquivo
+        existentes = {
+            blob.object_name: blob.size
+            for blob in self.bucket.list_objects(prefix=prefix, recursive=True)
+        }
+        tamanhos = {path: path.stat().st_size for path in arquivos}
+        progresso = _ProgressoAgregado(sum(tamanhos.values()), progress)
+
+        def enviar(path: Path) -> str:
+            object_name = nome_objeto(path)
+            if existentes.get(object_name) == tamanhos[path]:
+                progresso.avancar(tamanhos[path])
+                return object_name
+
+            enviados = 0
+
+            def avancar(total: int, _tamanho: int) -> None:
+                nonlocal enviados
+                progresso.avancar(total - enviados)
+                enviados = total
+
+            self.upload_file(object_name, path, progress=avancar)
+            return object_name
+
+        return _executar_em_lote(enviar, arquivos, max_workers)
+
+    def _download_object(
+        self,
+        object_name: str,
+        file_path: Path,
+        size: int,
+        etag: str,
+        avancar: Callable[[int], None] | None,
+    ) -> Path:
+        if file_path.is_file() and file_path.stat().st_size == size:
+            if avancar is not None:
+                avancar(size)
+            return file_path
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # O ETag no nome evita retomar o parcial de outra versão do objeto
+        etag = etag.strip('"')
+        parcial = file_path.with_name(f"{file_path.name}.{etag}.part")
+        offset = parcial.stat().st_size if parcial.is_file() else 0
+        if offset > size:
+            parcial.unlink()
+            offset = 0
+
+        if avancar is not None and offset:
+            avancar(offset)
+
+        if offset < size:
+            response = self.get_object(self.bucket.name, object_name, offset=offset)
+            try:
+                with parcial.open("ab") as f:
+                    for data in response.stream(DOWNLOAD_CHUNK_SIZE):
+                        f.write(data)
+                        if avancar is not None:
+                            avancar(len(data))
+
+            finally:
+                response.close()
+                response.release_conn()
+
+        else:
+            parcial.touch()
+
+        return parcial.replace(file_path)
+
+
+class _ProgressoAgregado:
+    # Soma o progresso das transferências paralelas em um único callback
+
+    def __init__(
+        self,
+        total: int,
+        callback: Callable[[int, int], None] | None,
+    ) -> None:
+        self._total = total
+        self._callback = callback
+        self._concluido = 0
+        self._lock = Lock()
+
+    def avancar(self, tamanho: int) -> None:
+        if self._callback is None:
+            return
+
+        with self._lock:
+            self._concluido += tamanho
+            self._callback(self._concluido, self._total)
+
+
+def _executar_em_lote[I, R](
+    funcao: Callable[[I], R],
+    itens: list[I],
+    max_workers: int,
+) -> list[R]:
+    # Interrompe o lote na primeira falha, cancelando o que não começou
+    if not itens:
+        return []
+
+    with ThreadPoolExecutor(max(1, min(max_workers, len(itens)))) as pool:
+        futures = [pool.submit(funcao, item) for item in itens]
+        try:
+            return [future.result() for future in futures]
+
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
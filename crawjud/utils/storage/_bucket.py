@@ -199,24 +199,12 @@ class Blob(__Object):
             extra_query_params=extra_query_params,
         )
 
-    def save(self, dest: Path | str) -> None:
-        if not self.is_dir:
-            if isinstance(dest, str):
-                dest = Path(dest)
-
-            if "/" in self.name:
-                split_bar = self.name.split("/")
-                for _path in split_bar:
-                    dest = dest.joinpath(_path)
-
-                self.name = dest.name
-                dest = dest.parent.resolve()
-                dest.mkdir(exist_ok=True, parents=True)
-
-            file_dest = str(dest.joinpath(self.name))
-
-            self.client.fget_object(
-                bucket_name=self.bucket_name,
-                object_name=str(Path(dest.name).joinpath(self.name)),
-                file_path=file_dest,
-            )
+    def save(self, dest: Path | str) -> Path | None:
+        # Salva o objeto em `dest` com o mesmo caminho do bucket
+        if self.is_dir:
+            return None
+
+        return self.client.download_object(
+            self.object_name,
+            Path(dest).joinpath(self.object_name),
+        )
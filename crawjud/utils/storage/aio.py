@@ -0,0 +1,437 @@
+"""Fachada assíncrona do storage para as rotas Quart.
+
+As operações do client síncrono rodam em um executor dedicado e limitado
+(`STORAGE_ASYNC_WORKERS`), então transferências não bloqueiam o event loop
+nem disputam o executor padrão. Leituras e escritas podem ser feitas em
+streaming:
+
+    storage = get_async_storage()
+    async for bloco in storage.stream_object(nome):
+        ...
+    await storage.upload_stream(nome, blocos)
+
+`stream_zip` monta um zip de um prefixo inteiro enquanto ele é enviado ao
+cliente, sem arquivo temporário e com memória constante.
+
+Cada operação é registrada nos histogramas de latência (sistema "api",
+robô "storage").
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from datetime import timedelta
+from functools import partial
+from os import environ
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from crawjud.utils.models.metricas import registrar_latencia
+from crawjud.utils.storage import (
+    DOWNLOAD_CHUNK_SIZE,
+    UPLOAD_PART_SIZE,
+    Part,
+    get_storage,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable
+    from pathlib import Path
+
+    from crawjud.utils.storage import Blob, Storage
+    from crawjud.utils.storage.types_storage import storages
+
+# Threads do executor dedicado às operações de storage da API
+STORAGE_ASYNC_WORKERS = int(environ.get("STORAGE_ASYNC_WORKERS", "16"))
+
+# Validade padrão das URLs pré-assinadas
+PRESIGNED_URL_TTL = timedelta(minutes=5)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+_async_clients: dict[str, AsyncStorage] = {}
+
+
+class AsyncStorage:
+    """Execute as operações do storage fora do event loop.
+
+    Args:
+        storage (Storage): Client síncrono compartilhado pelo processo.
+
+    """
+
+    def __init__(self, storage: Storage) -> None:
+        """Inicialize a fachada sobre o client síncrono.
+
+        Args:
+            storage (Storage): Client síncrono compartilhado pelo processo.
+
+        """
+        self.storage = storage
+
+    async def run[R](self, etapa: str, funcao: Callable[..., R], *args: object) -> R:
+        """Execute a função no executor do storage e registre a latência.
+
+        Args:
+            etapa (str): Nome da operação nos histogramas de latência.
+            funcao (Callable[..., R]): Função síncrona a executar.
+            *args (object): Argumentos da função.
+
+        Returns:
+            R: Retorno da função.
+
+        """
+        return await _executar(partial(_medir, etapa, funcao, *args))
+
+    async def put_object(
+        self,
+        object_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """Grave o conteúdo em um objeto do bucket.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            data (bytes): Conteúdo do objeto.
+            content_type (str): Content-Type do objeto.
+
+        """
+        await self.run(
+            "put_object",
+            partial(
+                self.storage.put_object,
+                object_name=object_name,
+                data=io.BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+            ),
+        )
+
+    async def get_object(self, object_name: str) -> bytes:
+        """Leia o conteúdo completo de um objeto do bucket.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+
+        Returns:
+            bytes: Conteúdo do objeto.
+
+        """
+        return b"".join([bloco async for bloco in self.stream_object(object_name)])
+
+    async def stream_object(
+        self,
+        object_name: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Leia um objeto do bucket em blocos, sem carregá-lo inteiro.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            chunk_size (int): Tamanho máximo de cada bloco em bytes.
+
+        Yields:
+            bytes: Blocos do objeto, em ordem.
+
+        """
+        response = await self.run(
+            "get_object",
+            self.storage.get_object,
+            self.storage.bucket.name,
+            object_name,
+        )
+        try:
+            # Leituras de blocos não entram nos histogramas
+            while bloco := await _executar(partial(response.read, chunk_size)):
+                yield bloco
+
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def list_objects(self, prefix: str) -> list[Blob]:
+        """Liste os objetos (recursivamente) do prefixo.
+
+        Args:
+            prefix (str): Prefixo dos objetos no bucket.
+
+        Returns:
+            list[Blob]: Objetos do prefixo, sem os diretórios.
+
+        """
+
+        def listar() -> list[Blob]:
+            blobs = self.storage.bucket.list_objects(prefix=prefix, recursive=True)
+            return [blob for blob in blobs if not blob.is_dir]
+
+        return await self.run("list_objects", listar)
+
+    async def presigned_get_object(
+        self,
+        object_name: str,
+        expires: timedelta = PRESIGNED_URL_TTL,
+        filename: str | None = None,
+    ) -> str:
+        """Gere uma URL pré-assinada para baixar o objeto direto do storage.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            expires (timedelta): Validade da URL.
+            filename (str | None): Nome sugerido ao navegador para o arquivo.
+
+        Returns:
+            str: URL pré-assinada.
+
+        """
+        response_headers = None
+        if filename:
+            response_headers = {
+                "response-content-disposition": f'attachment; filename="{filename}"',
+            }
+
+        return await self.run(
+            "presigned_get_object",
+            partial(
+                self.storage.presigned_get_object,
+                self.storage.bucket.name,
+                object_name,
+                expires=expires,
+                response_headers=response_headers,
+            ),
+        )
+
+    async def stream_zip(self, prefix: str) -> AsyncIterator[bytes]:
+        """Gere um zip com todos os objetos do prefixo enquanto ele é lido.
+
+        Os objetos são lidos em blocos e gravados sem compressão (planilhas
+        e PDFs já são comprimidos), então a memória usada não depende do
+        tamanho do zip. Entradas grandes usam Zip64.
+
+        Args:
+            prefix (str): Prefixo dos objetos no bucket.
+
+        Yields:
+            bytes: Blocos do arquivo zip, em ordem.
+
+        """
+        prefix = prefix.rstrip("/") + "/"
+        saida = _SaidaZip()
+        with zipfile.ZipFile(saida, "w", compression=zipfile.ZIP_STORED) as zf:
+            for blob in await self.list_objects(prefix):
+                info = zipfile.ZipInfo(
+                    blob.object_name.removeprefix(prefix),
+                    date_time=blob.last_modified.timetuple()[:6],
+                )
+                info.file_size = blob.size
+                with zf.open(info, "w") as entrada:
+                    async for bloco in self.stream_object(blob.object_name):
+                        entrada.write(bloco)
+                        if saida.pendente:
+                            yield saida.drenar()
+
+                if saida.pendente:
+                    yield saida.drenar()
+
+        yield saida.drenar()
+
+    async def upload_stream(
+        self,
+        object_name: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str = "application/octet-stream",
+        part_size: int = UPLOAD_PART_SIZE,
+    ) -> int:
+        """Envie blocos recebidos aos poucos como um upload multipart.
+
+        Apenas uma parte fica em memória por vez. Conteúdos menores que uma
+        parte vão em um único PutObject; em caso de falha o upload multipart
+        é abortado.
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            chunks (AsyncIterable[bytes]): Blocos do conteúdo, em ordem.
+            content_type (str): Content-Type do objeto.
+            part_size (int): Tamanho de cada parte em bytes.
+
+        Returns:
+            int: Total de bytes enviados.
+
+        """
+        buffer = bytearray()
+        parts: list[Part] = []
+        upload_id: str | None = None
+        total = 0
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                total += len(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        upload_id = await self.run(
+                            "create_multipart_upload",
+                            self.storage.create_multipart_upload,
+                            object_name,
+                            content_type,
+                        )
+
+                    parts.append(
+                        await self._upload_part(
+                            object_name,
+                            upload_id,
+                            len(parts) + 1,
+                            bytes(buffer[:part_size]),
+                        ),
+                    )
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                await self.put_object(object_name, bytes(buffer), content_type)
+                return total
+
+            if buffer:
+                parts.append(
+                    await self._upload_part(
+                        object_name,
+                        upload_id,
+                        len(parts) + 1,
+                        bytes(buffer),
+                    ),
+                )
+
+            await self.run(
+                "complete_multipart_upload",
+                self.storage.complete_multipart_upload,
+                object_name,
+                upload_id,
+                parts,
+            )
+
+        except BaseException:
+            if upload_id is not None:
+                with suppress(Exception):
+                    await self.run(
+                        "abort_multipart_upload",
+                        self.storage.abort_multipart_upload,
+                        object_name,
+                        upload_id,
+                    )
+            raise
+
+        return total
+
+    async def upload_file(
+        self,
+        object_name: str,
+        file_path: Path,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """Envie um arquivo local ao bucket (multipart em paralelo).
+
+        Args:
+            object_name (str): Nome do objeto no bucket.
+            file_path (Path): Caminho do arquivo local.
+            content_type (str): Content-Type do objeto.
+
+        """
+        await self.run(
+            "upload_file",
+            partial(
+                self.storage.upload_file,
+                object_name,
+                file_path,
+                content_type=content_type,
+            ),
+        )
+
+    async def _upload_part(
+        self,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> Part:
+        etag = await self.run(
+            "upload_part",
+            self.storage.upload_part,
+            object_name,
+            upload_id,
+            part_number,
+            data,
+        )
+        return Part(part_number, etag)
+
+
+class _SaidaZip:
+    # Destino não pesquisável do ZipFile: os bytes gravados são entregues
+    # (e descartados) a cada `drenar`
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        return
+
+    @property
+    def pendente(self) -> bool:
+        return bool(self._buffer)
+
+    def drenar(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def get_async_storage(storage: storages = "minio") -> AsyncStorage:
+    """Retorne a fachada assíncrona do client compartilhado pelo processo.
+
+    Args:
+        storage (storages): Provedor do storage.
+
+    Returns:
+        AsyncStorage: Fachada sobre o client de `get_storage`.
+
+    """
+    client = get_storage(storage)
+    fachada = _async_clients.get(storage)
+    if fachada is None or fachada.storage is not client:
+        fachada = _async_clients[storage] = AsyncStorage(client)
+
+    return fachada
+
+
+async def _executar[R](funcao: Callable[[], R]) -> R:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), funcao)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                STORAGE_ASYNC_WORKERS,
+                thread_name_prefix="storage",
+            )
+
+        return _executor
+
+
+def _medir[R](etapa: str, funcao: Callable[..., R], *args: object) -> R:
+    # Executado no executor: o registro no Redis também fica fora do loop
+    inicio = perf_counter()
+    try:
+        return funcao(*args)
+
+    finally:
+        registrar_latencia("api", "storage", etapa, perf_counter() - inicio)
@@ -35,6 +35,7 @@ from crawjud.utils.webdriver.config.proxy import (
 from crawjud.utils.webdriver.config.proxy import (
     CreatorInfo as CreatorInfo,
 )
+from crawjud.utils.webdriver.sessao_http import SessaoHttp
 from crawjud.utils.webdriver.web_element import WebElementBot
 
 if TYPE_CHECKING:
@@ -60,6 +61,7 @@ class DriverBot[T](WebDriver):  # noqa: D101
     _har: DictHARProxy = None
     _log: ClassVar[dict[str, DictHARProxy]] = {}
     _count: int = 0
+    _sessao_http: SessaoHttp | None = None
 
     def __init__(  # noqa: D107
         self,
@@ -88,8 +90,23 @@ class DriverBot[T](WebDriver):  # noqa: D101
         )
 
         self._wait = WebDriverWait(self, 5)
+        self._bloquear_recursos()
         self.new_har()
 
+    def _bloquear_recursos(self) -> None:
+        # Perfil "scrape": bloqueia imagens, fontes, mídia e scripts de
+        # terceiros no próprio navegador via CDP
+        padroes = getattr(self._options, "padroes_bloqueados", None)
+        if not padroes:
+            return
+
+        with suppress(Exception):
+            self.execute("executeCdpCommand", {"cmd": "Network.enable", "params": {}})
+            self.execute(
+                "executeCdpCommand",
+                {"cmd": "Network.setBlockedURLs", "params": {"urls": padroes}},
+            )
+
     def _configure_manager(
         self,
         driver_config: ChromeConfig | FirefoxConfig,
@@ -155,11 +172,41 @@ class DriverBot[T](WebDriver):  # noqa: D101
     def wait(self) -> WebDriverWait:
         return self._wait
 
+    @property
+    def sessao_http(self) -> SessaoHttp:
+        """Sessão HTTP (httpx) com os cookies e headers deste navegador."""
+        if self._sessao_http is None:
+            self._sessao_http = SessaoHttp(self)
+
+        return self._sessao_http
+
+    def get(self, url: str) -> None:
+        self._antes_navegacao()
+        super().get(url)
+        self._apos_navegacao()
+
+    def refresh(self) -> None:
+        self._antes_navegacao()
+        super().refresh()
+        self._apos_navegacao()
+
+    def _antes_navegacao(self) -> None:
+        # Cookies recebidos por HTTP passam a valer também no navegador
+        if self._sessao_http is not None:
+            self._sessao_http.devolver_cookies()
+
+    def _apos_navegacao(self) -> None:
+        if self._sessao_http is not None:
+            self._sessao_http.marcar_navegacao()
+
     def quit(self) -> None:
         with suppress(Exception):
             self.options.proxy_client.close()
             self.options.proxy_server.stop()
 
+        if self._sessao_http is not None:
+            self._sessao_http.close()
+
         return super().quit()
 
     @wait.setter
@@ -1,5 +1,7 @@
 # noqa: D100
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Literal
 
 from browsermobproxy import Client, Server
 from selenium.webdriver.chrome.options import Options
@@ -48,8 +50,67 @@ chrome_preferences: ChromePreferences = {
 }
 
 
+type PerfilNavegador = Literal["padrao", "scrape"]
+
+# Padrões de URL bloqueados via CDP no perfil "scrape", por tipo de recurso.
+# Robôs declaram em `recursos_necessarios` os tipos que o site precisa para
+# renderizar (ex.: "estilo" quando a visibilidade depende do CSS).
+RECURSOS_BLOQUEAVEIS: dict[str, tuple[str, ...]] = {
+    "imagem": (
+        *("*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*"),
+        *("*.gif", "*.gif?*", "*.webp", "*.webp?*", "*.svg", "*.svg?*"),
+        *("*.ico", "*.ico?*", "*.bmp", "*.bmp?*"),
+    ),
+    "fonte": (
+        *("*.woff", "*.woff?*", "*.woff2", "*.woff2?*"),
+        *("*.ttf", "*.ttf?*", "*.otf", "*.otf?*", "*.eot", "*.eot?*"),
+    ),
+    "estilo": ("*.css", "*.css?*"),
+    "midia": (
+        *("*.mp4", "*.mp4?*", "*.webm", "*.webm?*"),
+        *("*.mp3", "*.mp3?*", "*.ogg", "*.ogg?*"),
+    ),
+    "terceiros": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*connect.facebook.net*",
+        "*hotjar.com*",
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+    ),
+}
+
+# Preferências adicionais do perfil "scrape" (imagens e notificações)
+preferencias_scrape: dict[str, int] = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
+def padroes_bloqueados(recursos_necessarios: Iterable[str] = ()) -> list[str]:
+    """Retorne os padrões de URL bloqueados no perfil "scrape".
+
+    Args:
+        recursos_necessarios (Iterable[str]): Tipos de recurso de
+            `RECURSOS_BLOQUEAVEIS` que o site precisa para renderizar.
+
+    Returns:
+        list[str]: Padrões de URL para `Network.setBlockedURLs`.
+
+    """
+    necessarios = set(recursos_necessarios)
+    return [
+        padrao
+        for recurso, padroes in RECURSOS_BLOQUEAVEIS.items()
+        if recurso not in necessarios
+        for padrao in padroes
+    ]
+
+
 class ChromeOptions[T](Options):  # noqa: D101
     _proxy_client: Client = None
+    _padroes_bloqueados: list[str] | None = None
 
     def __init__(  # noqa: D107
         self,
@@ -58,10 +119,20 @@ class ChromeOptions[T](Options):  # noqa: D101
         arguments: list[str] = arguments_list,
         *,
         with_proxy: bool = False,
+        perfil: PerfilNavegador = "padrao",
+        recursos_necessarios: Iterable[str] = (),
         **kwargs: T,
     ) -> None:
         super().__init__()
 
+        if perfil == "scrape":
+            # Lido duas vezes: um gerador chegaria vazio à segunda leitura
+            recursos = frozenset(recursos_necessarios)
+            self._padroes_bloqueados = padroes_bloqueados(recursos)
+            preferences = dict(preferences)
+            if "imagem" not in recursos:
+                preferences.update(preferencias_scrape)
+
         for argument in arguments:
             self.add_argument(argument)
 
@@ -90,6 +161,11 @@ class ChromeOptions[T](Options):  # noqa: D101
     def proxy_server(self) -> Server:
         return self._server
 
+    @property
+    def padroes_bloqueados(self) -> list[str] | None:
+        """Padrões de URL bloqueados via CDP (perfil "scrape")."""
+        return self._padroes_bloqueados
+
 
 def configure_chrome[T](
     *args: T,
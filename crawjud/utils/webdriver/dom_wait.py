@@ -0,0 +1,142 @@
+"""Esperas orientadas a eventos do DOM para o WebDriver.
+
+As condições são avaliadas no navegador por um MutationObserver injetado via
+`execute_async_script`: a chamada retorna uma única vez, quando a condição é
+satisfeita ou o timeout expira, sem consultas repetidas ao WebDriver.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import TimeoutException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+# Timeout padrão (segundos) das esperas
+TIMEOUT_PADRAO = 30
+
+# Margem (segundos) do script timeout do WebDriver sobre o timeout da espera
+MARGEM_SCRIPT_TIMEOUT = 5
+
+# `raiz` é o elemento informado (ou o document); `__CONDICAO__` é uma
+# expressão JS que retorna verdadeiro quando a espera deve terminar
+SCRIPT_AGUARDAR_CONDICAO = """
+const raiz = arguments[0] || document;
+const timeoutMs = arguments[1];
+const callback = arguments[arguments.length - 1];
+const verificar = () => {
+    try {
+        return Boolean(__CONDICAO__);
+    } catch (e) {
+        return false;
+    }
+};
+if (verificar()) {
+    callback(true);
+    return;
+}
+let finalizado = false;
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (verificar()) finalizar(true);
+});
+const finalizar = (resultado) => {
+    if (finalizado) return;
+    finalizado = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    callback(resultado);
+};
+observer.observe(document.documentElement, {
+    subtree: true,
+    childList: true,
+    attributes: true,
+    characterData: true,
+});
+timer = setTimeout(() => finalizar(verificar()), timeoutMs);
+"""
+
+
+def aguardar_condicao(
+    driver: WebDriver,
+    condicao: str,
+    raiz: WebElement | None = None,
+    timeout: float = TIMEOUT_PADRAO,
+) -> bool:
+    """Aguarde até que a expressão JS seja verdadeira na página.
+
+    Args:
+        driver (WebDriver): WebDriver da página.
+        condicao (str): Expressão JS avaliada a cada mutação do DOM; pode
+            referenciar `raiz` (elemento informado ou `document`).
+        raiz (WebElement | None): Elemento base da condição.
+        timeout (float): Tempo máximo de espera em segundos.
+
+    Returns:
+        bool: True se a condição foi satisfeita dentro do timeout.
+
+    """
+    _ajustar_script_timeout(driver, timeout)
+    script = SCRIPT_AGUARDAR_CONDICAO.replace("__CONDICAO__", condicao)
+    try:
+        return bool(driver.execute_async_script(script, raiz, int(timeout * 1000)))
+
+    except TimeoutException:
+        return False
+
+
+def aguardar_presenca(
+    driver: WebDriver,
+    seletor: str,
+    raiz: WebElement | None = None,
+    timeout: float = TIMEOUT_PADRAO,
+) -> bool:
+    """Aguarde até que o seletor CSS encontre algum elemento.
+
+    Args:
+        driver (WebDriver): WebDriver da página.
+        seletor (str): Seletor CSS procurado.
+        raiz (WebElement | None): Elemento base da busca.
+        timeout (float): Tempo máximo de espera em segundos.
+
+    Returns:
+        bool: True se o elemento foi encontrado dentro do timeout.
+
+    """
+    condicao = f"raiz.querySelector({json.dumps(seletor)}) !== null"
+    return aguardar_condicao(driver, condicao, raiz, timeout)
+
+
+def aguardar_ausencia(
+    driver: WebDriver,
+    seletor: str,
+    raiz: WebElement | None = None,
+    timeout: float = TIMEOUT_PADRAO,
+) -> bool:
+    """Aguarde até que o seletor CSS não encontre mais nenhum elemento.
+
+    Args:
+        driver (WebDriver): WebDriver da página.
+        seletor (str): Seletor CSS monitorado.
+        raiz (WebElement | None): Elemento base da busca.
+        timeout (float): Tempo máximo de espera em segundos.
+
+    Returns:
+        bool: True se o elemento deixou de existir dentro do timeout.
+
+    """
+    condicao = f"raiz.querySelector({json.dumps(seletor)}) === null"
+    return aguardar_condicao(driver, condicao, raiz, timeout)
+
+
+def _ajustar_script_timeout(driver: WebDriver, timeout: float) -> None:
+    # Evita uma chamada extra ao WebDriver quando o script timeout já comporta
+    # a espera solicitada
+    necessario = timeout + MARGEM_SCRIPT_TIMEOUT
+    if getattr(driver, "_script_timeout_espera", 0) < necessario:
+        driver.set_script_timeout(necessario)
+        driver._script_timeout_espera = necessario  # noqa: SLF001
@@ -0,0 +1,180 @@
+"""Etapas nomeadas com espera por condição e intervalo aprendido por site.
+
+Em vez de `sleep()` com duração fixa, o robô declara o que está aguardando:
+
+    etapas = Etapas(self.driver, site="projudi")
+    etapas.aguardar("busca_vara", ec.presence_of_element_located(...))
+
+A condição é verificada imediatamente e a espera termina assim que ela é
+satisfeita. Cada etapa registra quanto tempo a página levou para ficar
+pronta; a média móvel por site/etapa é persistida no Redis e define o
+intervalo entre as verificações, evitando consultas inúteis ao WebDriver
+em tribunais lentos sem atrasar os rápidos.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, ClassVar
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from crawjud.utils.models.conexao import conexao_redis
+from crawjud.utils.webdriver.dom_wait import TIMEOUT_PADRAO, aguardar_condicao
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Chave (hash por site) das médias de prontidão das etapas no Redis
+CHAVE_ETAPAS = "crawjud:etapas:{site}"
+
+# Peso da observação mais recente na média móvel exponencial
+PESO_OBSERVACAO = 0.2
+
+# Fração da média usada como intervalo entre verificações
+FRACAO_INTERVALO = 0.1
+
+# Limites (segundos) do intervalo entre verificações de condições Python
+INTERVALO_MINIMO = 0.05
+INTERVALO_MAXIMO = 0.5
+
+# Quantidade de observações acumuladas antes de gravar no Redis
+INTERVALO_PERSISTENCIA = 10
+
+
+class Etapas:
+    """Execute esperas nomeadas com intervalo aprendido por site.
+
+    Args:
+        driver (WebDriver): WebDriver do robô.
+        site (str): Identificador do site/tribunal (ex.: "projudi").
+
+    """
+
+    _medias: ClassVar[dict[str, dict[str, float]]] = {}
+    _pendentes: ClassVar[dict[str, int]] = {}
+    _lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, driver: WebDriver, site: str) -> None:
+        """Inicialize as etapas do site, carregando as médias do Redis.
+
+        Args:
+            driver (WebDriver): WebDriver do robô.
+            site (str): Identificador do site/tribunal.
+
+        """
+        self._driver = driver
+        self._site = site
+        with self._lock:
+            if site not in self._medias:
+                self._medias[site] = _carregar_medias(site)
+                self._pendentes[site] = 0
+
+    def intervalo(self, nome: str) -> float:
+        """Retorne o intervalo entre verificações da condição da etapa.
+
+        Args:
+            nome (str): Nome da etapa.
+
+        Returns:
+            float: Intervalo em segundos (`INTERVALO_MINIMO` sem histórico).
+
+        """
+        media = self._medias[self._site].get(nome, 0.0)
+        return min(max(media * FRACAO_INTERVALO, INTERVALO_MINIMO), INTERVALO_MAXIMO)
+
+    def aguardar[T](
+        self,
+        nome: str,
+        condicao: Callable[[WebDriver], T] | str,
+        timeout: float = TIMEOUT_PADRAO,
+    ) -> T:
+        """Aguarde a condição da etapa e registre o tempo de prontidão da página.
+
+        Args:
+            nome (str): Nome da etapa, usado para aprender o tempo do site.
+            condicao (Callable[[WebDriver], T] | str): Condição no formato do
+                `WebDriverWait` (ex.: `expected_conditions`) ou expressão JS,
+                avaliada por MutationObserver.
+            timeout (float): Tempo máximo de espera em segundos.
+
+        Returns:
+            T: Valor retornado pela condição.
+
+        Raises:
+            TimeoutException: Se a condição não for satisfeita no timeout.
+
+        """
+        inicio = monotonic()
+        if isinstance(condicao, str):
+            resultado = aguardar_condicao(self._driver, condicao, timeout=timeout)
+            if not resultado:
+                raise TimeoutException(msg=f"Etapa '{nome}' não concluída")
+
+        else:
+            # A primeira verificação é imediata; o intervalo só vale entre
+            # as seguintes
+            resultado = WebDriverWait(
+                self._driver,
+                timeout,
+                poll_frequency=self.intervalo(nome),
+            ).until(condicao)
+
+        self.registrar(nome, monotonic() - inicio)
+        return resultado
+
+    def registrar(self, nome: str, duracao: float) -> None:
+        """Atualize a média de prontidão da etapa com a duração observada.
+
+        Args:
+            nome (str): Nome da etapa.
+            duracao (float): Segundos até a condição da etapa ser satisfeita.
+
+        """
+        with self._lock:
+            medias = self._medias[self._site]
+            anterior = medias.get(nome)
+            medias[nome] = (
+                duracao
+                if anterior is None
+                else anterior + PESO_OBSERVACAO * (duracao - anterior)
+            )
+            self._pendentes[self._site] += 1
+            persistir = self._pendentes[self._site] >= INTERVALO_PERSISTENCIA
+
+        if persistir:
+            self.salvar()
+
+    def salvar(self) -> None:
+        """Grave no Redis as médias aprendidas do site."""
+        with self._lock:
+            medias = dict(self._medias[self._site])
+            self._pendentes[self._site] = 0
+
+        if medias:
+            with suppress(Exception):
+                conexao_redis().hset(
+                    CHAVE_ETAPAS.format(site=self._site),
+                    mapping={nome: f"{media:.3f}" for nome, media in medias.items()},
+                )
+
+
+def _carregar_medias(site: str) -> dict[str, float]:
+    # Sem Redis disponível, as etapas começam sem atraso aprendido
+    with suppress(Exception):
+        dados = conexao_redis().hgetall(CHAVE_ETAPAS.format(site=site))
+        return {
+            _decodifica(nome): float(_decodifica(media))
+            for nome, media in dados.items()
+        }
+
+    return {}
+
+
+def _decodifica(valor: bytes | str) -> str:
+    return valor.decode() if isinstance(valor, bytes) else valor
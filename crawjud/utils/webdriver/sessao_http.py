@@ -0,0 +1,233 @@
+"""Sessão HTTP compartilhada com o navegador do robô.
+
+Depois da autenticação pelo navegador, leituras de páginas renderizadas no
+servidor podem ser feitas por HTTP com a mesma sessão:
+
+    response = self.driver.sessao_http.client.get(url)
+
+Cookies, user agent, idioma e Referer são copiados do navegador para um
+`httpx.Client`/`httpx.AsyncClient` com pool de conexões. A sincronização é
+preguiçosa: navegações do WebDriver marcam a sessão do navegador como
+alterada e os cookies são relidos na próxima requisição HTTP; cookies
+recebidos por HTTP são devolvidos ao navegador antes da próxima navegação.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Client, Cookies, Limits, Request, Response
+from selenium.common.exceptions import WebDriverException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Limites do pool de conexões dos clients HTTP
+LIMITES_POOL = Limits(max_connections=20, max_keepalive_connections=10)
+
+# Timeout (segundos) padrão das requisições HTTP
+TIMEOUT_HTTP = 30
+
+SCRIPT_DADOS_NAVEGADOR = """
+return {
+    userAgent: navigator.userAgent,
+    idiomas: Array.from(navigator.languages || []),
+};
+"""
+
+
+class SessaoHttp:
+    """Mantenha clients httpx sincronizados com a sessão do navegador.
+
+    Args:
+        driver (WebDriver): WebDriver autenticado do robô.
+
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        """Inicialize a sessão sem abrir conexões.
+
+        Args:
+            driver (WebDriver): WebDriver autenticado do robô.
+
+        """
+        self._driver = driver
+        self._lock = Lock()
+        self._client: Client | None = None
+        self._async_client: AsyncClient | None = None
+        self._headers: dict[str, str] = {}
+        self._navegador_alterado = True
+        self._cookies_http_alterados = False
+
+    @property
+    def client(self) -> Client:
+        """Client httpx síncrono com a sessão do navegador."""
+        with self._lock:
+            if self._client is None:
+                self._client = Client(
+                    timeout=TIMEOUT_HTTP,
+                    limits=LIMITES_POOL,
+                    follow_redirects=True,
+                    event_hooks={
+                        "request": [self._antes_requisicao],
+                        "response": [self._apos_resposta],
+                    },
+                )
+                self._navegador_alterado = True
+
+        return self._client
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """Client httpx assíncrono com a sessão do navegador."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = AsyncClient(
+                    timeout=TIMEOUT_HTTP,
+                    limits=LIMITES_POOL,
+                    follow_redirects=True,
+                    event_hooks={
+                        "request": [self._antes_requisicao_async],
+                        "response": [self._apos_resposta_async],
+                    },
+                )
+                self._navegador_alterado = True
+
+        return self._async_client
+
+    def marcar_navegacao(self) -> None:
+        """Sinalize que o navegador navegou e pode ter recebido novos cookies."""
+        self._navegador_alterado = True
+
+    def sincronizar(self) -> None:
+        """Sincronize os clients com os cookies e cabeçalhos do navegador."""
+        with self._lock:
+            self._sincronizar()
+
+    def devolver_cookies(self) -> None:
+        """Envie ao navegador os cookies recebidos pelas requisições HTTP."""
+        with self._lock:
+            if not self._cookies_http_alterados:
+                return
+
+            self._cookies_http_alterados = False
+            cookies = [
+                cookie
+                for client in (self._client, self._async_client)
+                if client is not None
+                for cookie in client.cookies.jar
+            ]
+
+        for cookie in cookies:
+            dados = {
+                "name": cookie.name,
+                "value": cookie.value or "",
+                "domain": cookie.domain,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+            }
+            # Navegadores com CDP aceitam cookies de qualquer domínio; os
+            # demais apenas do domínio da página atual
+            try:
+                self._driver.execute(
+                    "executeCdpCommand",
+                    {"cmd": "Network.setCookie", "params": dados},
+                )
+
+            except WebDriverException:
+                with suppress(WebDriverException):
+                    self._driver.add_cookie(dados)
+
+    def close(self) -> None:
+        """Feche os clients e libere as conexões do pool."""
+        with self._lock:
+            client, self._client = self._client, None
+            async_client, self._async_client = self._async_client, None
+
+        if client is not None:
+            with suppress(Exception):
+                client.close()
+
+        if async_client is not None:
+            _fechar_async(async_client)
+
+    def _sincronizar(self) -> None:
+        # Chamado com o lock adquirido
+        cookies = Cookies()
+        for cookie in self._driver.get_cookies():
+            cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+        if not self._headers:
+            dados = self._driver.execute_script(SCRIPT_DADOS_NAVEGADOR) or {}
+            self._headers["User-Agent"] = dados.get("userAgent", "")
+            if dados.get("idiomas"):
+                self._headers["Accept-Language"] = ",".join(dados["idiomas"])
+
+        self._headers["Referer"] = self._driver.current_url
+
+        for client in (self._client, self._async_client):
+            if client is not None:
+                client.cookies.update(cookies)
+                client.headers.update(self._headers)
+
+        self._navegador_alterado = False
+
+    def _antes_requisicao(self, request: Request) -> None:
+        if not self._navegador_alterado:
+            return
+
+        with self._lock:
+            if self._navegador_alterado:
+                self._sincronizar()
+
+        # Cabeçalhos e cookies do client já foram aplicados a esta requisição
+        _reaplicar_sessao(request, self._headers, self._client)
+
+    def _apos_resposta(self, response: Response) -> None:
+        if "set-cookie" in response.headers:
+            self._cookies_http_alterados = True
+
+    async def _antes_requisicao_async(self, request: Request) -> None:
+        if not self._navegador_alterado:
+            return
+
+        with self._lock:
+            if self._navegador_alterado:
+                self._sincronizar()
+
+        _reaplicar_sessao(request, self._headers, self._async_client)
+
+    async def _apos_resposta_async(self, response: Response) -> None:
+        self._apos_resposta(response)
+
+
+def _reaplicar_sessao(
+    request: Request,
+    headers: dict[str, str],
+    client: Client | AsyncClient | None,
+) -> None:
+    request.headers.update(headers)
+    if client is not None:
+        request.headers.pop("Cookie", None)
+        client.cookies.set_cookie_header(request)
+
+
+def _fechar_async(client: AsyncClient) -> None:
+    # Dentro de um event loop o fechamento é agendado; fora dele, executado
+    try:
+        loop = asyncio.get_running_loop()
+
+    except RuntimeError:
+        with suppress(Exception):
+            asyncio.run(client.aclose())
+        return
+
+    loop.create_task(client.aclose())  # noqa: RUF006
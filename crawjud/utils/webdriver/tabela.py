@@ -0,0 +1,127 @@
+"""Extração de tabelas do DOM em uma única chamada de script.
+
+Em vez de `find_elements(By.TAG_NAME, "td")` e `.text` por célula (uma ida
+ao WebDriver por célula), as linhas são serializadas no navegador com texto,
+links, atributos e o texto de tags internas, e os filtros rodam em Python
+sobre o snapshot.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+# `alvo` é a lista de linhas (<tr>) ou o elemento da tabela; as células
+# seguem a mesma semântica de `find_elements(By.TAG_NAME, "td")`
+SCRIPT_EXTRAIR_LINHAS = """
+const [alvo, tags] = arguments;
+const linhas = Array.isArray(alvo) ? alvo : Array.from(alvo.querySelectorAll("tr"));
+const atributos = (el) => Object.fromEntries(
+    Array.from(el.attributes, (attr) => [attr.name, attr.value]),
+);
+const texto = (el) => (el ? el.innerText.trim() : null);
+return linhas.map((linha) => ({
+    atributos: atributos(linha),
+    celulas: Array.from(linha.querySelectorAll("td"), (td) => ({
+        texto: texto(td),
+        atributos: atributos(td),
+        links: Array.from(td.querySelectorAll("a[href]"), (a) => ({
+            texto: texto(a),
+            href: a.href,
+        })),
+        tags: Object.fromEntries(
+            tags.map((tag) => [tag, texto(td.querySelector(tag))]),
+        ),
+    })),
+}));
+"""
+
+
+class LinkCelula(TypedDict):
+    """Defina um link contido em uma célula.
+
+    Args:
+        texto (str): Texto do link.
+        href (str): URL absoluta do link.
+
+    """
+
+    texto: str
+    href: str
+
+
+class CelulaTabela(TypedDict):
+    """Defina o snapshot de uma célula (<td>).
+
+    Args:
+        texto (str): Texto visível da célula.
+        atributos (dict[str, str]): Atributos HTML da célula.
+        links (list[LinkCelula]): Links contidos na célula.
+        tags (dict[str, str | None]): Texto da primeira ocorrência de cada tag
+            solicitada (ex.: {"b": "JUNTADA"}), ou None se ausente.
+
+    """
+
+    texto: str
+    atributos: dict[str, str]
+    links: list[LinkCelula]
+    tags: dict[str, str | None]
+
+
+class LinhaTabela(TypedDict):
+    """Defina o snapshot de uma linha (<tr>).
+
+    Args:
+        atributos (dict[str, str]): Atributos HTML da linha.
+        celulas (list[CelulaTabela]): Células da linha.
+
+    """
+
+    atributos: dict[str, str]
+    celulas: list[CelulaTabela]
+
+
+def extrair_linhas(
+    driver: WebDriver,
+    linhas: Sequence[WebElement],
+    tags: Sequence[str] = (),
+) -> list[LinhaTabela]:
+    """Serialize as linhas informadas em uma única chamada ao WebDriver.
+
+    Args:
+        driver (WebDriver): WebDriver da página.
+        linhas (Sequence[WebElement]): Elementos <tr> já localizados.
+        tags (Sequence[str]): Tags internas cujo texto deve ser extraído.
+
+    Returns:
+        list[LinhaTabela]: Snapshot das linhas, na mesma ordem de `linhas`.
+
+    """
+    if not linhas:
+        return []
+
+    return driver.execute_script(SCRIPT_EXTRAIR_LINHAS, list(linhas), list(tags))
+
+
+def extrair_tabela(
+    driver: WebDriver,
+    tabela: WebElement,
+    tags: Sequence[str] = (),
+) -> list[LinhaTabela]:
+    """Serialize todas as linhas (<tr>) da tabela em uma única chamada.
+
+    Args:
+        driver (WebDriver): WebDriver da página.
+        tabela (WebElement): Elemento da tabela.
+        tags (Sequence[str]): Tags internas cujo texto deve ser extraído.
+
+    Returns:
+        list[LinhaTabela]: Snapshot das linhas da tabela.
+
+    """
+    return driver.execute_script(SCRIPT_EXTRAIR_LINHAS, tabela, list(tags))
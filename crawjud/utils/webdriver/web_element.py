@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
+import json
 from time import sleep
 from typing import TYPE_CHECKING, Self
 
-from selenium.common.exceptions import (
-    NoSuchElementException,
-)
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from crawjud.utils.webdriver.dom_wait import (
+    TIMEOUT_PADRAO,
+    aguardar_ausencia,
+    aguardar_condicao,
+)
+
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
 
+# Caracteres das teclas especiais do Selenium (ENTER, TAB, CONTROL...)
+TECLAS_ESPECIAIS = frozenset(
+    getattr(Keys, nome) for nome in dir(Keys) if not nome.startswith("_")
+)
+
+# Define o valor do campo em uma única chamada e dispara os eventos
+# input/change. Retorna false quando o campo exige digitação real.
+SCRIPT_DIGITACAO_RAPIDA = """
+const [el, valor] = arguments;
+const campoTexto = (
+    el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement
+);
+if (
+    !campoTexto || el.type === "file" || el.readOnly || el.disabled
+    || el.hasAttribute("data-mask") || el.hasAttribute("data-inputmask")
+) {
+    return false;
+}
+const proto = Object.getPrototypeOf(el);
+const setter = Object.getOwnPropertyDescriptor(proto, "value").set;
+el.focus();
+setter.call(el, el.value + valor);
+el.dispatchEvent(new Event("input", { bubbles: true }));
+el.dispatchEvent(new Event("change", { bubbles: true }));
+return true;
+"""
+
 
 class WebElementBot(WebElement):  # noqa: D101
     _cuurent_driver: WebDriver = None
@@ -39,19 +69,35 @@ class WebElementBot(WebElement):  # noqa: D101
         super().click()
         sleep(0.05)
 
-    def send_keys(self, word: any) -> None:
-        send = None
-        for key in dir(Keys):
-            if getattr(Keys, key) == word:
-                send = ""
-                super().send_keys(word)
-                break
+    def send_keys(self, *value: str, digitacao_rapida: bool = False) -> None:
+        """Preencha o elemento com o texto informado, caractere a caractere.
+
+        Com `digitacao_rapida=True` o valor é definido em uma única chamada de
+        script, disparando apenas os eventos `input`/`change`: use somente em
+        campos sem máscara nem listeners de teclado (autocompletes, por
+        exemplo). Teclas especiais e múltiplos argumentos usam o envio nativo.
+
+        Args:
+            *value (str): Texto ou teclas especiais a enviar.
+            digitacao_rapida (bool): Define o valor por script, sem digitar.
+
+        """
+        texto = "".join(str(item) for item in value)
+        if len(value) != 1 or any(c in TECLAS_ESPECIAIS for c in texto):
+            super().send_keys(*value)
+            return
+
+        if digitacao_rapida and self.parent.execute_script(
+            SCRIPT_DIGITACAO_RAPIDA,
+            self,
+            texto,
+        ):
+            return
 
-        if send is None:
-            self.click()
-            for c in str(word):
-                sleep(0.005)
-                super().send_keys(c)
+        self.click()
+        for c in texto:
+            sleep(0.005)
+            super().send_keys(c)
 
     def double_click(self) -> None:
         """Double-click on the given webelement."""
@@ -118,52 +164,56 @@ class WebElementBot(WebElement):  # noqa: D101
     #         if not load:
     #             break
 
-    def display_none(self) -> None:
-        """Wait for an element's display style to change to 'none'.
+    def display_none(self, timeout: float = TIMEOUT_PADRAO) -> None:
+        """Wait until the element's inline style no longer has 'display: none;'.
+
+        Despite the name, this waits for the element to be shown, as the
+        original polling loop did.
 
         Args:
-            elemento (WebElement): The element to monitor.
+            timeout (float): Maximum wait time in seconds.
+
+        Raises:
+            TimeoutException: If the element is still hidden after the timeout.
 
         """
-        while True:
-            style = self.get_attribute("style")
-            if "display: none;" not in style:
-                sleep(0.01)
-                break
-
-    def wait_caixa(self) -> None:
-        """Wait until a modal dialog (caixa) is displayed on the page."""
-        while True:
-            check_wait = None
-            with suppress(NoSuchElementException):
-                check_wait = super().find_element(
-                    By.CSS_SELECTOR,
-                    'div[id="modal:waitContainer"][style="position: absolute; z-index: 100; background-color: inherit; display: none;"]',  # noqa: E501
-                )
-
-            if check_wait:
-                break
-
-    def wait_fileupload(self) -> None:
-        """Wait until the file upload progress completes.
+        condicao = "!(raiz.getAttribute('style') || '').includes('display: none;')"
+        if not aguardar_condicao(self.parent, condicao, self, timeout):
+            raise TimeoutException(msg="Elemento não foi exibido")
+
+    def wait_caixa(self, timeout: float = TIMEOUT_PADRAO) -> None:
+        """Wait until the modal wait container (caixa) is hidden on the page.
+
+        Args:
+            timeout (float): Maximum wait time in seconds.
+
+        Raises:
+            TimeoutException: If the modal is still displayed after the timeout.
 
-        Checks repeatedly until no progress bar is present.
         """
-        while True:
-            sleep(0.05)
-            div1 = 'div[class="ui-fileupload-files"]'
-            div2 = 'div[class="ui-fileupload-row"]'
-            div0 = 'div[id="processoValorPagamentoEditForm:pvp:j_id_2m_1_i_2_1_9_g_1:uploadGedEFile"]'
-            progress_bar = None
+        seletor = json.dumps('div[id="modal:waitContainer"]')
+        condicao = (
+            f"(modal => modal !== null && modal.style.display === 'none')"
+            f"(raiz.querySelector({seletor}))"
+        )
+        if not aguardar_condicao(self.parent, condicao, self, timeout):
+            raise TimeoutException(msg="Modal de espera não foi ocultado")
+
+    def wait_fileupload(self, timeout: float = TIMEOUT_PADRAO) -> None:
+        """Wait until the file upload progress completes.
 
-            div0progress_bar = super().find_element(By.CSS_SELECTOR, div0)
-            div1progress_bar = div0progress_bar.find_element(By.CSS_SELECTOR, div1)
+        Args:
+            timeout (float): Maximum wait time in seconds.
 
-            with suppress(NoSuchElementException):
-                progress_bar = div1progress_bar.find_element(By.CSS_SELECTOR, div2)
+        Raises:
+            TimeoutException: If a progress row is still present after the timeout.
 
-            if progress_bar is None:
-                break
+        """
+        div0 = 'div[id="processoValorPagamentoEditForm:pvp:j_id_2m_1_i_2_1_9_g_1:uploadGedEFile"]'  # noqa: E501
+        div1 = 'div[class="ui-fileupload-files"]'
+        div2 = 'div[class="ui-fileupload-row"]'
+        if not aguardar_ausencia(self.parent, f"{div0} {div1} {div2}", self, timeout):
+            raise TimeoutException(msg="Upload do arquivo não foi concluído")
 
     def scroll_to(self) -> None:
         """Scroll the view to the specified web element."""
@@ -0,0 +1,20 @@
+"""Configuração compartilhada dos testes."""
+
+from pathlib import Path
+
+import pytest
+
+# Importar `crawjud.bots` antes de `crawjud.utils` entra no ciclo de importação
+# decorators -> bot_head -> utils -> decorators
+import crawjud.utils  # noqa: F401
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    """Diretório com as páginas salvas usadas pelos testes.
+
+    Returns:
+        Path: Caminho de `tests/fixtures`.
+
+    """
+    return Path(__file__).parent / "fixtures"
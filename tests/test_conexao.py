@@ -0,0 +1,19 @@
+"""Testes da conexão Redis compartilhada."""
+
+from crawjud.utils.models.conexao import conexao_redis
+
+
+def test_client_compartilhado() -> None:
+    """Chamadas repetidas devolvem o mesmo client (e o mesmo pool)."""
+    client = conexao_redis()
+
+    assert conexao_redis() is client
+    assert client.connection_pool is conexao_redis().connection_pool
+
+
+def test_client_binario_separado() -> None:
+    """O client sem decodificação é outro, também compartilhado."""
+    binario = conexao_redis(decode_responses=False)
+
+    assert binario is not conexao_redis()
+    assert conexao_redis(decode_responses=False) is binario
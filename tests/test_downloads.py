@@ -0,0 +1,73 @@
+"""Testes da espera por downloads do navegador."""
+
+import os
+import threading
+from pathlib import Path
+from time import sleep, time
+
+from crawjud.utils.downloads import aguardar_download, enviar_ao_storage
+
+
+class _Storage:
+    # Registra os envios no lugar do bucket
+    def __init__(self) -> None:
+        self.enviados: dict[str, bytes] = {}
+
+    def upload_file(self, object_name: str, file_path: Path) -> None:
+        self.enviados[object_name] = file_path.read_bytes()
+
+
+def _concluir_download(parcial: Path, final: Path) -> None:
+    # Como o Chrome: grava o `.crdownload` e o renomeia ao terminar
+    sleep(0.2)
+    parcial.write_bytes(b"%PDF")
+    sleep(0.2)
+    parcial.rename(final)
+
+
+def test_ignora_arquivos_anteriores(tmp_path: Path) -> None:
+    """Documentos antigos, inclusive nas subpastas, não são o download."""
+    antigo = tmp_path / "processo" / "documento.pdf"
+    antigo.parent.mkdir()
+    antigo.write_bytes(b"%PDF")
+    os.utime(antigo, (time() - 60, time() - 60))
+
+    assert aguardar_download(tmp_path, "documento.pdf", timeout=0.5) is None
+
+
+def test_aguarda_download_em_andamento(tmp_path: Path) -> None:
+    """O arquivo é devolvido ao terminar o download e movido ao destino."""
+    destino = tmp_path / "destino.pdf"
+    download = threading.Thread(
+        target=_concluir_download,
+        args=(tmp_path / "documento.pdf.crdownload", tmp_path / "documento.pdf"),
+    )
+    download.start()
+
+    caminho = aguardar_download(tmp_path, "documento.pdf", 5, destino)
+    download.join()
+
+    assert caminho == destino
+    assert destino.read_bytes() == b"%PDF"
+
+
+def test_aceita_download_concluido_apos_o_clique(tmp_path: Path) -> None:
+    """Downloads concluídos entre o clique e a chamada também contam."""
+    inicio = time()
+    (tmp_path / "documento.pdf").write_bytes(b"%PDF")
+
+    caminho = aguardar_download(tmp_path, "documento.pdf", 0.5, desde=inicio)
+
+    assert caminho == tmp_path / "documento.pdf"
+
+
+def test_envia_ao_storage(tmp_path: Path) -> None:
+    """O arquivo vai para o bucket e a cópia local é removida."""
+    caminho = tmp_path / "documento.pdf"
+    caminho.write_bytes(b"%PDF")
+    storage = _Storage()
+
+    enviar_ao_storage(caminho, "pid/documento.pdf", storage)
+
+    assert storage.enviados == {"pid/documento.pdf": b"%PDF"}
+    assert not caminho.exists()
@@ -0,0 +1,118 @@
+"""Testes dos cursores da paginação por chave."""
+
+import base64
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+
+from crawjud.utils.paginacao import (
+    decode_cursor,
+    encode_cursor,
+    filtro_chave,
+    proximo_cursor,
+)
+
+
+def test_cursor_ida_e_volta() -> None:
+    """O cursor devolve a mesma chave usada para gerá-lo."""
+    data = datetime(2024, 5, 17, 13, 45, 12, 345678, tzinfo=UTC)
+
+    assert decode_cursor(encode_cursor(data, 42)) == (data, 42)
+
+
+def test_cursor_seguro_para_url() -> None:
+    """O cursor usa apenas o alfabeto base64 seguro para URLs."""
+    cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=UTC), 7)
+
+    assert set(cursor) <= set(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=",
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "não é base64",
+        base64.urlsafe_b64encode(b"sem-separador").decode(),
+        base64.urlsafe_b64encode(b"2024-01-01T00:00:00|abc").decode(),
+        base64.urlsafe_b64encode(b"ontem|1").decode(),
+    ],
+)
+def test_cursor_invalido(cursor: str) -> None:
+    """Cursores malformados levantam ValueError (resposta 400)."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        decode_cursor(cursor)
+
+
+@pytest.fixture
+def execucoes() -> Iterator[tuple[Connection, Table]]:
+    """Tabela de execuções em SQLite com execuções sem data.
+
+    Yields:
+        tuple[Connection, Table]: Conexão e tabela populada.
+
+    """
+    tabela = Table(
+        "executions",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("data_execucao", DateTime),
+    )
+    engine = create_engine("sqlite://")
+    with engine.connect() as conexao:
+        tabela.create(conexao)
+        conexao.execute(
+            insert(tabela),
+            [
+                # Sem o filtro, a primeira página terminaria na execução 1,
+                # sem data para o cursor
+                {"id": 1, "data_execucao": None},
+                {"id": 2, "data_execucao": datetime(2024, 1, 2, tzinfo=UTC)},
+                {"id": 3, "data_execucao": None},
+                {"id": 4, "data_execucao": datetime(2024, 1, 2, tzinfo=UTC)},
+                {"id": 5, "data_execucao": datetime(2024, 1, 3, tzinfo=UTC)},
+            ],
+        )
+        yield conexao, tabela
+
+
+def test_paginas_ignoram_execucoes_sem_data(
+    execucoes: tuple[Connection, Table],
+) -> None:
+    """As páginas seguem pela chave sem repetir itens nem quebrar no NULL."""
+    conexao, tabela = execucoes
+    paginas: list[list[int]] = []
+    cursor = None
+    while True:
+        query = (
+            select(tabela.c.id, tabela.c.data_execucao)
+            .where(*filtro_chave(tabela.c.data_execucao, tabela.c.id, cursor))
+            # NULL primeiro, como o DESC do PostgreSQL
+            .order_by(
+                tabela.c.data_execucao.desc().nulls_first(),
+                tabela.c.id.desc(),
+            )
+            .limit(2 + 1)
+        )
+        rows, cursor = proximo_cursor(
+            conexao.execute(query).all(),
+            2,
+            "data_execucao",
+        )
+        paginas.append([row.id for row in rows])
+        if cursor is None:
+            break
+
+    assert paginas == [[5, 4], [2]]
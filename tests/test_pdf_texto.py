@@ -0,0 +1,90 @@
+"""Testes da extração de texto de PDFs no pool."""
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from crawjud.utils import pdf_texto
+
+
+def _pdf(texto: str) -> bytes:
+    # PDF mínimo de uma página com o texto em Helvetica
+    conteudo = f"BT /F1 12 Tf 72 720 Td ({texto}) Tj ET".encode()
+    objetos = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>"
+        ),
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(conteudo), conteudo),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for numero, objeto in enumerate(objetos, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (numero, objeto)
+
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objetos) + 1)
+    pdf += b"startxref\n%d\n%%%%EOF\n" % xref
+    return bytes(pdf)
+
+
+@pytest.fixture
+def pdf(tmp_path: Path) -> Path:
+    """PDF com um código de processo no texto.
+
+    Returns:
+        Path: Caminho do PDF.
+
+    """
+    caminho = tmp_path / "documento.pdf"
+    caminho.write_bytes(_pdf("Processo 0001234-56.2024"))
+    return caminho
+
+
+def _extrair_em_processo_daemon(
+    caminho: str,
+    fila: multiprocessing.Queue,
+) -> None:
+    # Como um worker prefork do Celery: processo daemônico sem pool nem
+    # resultados herdados do processo pai
+    pdf_texto._pool = None  # noqa: SLF001
+    pdf_texto._cache.clear()  # noqa: SLF001
+    try:
+        fila.put((
+            pdf_texto.extrair_texto(caminho),
+            pdf_texto.buscar_padrao(caminho, r"\d{7}-\d{2}"),
+        ))
+
+    except Exception as e:  # noqa: BLE001
+        fila.put(repr(e))
+
+
+def test_extrai_texto(pdf: Path) -> None:
+    """O texto e o padrão são encontrados no PDF."""
+    assert "Processo 0001234-56.2024" in pdf_texto.extrair_texto(pdf)
+    assert pdf_texto.buscar_padrao(pdf, r"\d{7}-\d{2}") == "0001234-56"
+    assert pdf_texto.contem_palavra(pdf, "PROCESSO")
+
+
+def test_extrai_em_processo_daemon(pdf: Path) -> None:
+    """Em processos daemônicos, sem processos filhos, a extração usa threads."""
+    contexto = multiprocessing.get_context("fork")
+    fila = contexto.Queue()
+    processo = contexto.Process(
+        target=_extrair_em_processo_daemon,
+        args=(str(pdf), fila),
+        daemon=True,
+    )
+    processo.start()
+    resultado = fila.get(timeout=30)
+    processo.join(timeout=30)
+
+    assert resultado == ("Processo 0001234-56.2024", "0001234-56")
@@ -0,0 +1,40 @@
+"""Testes do progresso agregado das transferências paralelas do storage."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from crawjud.utils.storage import _ProgressoAgregado
+
+
+def test_acumula_progresso() -> None:
+    """O callback recebe o total acumulado e o tamanho total."""
+    chamadas: list[tuple[int, int]] = []
+    progresso = _ProgressoAgregado(
+        10,
+        lambda feito, total: chamadas.append((feito, total)),
+    )
+
+    progresso.avancar(3)
+    progresso.avancar(7)
+
+    assert chamadas == [(3, 10), (10, 10)]
+
+
+def test_sem_callback() -> None:
+    """Sem callback, o avanço é ignorado."""
+    progresso = _ProgressoAgregado(10, None)
+
+    progresso.avancar(5)
+
+
+def test_transferencias_paralelas() -> None:
+    """Avanços concorrentes não perdem nem repetem bytes."""
+    chamadas: list[int] = []
+    progresso = _ProgressoAgregado(
+        1000,
+        lambda feito, _total: chamadas.append(feito),
+    )
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(progresso.avancar, [1] * 1000))
+
+    assert sorted(chamadas) == list(range(1, 1001))
@@ -0,0 +1,162 @@
+"""Testes do heap de próximas execuções do DatabaseScheduler."""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from celery import Celery
+from sqlalchemy import Engine, create_engine, select
+
+from crawjud.addons import scheduler as modulo
+from crawjud.models.schedule import CrontabModel, ScheduleModel
+
+
+@pytest.fixture
+def banco(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    """Banco SQLite com as tabelas de agendamento.
+
+    Yields:
+        Engine: Engine do banco usado pelo scheduler.
+
+    """
+    uri = f"sqlite:///{tmp_path / 'beat.db'}"
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URI", uri)
+    engine = create_engine(uri)
+    ScheduleModel.metadata.create_all(
+        engine,
+        tables=[CrontabModel.__table__, ScheduleModel.__table__],
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def versao(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Contador de versão dos agendamentos, no lugar do Redis.
+
+    Returns:
+        dict[str, int]: Valor atual do contador (alterável pelo teste).
+
+    """
+    atual = {"valor": 1}
+    monkeypatch.setattr(modulo, "schedule_version", lambda: atual["valor"])
+    return atual
+
+
+@pytest.fixture
+def beat(
+    banco: Engine,  # noqa: ARG001
+    versao: dict[str, int],  # noqa: ARG001
+) -> Iterator[modulo.DatabaseScheduler]:
+    """Scheduler que registra os disparos em vez de publicar as tasks.
+
+    Yields:
+        DatabaseScheduler: Scheduler com os agendamentos do banco.
+
+    """
+    app = Celery("teste", set_as_current=False)
+    app.conf.beat_schedule = {}
+    scheduler = modulo.DatabaseScheduler(app=app, max_interval=300)
+    scheduler.disparos = []
+    # Sem broker: registra os disparos no lugar de publicar as tasks
+    scheduler.__dict__["producer"] = None
+    scheduler.apply_entry = lambda entry, **_kwargs: scheduler.disparos.append(
+        entry.name,
+    )
+    yield scheduler
+    scheduler.close()
+
+
+def agendar(engine: Engine, nome: str, last_run_at: datetime | None = None) -> str:
+    """Cadastre um agendamento executado a cada minuto.
+
+    Returns:
+        str: Chave do agendamento no scheduler.
+
+    """
+    with engine.begin() as conn:
+        crontab_id = conn.execute(
+            CrontabModel.__table__.insert().values(
+                minute="*",
+                hour="*",
+                day_of_week="*",
+                day_of_month="*",
+                month_of_year="*",
+            ),
+        ).inserted_primary_key[0]
+        agendamento_id = conn.execute(
+            ScheduleModel.__table__.insert().values(
+                name=nome,
+                task="crawjud.teste",
+                schedule_id=crontab_id,
+                args="[]",
+                kwargs="{}",
+                last_run_at=last_run_at,
+            ),
+        ).inserted_primary_key[0]
+
+    return f"{nome}:{agendamento_id}"
+
+
+def test_sem_agendamentos_aguarda_max_interval(
+    beat: modulo.DatabaseScheduler,
+) -> None:
+    """Sem agendamentos, o Beat dorme o intervalo máximo."""
+    assert beat.tick() == beat.max_interval
+    assert beat.disparos == []
+
+
+def test_dispara_somente_entradas_vencidas(
+    banco: Engine,
+    versao: dict[str, int],
+    beat: modulo.DatabaseScheduler,
+) -> None:
+    """Só o topo vencido do heap é disparado e volta com o próximo horário."""
+    vencido = agendar(banco, "vencido", last_run_at=datetime(2000, 1, 1, tzinfo=UTC))
+    agendar(banco, "em_dia")
+    versao["valor"] += 1
+
+    espera = beat.tick()
+
+    assert beat.disparos == [vencido]
+    assert 0 <= espera <= 60
+    heap = beat._heap  # noqa: SLF001
+    assert sorted(chave for _, chave in heap) == sorted(beat.get_schedule())
+
+    beat.tick()
+    assert beat.disparos == [vencido]
+
+
+def test_grava_last_run_at_em_lote(
+    banco: Engine,
+    versao: dict[str, int],
+    beat: modulo.DatabaseScheduler,
+) -> None:
+    """Os `last_run_at` dos disparos são gravados no `sync`."""
+    agendar(banco, "vencido", last_run_at=datetime(2000, 1, 1, tzinfo=UTC))
+    versao["valor"] += 1
+    beat.tick()
+
+    beat.sync()
+
+    tabela = ScheduleModel.__table__
+    with banco.connect() as conn:
+        last_run_at = conn.scalar(select(tabela.c.last_run_at))
+    assert last_run_at.year > 2000
+
+
+def test_rele_tabela_somente_quando_a_versao_muda(
+    banco: Engine,
+    versao: dict[str, int],
+    beat: modulo.DatabaseScheduler,
+) -> None:
+    """A tabela só é relida quando o contador de versão muda."""
+    chave = agendar(banco, "novo")
+
+    beat.tick()
+    assert chave not in beat.get_schedule()
+
+    versao["valor"] += 1
+    beat.tick()
+    assert chave in beat.get_schedule()
@@ -0,0 +1,75 @@
+"""Testes da extração da capa do Projudi a partir do `page_source`."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from crawjud.bots.projudi.resources import schema_capa
+
+
+@pytest.fixture
+def pagina(fixtures_dir: Path) -> Callable[[str], str]:
+    """Carregue uma página salva do Projudi.
+
+    Returns:
+        Callable[[str], str]: Função que devolve o HTML pelo nome do arquivo.
+
+    """
+
+    def carregar(nome: str) -> str:
+        return (fixtures_dir / "projudi" / nome).read_text(encoding="utf-8")
+
+    return carregar
+
+
+def test_info_geral_primeiro_grau(pagina) -> None:
+    """Labels e valores do 1º grau, com `<br>` como quebra de linha."""
+    pares = schema_capa.extrai_info_geral(pagina("capa_primeiro_grau.html"), 1)
+
+    assert pares == [
+        ("Processo:", "0001234-56.2024.8.04.0001"),
+        ("Classe Processual:", "Procedimento do Juizado Especial Cível"),
+        ("Valor da Causa:", "R$ 1.000,00"),
+        ("Segredo de Justiça:", "NÃO"),
+        ("Assuntos:", "Indenização por Dano Moral\nIndenização por Dano Material"),
+        ("Distribuição:", "01/02/2024 10:00:00"),
+    ]
+
+
+def test_info_geral_segundo_grau_le_apenas_recurso(pagina) -> None:
+    """No 2º grau apenas o primeiro fieldset do recurso é lido."""
+    pares = schema_capa.extrai_info_geral(pagina("capa_segundo_grau.html"), 2)
+
+    assert pares == [
+        ("Recurso:", "Recurso Inominado Cível"),
+        ("Relator:", "Juiz Relator"),
+    ]
+
+
+def test_info_geral_sem_painel() -> None:
+    """Páginas sem o painel não geram pares."""
+    assert schema_capa.extrai_info_geral("<html><body></body></html>", 1) == []
+
+
+def test_partes(pagina) -> None:
+    """Tabelas de partes ignoram títulos vazios e linhas ocultas."""
+    tabelas = schema_capa.extrai_partes(pagina("capa_partes.html"))
+
+    assert tabelas == [
+        {
+            "tipo": "Polo Ativo",
+            "colunas": ["NOME", "DOCUMENTO", "ADVOGADOS"],
+            "linhas": [
+                ["FULANO DE TAL", "123.456.789-00", "ADVOGADO UM\nADVOGADO DOIS"],
+            ],
+        },
+        {
+            "tipo": "Polo Passivo",
+            "colunas": ["NOME", "DOCUMENTO"],
+            "linhas": [
+                ["EMPRESA S.A.", "00.000.000/0001-00"],
+                ["OUTRA EMPRESA LTDA", ""],
+            ],
+        },
+    ]
@@ -0,0 +1,52 @@
+"""Testes da extração da capa do ESAJ a partir do HTML da página."""
+
+from pathlib import Path
+
+from crawjud.bots.esaj.resources import schema_capa
+
+
+def test_extrai_capa(fixtures_dir: Path) -> None:
+    """Resumo, "Mais detalhes" (oculto no navegador) e partes principais."""
+    pagina = (fixtures_dir / "esaj" / "capa.html").read_text(encoding="utf-8")
+
+    capa = schema_capa.extrai_capa(pagina)
+
+    assert capa == {
+        "numero": "0601234-56.2024.8.04.0001",
+        "situacao": "Em grau de recurso",
+        "campos": [
+            ("CLASSE", "Procedimento Comum Cível"),
+            ("ASSUNTO", "Indenização por Dano Moral"),
+            ("VARA", "1ª Vara Cível"),
+            ("DISTRIBUIÇÃO", "01/02/2024 às 10:00 - Livre"),
+            ("VALOR_DA_AÇÃO", "R$ 1.000,00"),
+            ("OUTROS_ASSUNTOS", "Dano Material Responsabilidade Civil"),
+        ],
+        "partes": [
+            {
+                "tipo": "Reqte",
+                "linhas": [
+                    "Maria da Silva",
+                    "Advogado: João Souza",
+                    "Advogada: Ana Lima",
+                ],
+                "documentos": ["OAB 1234/AM"],
+            },
+            {
+                "tipo": "Reqdo",
+                "linhas": ["Banco Exemplo S.A."],
+                "documentos": [],
+            },
+        ],
+    }
+
+
+def test_pagina_sem_capa() -> None:
+    """Listagens de processos e a tela de login não são capas."""
+    listagem = (
+        '<html><body><div id="listagemDeProcessos"><ul><li>'
+        '<a href="show.do?processo.codigo=1">0601234-56</a>'
+        "</li></ul></div></body></html>"
+    )
+
+    assert schema_capa.extrai_capa(listagem) is None
@@ -0,0 +1,257 @@
+"""Testes do recebimento de chunks de upload (offsets e partes do multipart)."""
+
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from io import BytesIO
+
+import pytest
+
+from crawjud.interfaces.controllers import file_service
+
+OBJETO = "SID/arquivo.pdf"
+
+
+class RedisFalso:
+    """Subconjunto do Redis usado por `_receber_chunk`, em memória."""
+
+    def __init__(self) -> None:
+        """Inicialize o Redis vazio."""
+        self.dados: dict = {}
+
+    def lock(self, *_args: object, **_kwargs: object) -> AbstractContextManager:
+        """Lock sem concorrência (um único processo nos testes).
+
+        Returns:
+            AbstractContextManager: Contexto sem efeito.
+
+        """
+        return nullcontext()
+
+    @contextmanager
+    def pipeline(self) -> Generator["RedisFalso"]:
+        """Pipeline que aplica os comandos imediatamente.
+
+        Yields:
+            RedisFalso: A própria conexão.
+
+        """
+        yield self
+
+    def execute(self) -> None:
+        """Comandos do pipeline já foram aplicados."""
+
+    def hgetall(self, chave: str) -> dict[bytes, bytes]:
+        """Campos do hash, como bytes.
+
+        Returns:
+            dict[bytes, bytes]: Campos e valores do hash.
+
+        """
+        return {
+            campo.encode(): str(valor).encode()
+            for campo, valor in self.dados.get(chave, {}).items()
+        }
+
+    def hset(
+        self,
+        chave: str,
+        campo: str | None = None,
+        valor: object = None,
+        mapping: dict | None = None,
+    ) -> None:
+        """Atualize campos do hash."""
+        self.dados.setdefault(chave, {}).update(mapping or {campo: valor})
+
+    def append(self, chave: str, valor: bytes) -> None:
+        """Concatene bytes à string."""
+        self.dados[chave] = self.dados.get(chave, b"") + valor
+
+    def strlen(self, chave: str) -> int:
+        """Tamanho da string.
+
+        Returns:
+            int: Quantidade de bytes da string.
+
+        """
+        return len(self.dados.get(chave, b""))
+
+    def get(self, chave: str) -> bytes | None:
+        """Valor da string.
+
+        Returns:
+            bytes | None: Valor ou None se a chave não existir.
+
+        """
+        return self.dados.get(chave)
+
+    def expire(self, *_args: object) -> None:
+        """TTL não é simulado."""
+
+    def delete(self, *chaves: str) -> None:
+        """Remova as chaves."""
+        for chave in chaves:
+            self.dados.pop(chave, None)
+
+
+class StorageFalso:
+    """Registra as chamadas de upload feitas ao storage."""
+
+    def __init__(self) -> None:
+        """Inicialize o storage vazio."""
+        self.objetos: dict[str, bytes] = {}
+        self.partes: list[tuple[int, bytes]] = []
+        self.concluidos: list[tuple[str, str, list]] = []
+
+    def put_object(
+        self,
+        object_name: str,
+        data: BytesIO,
+        length: int,
+        content_type: str,
+    ) -> None:
+        """Grave um objeto inteiro."""
+        self.objetos[object_name] = data.read(length)
+
+    def create_multipart_upload(self, _object_name: str, _content_type: str) -> str:
+        """Inicie um upload multipart.
+
+        Returns:
+            str: Upload ID.
+
+        """
+        return "upload-1"
+
+    def upload_part(
+        self,
+        _object_name: str,
+        _upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> str:
+        """Envie uma parte.
+
+        Returns:
+            str: ETag da parte.
+
+        """
+        self.partes.append((part_number, data))
+        return f"etag-{part_number}"
+
+    def complete_multipart_upload(
+        self,
+        object_name: str,
+        upload_id: str,
+        parts: list,
+    ) -> None:
+        """Conclua o upload multipart."""
+        self.concluidos.append((object_name, upload_id, parts))
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> RedisFalso:
+    """Redis em memória usado pelo serviço de arquivos.
+
+    Returns:
+        RedisFalso: Conexão falsa compartilhada pelos chunks.
+
+    """
+    conn = RedisFalso()
+    monkeypatch.setattr(
+        file_service,
+        "conexao_redis",
+        lambda **_kwargs: conn,
+    )
+    return conn
+
+
+@pytest.fixture
+def storage(monkeypatch: pytest.MonkeyPatch) -> StorageFalso:
+    """Storage que registra os uploads.
+
+    Returns:
+        StorageFalso: Storage falso usado pelo serviço de arquivos.
+
+    """
+    falso = StorageFalso()
+    monkeypatch.setattr(file_service, "get_storage", lambda _nome: falso)
+    return falso
+
+
+def receber(inicio: int, chunk: bytes, file_size: int) -> int:
+    """Envie um chunk do arquivo de teste.
+
+    Returns:
+        int: Offset devolvido ao navegador.
+
+    """
+    return file_service._receber_chunk(  # noqa: SLF001
+        OBJETO,
+        inicio,
+        chunk,
+        file_size,
+        "application/pdf",
+    )
+
+
+def test_arquivo_menor_que_uma_parte(
+    redis: RedisFalso,
+    storage: StorageFalso,
+) -> None:
+    """Arquivos menores que uma parte são enviados em um único PutObject."""
+    assert receber(0, b"ab", 4) == 2
+    assert receber(2, b"cd", 4) == 4
+
+    assert storage.objetos == {OBJETO: b"abcd"}
+    assert storage.partes == []
+    assert redis.dados == {}
+
+
+@pytest.mark.usefixtures("redis")
+def test_chunk_repetido_ou_fora_de_ordem(storage: StorageFalso) -> None:
+    """Chunks fora do offset esperado devolvem o offset já recebido."""
+    assert receber(0, b"ab", 6) == 2
+
+    # Repetido: já recebido; adiantado: faltam bytes anteriores
+    assert receber(0, b"ab", 6) == 2
+    assert receber(4, b"ef", 6) == 2
+
+    assert receber(2, b"cdef", 6) == 6
+    assert storage.objetos == {OBJETO: b"abcdef"}
+
+
+def test_multipart(
+    redis: RedisFalso,
+    storage: StorageFalso,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Chunks são acumulados até completar uma parte do multipart."""
+    monkeypatch.setattr(file_service, "UPLOAD_PART_SIZE", 4)
+
+    assert receber(0, b"abc", 10) == 3
+    assert receber(3, b"def", 10) == 6
+    assert receber(6, b"ghi", 10) == 9
+    assert receber(9, b"j", 10) == 10
+
+    assert storage.partes == [(1, b"abcdef"), (2, b"ghij")]
+    [(objeto, upload_id, partes)] = storage.concluidos
+    assert (objeto, upload_id) == (OBJETO, "upload-1")
+    assert [(p.part_number, p.etag) for p in partes] == [
+        (1, "etag-1"),
+        (2, "etag-2"),
+    ]
+    assert redis.dados == {}
+
+
+@pytest.mark.usefixtures("redis")
+def test_retoma_upload_interrompido(
+    storage: StorageFalso,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Um upload reiniciado do zero continua do offset salvo."""
+    monkeypatch.setattr(file_service, "UPLOAD_PART_SIZE", 4)
+    receber(0, b"abcd", 8)
+
+    assert receber(0, b"abcd", 8) == 4
+    assert receber(4, b"efgh", 8) == 8
+
+    assert storage.partes == [(1, b"abcd"), (2, b"efgh")]